@@ -0,0 +1,23 @@
+"""tenant permissions version
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = '0002'
+down_revision = '0001'
+branch_labels = None
+depends_on = None
+
+def upgrade() -> None:
+    op.add_column(
+        'tenants',
+        sa.Column('permissions_version', sa.Integer(), server_default='0', nullable=False)
+    )
+
+def downgrade() -> None:
+    op.drop_column('tenants', 'permissions_version')
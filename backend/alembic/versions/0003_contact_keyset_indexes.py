@@ -0,0 +1,38 @@
+"""contact keyset pagination indexes
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = '0003'
+down_revision = '0002'
+branch_labels = None
+depends_on = None
+
+SORT_COLUMNS = ('created_at', 'updated_at', 'first_name', 'last_name', 'email', 'company')
+
+def upgrade() -> None:
+    # Built concurrently so large contact tables stay writable
+    with op.get_context().autocommit_block():
+        for column in SORT_COLUMNS:
+            op.create_index(
+                f'ix_contacts_tenant_{column}_id',
+                'contacts',
+                ['tenant_id', column, 'id'],
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for column in SORT_COLUMNS:
+            op.drop_index(
+                f'ix_contacts_tenant_{column}_id',
+                table_name='contacts',
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
@@ -0,0 +1,57 @@
+"""contact full-text and trigram search
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-16 00:00:00.000000
+
+Adding the stored generated columns rewrites the contacts table; run it
+in a maintenance window on large installations.
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision = '0004'
+down_revision = '0003'
+branch_labels = None
+depends_on = None
+
+SEARCH_DOCUMENT = (
+    "coalesce(first_name, '') || ' ' || coalesce(last_name, '') || ' ' || "
+    "coalesce(email, '') || ' ' || coalesce(phone, '') || ' ' || coalesce(company, '')"
+)
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute("CREATE EXTENSION IF NOT EXISTS btree_gin")
+    op.add_column(
+        'contacts',
+        sa.Column('search_text', sa.Text(), sa.Computed(f"lower({SEARCH_DOCUMENT})", persisted=True), nullable=True)
+    )
+    op.add_column(
+        'contacts',
+        sa.Column('search_vector', postgresql.TSVECTOR(), sa.Computed(f"to_tsvector('simple', {SEARCH_DOCUMENT})", persisted=True), nullable=True)
+    )
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_contacts_search_text_trgm',
+            'contacts',
+            ['tenant_id', 'search_text'],
+            postgresql_using='gin',
+            postgresql_ops={'search_text': 'gin_trgm_ops'},
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_contacts_search_vector',
+            'contacts',
+            ['tenant_id', 'search_vector'],
+            postgresql_using='gin',
+            postgresql_concurrently=True,
+        )
+
+def downgrade() -> None:
+    op.drop_index('ix_contacts_search_vector', table_name='contacts')
+    op.drop_index('ix_contacts_search_text_trgm', table_name='contacts')
+    op.drop_column('contacts', 'search_vector')
+    op.drop_column('contacts', 'search_text')
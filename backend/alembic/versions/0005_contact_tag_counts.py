@@ -0,0 +1,107 @@
+"""contact tag index and tag counts
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-16 00:00:00.000000
+
+contact_tag_counts is maintained by statement-level triggers that read the
+transition tables, so a bulk write adjusts each affected tag once. The
+triggers are created before the backfill in the same transaction; their
+lock on contacts keeps concurrent writes out until the counts are seeded.
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision = '0005'
+down_revision = '0004'
+branch_labels = None
+depends_on = None
+
+# Distinct (tenant_id, tag) pairs per row of a transition table
+TAG_ROWS = """
+    SELECT r.tenant_id, t.tag
+    FROM {table} r,
+         LATERAL (SELECT DISTINCT jsonb_array_elements_text(r.tags) AS tag) t
+    WHERE jsonb_typeof(r.tags) = 'array'
+"""
+
+APPLY_DELTA = """
+    INSERT INTO contact_tag_counts (tenant_id, tag, count)
+    SELECT tenant_id, tag, sum(delta)
+    FROM ({rows}) d
+    GROUP BY tenant_id, tag
+    HAVING sum(delta) <> 0
+    ORDER BY tenant_id, tag
+    ON CONFLICT (tenant_id, tag)
+    DO UPDATE SET count = contact_tag_counts.count + EXCLUDED.count;
+"""
+
+ADDED = f"SELECT tenant_id, tag, 1 AS delta FROM ({TAG_ROWS.format(table='new_rows')}) n"
+REMOVED = f"SELECT tenant_id, tag, -1 AS delta FROM ({TAG_ROWS.format(table='old_rows')}) o"
+
+TRIGGER_FUNCTION = f"""
+CREATE FUNCTION contact_tag_counts_apply() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        {APPLY_DELTA.format(rows=ADDED)}
+    ELSIF TG_OP = 'DELETE' THEN
+        {APPLY_DELTA.format(rows=REMOVED)}
+    ELSE
+        {APPLY_DELTA.format(rows=ADDED + ' UNION ALL ' + REMOVED)}
+    END IF;
+    RETURN NULL;
+END;
+$$
+"""
+
+def upgrade() -> None:
+    op.create_table(
+        'contact_tag_counts',
+        sa.Column('tenant_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('tag', sa.Text(), nullable=False),
+        sa.Column('count', sa.Integer(), server_default='0', nullable=False),
+        sa.ForeignKeyConstraint(['tenant_id'], ['tenants.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('tenant_id', 'tag'),
+    )
+    op.execute(TRIGGER_FUNCTION)
+    # Transition tables rule out UPDATE OF tags, so updates that leave tags
+    # alone still fire the trigger; their delta nets to zero and writes nothing
+    op.execute(
+        "CREATE TRIGGER contacts_tag_counts_insert AFTER INSERT ON contacts "
+        "REFERENCING NEW TABLE AS new_rows "
+        "FOR EACH STATEMENT EXECUTE FUNCTION contact_tag_counts_apply()"
+    )
+    op.execute(
+        "CREATE TRIGGER contacts_tag_counts_update AFTER UPDATE ON contacts "
+        "REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows "
+        "FOR EACH STATEMENT EXECUTE FUNCTION contact_tag_counts_apply()"
+    )
+    op.execute(
+        "CREATE TRIGGER contacts_tag_counts_delete AFTER DELETE ON contacts "
+        "REFERENCING OLD TABLE AS old_rows "
+        "FOR EACH STATEMENT EXECUTE FUNCTION contact_tag_counts_apply()"
+    )
+    op.execute(
+        "INSERT INTO contact_tag_counts (tenant_id, tag, count) "
+        f"SELECT tenant_id, tag, count(*) FROM ({TAG_ROWS.format(table='contacts')}) c "
+        "GROUP BY tenant_id, tag"
+    )
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_contacts_tags',
+            'contacts',
+            ['tenant_id', 'tags'],
+            postgresql_using='gin',
+            postgresql_concurrently=True,
+        )
+
+def downgrade() -> None:
+    op.drop_index('ix_contacts_tags', table_name='contacts')
+    op.execute("DROP TRIGGER IF EXISTS contacts_tag_counts_delete ON contacts")
+    op.execute("DROP TRIGGER IF EXISTS contacts_tag_counts_update ON contacts")
+    op.execute("DROP TRIGGER IF EXISTS contacts_tag_counts_insert ON contacts")
+    op.execute("DROP FUNCTION IF EXISTS contact_tag_counts_apply()")
+    op.drop_table('contact_tag_counts')
@@ -0,0 +1,49 @@
+"""webhook outbox
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision = '0006'
+down_revision = '0005'
+branch_labels = None
+depends_on = None
+
+def upgrade() -> None:
+    op.create_table(
+        'webhook_outbox',
+        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('tenant_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('subscription_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('event_name', sa.String(length=100), nullable=False),
+        sa.Column('payload', postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column('status', sa.String(length=20), server_default='pending', nullable=False),
+        sa.Column('attempts', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('next_attempt_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('last_error', sa.Text(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('delivered_at', sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(['tenant_id'], ['tenants.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['subscription_id'], ['webhook_subscriptions.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index(op.f('ix_webhook_outbox_tenant_id'), 'webhook_outbox', ['tenant_id'], unique=False)
+    op.create_index(op.f('ix_webhook_outbox_subscription_id'), 'webhook_outbox', ['subscription_id'], unique=False)
+    op.create_index(
+        'ix_webhook_outbox_due',
+        'webhook_outbox',
+        ['next_attempt_at'],
+        unique=False,
+        postgresql_where=sa.text("status = 'pending'"),
+    )
+
+def downgrade() -> None:
+    op.drop_index('ix_webhook_outbox_due', table_name='webhook_outbox')
+    op.drop_index(op.f('ix_webhook_outbox_subscription_id'), table_name='webhook_outbox')
+    op.drop_index(op.f('ix_webhook_outbox_tenant_id'), table_name='webhook_outbox')
+    op.drop_table('webhook_outbox')
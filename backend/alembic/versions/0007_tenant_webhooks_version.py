@@ -0,0 +1,23 @@
+"""tenant webhooks version
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = '0007'
+down_revision = '0006'
+branch_labels = None
+depends_on = None
+
+def upgrade() -> None:
+    op.add_column(
+        'tenants',
+        sa.Column('webhooks_version', sa.Integer(), server_default='0', nullable=False)
+    )
+
+def downgrade() -> None:
+    op.drop_column('tenants', 'webhooks_version')
@@ -0,0 +1,33 @@
+"""webhook subscription batching
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = '0008'
+down_revision = '0007'
+branch_labels = None
+depends_on = None
+
+def upgrade() -> None:
+    op.add_column(
+        'webhook_subscriptions',
+        sa.Column('batch_enabled', sa.Boolean(), server_default='false', nullable=False)
+    )
+    op.add_column(
+        'webhook_subscriptions',
+        sa.Column('batch_max_size', sa.Integer(), server_default='100', nullable=False)
+    )
+    op.add_column(
+        'webhook_subscriptions',
+        sa.Column('batch_max_wait_seconds', sa.Integer(), server_default='10', nullable=False)
+    )
+
+def downgrade() -> None:
+    op.drop_column('webhook_subscriptions', 'batch_max_wait_seconds')
+    op.drop_column('webhook_subscriptions', 'batch_max_size')
+    op.drop_column('webhook_subscriptions', 'batch_enabled')
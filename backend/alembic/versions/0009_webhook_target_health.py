@@ -0,0 +1,31 @@
+"""webhook target health
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = '0009'
+down_revision = '0008'
+branch_labels = None
+depends_on = None
+
+def upgrade() -> None:
+    op.create_table(
+        'webhook_target_health',
+        sa.Column('target_url', sa.String(length=500), nullable=False),
+        sa.Column('state', sa.String(length=20), server_default='closed', nullable=False),
+        sa.Column('consecutive_failures', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('retry_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('opened_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('last_error', sa.Text(), nullable=True),
+        sa.Column('last_failure_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('last_success_at', sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint('target_url'),
+    )
+
+def downgrade() -> None:
+    op.drop_table('webhook_target_health')
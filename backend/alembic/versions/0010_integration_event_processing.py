@@ -0,0 +1,40 @@
+"""integration event processing
+
+Revision ID: 0010
+Revises: 0009
+Create Date: 2026-10-16 00:00:00.000000
+
+now() is stable, so both columns are added without rewriting the table;
+rows already waiting are due straight away.
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = '0010'
+down_revision = '0009'
+branch_labels = None
+depends_on = None
+
+def upgrade() -> None:
+    op.add_column(
+        'integration_events',
+        sa.Column('attempts', sa.Integer(), server_default='0', nullable=False)
+    )
+    op.add_column(
+        'integration_events',
+        sa.Column('next_attempt_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False)
+    )
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_integration_events_due',
+            'integration_events',
+            ['tenant_id', 'next_attempt_at'],
+            postgresql_where=sa.text("status = 'received'"),
+            postgresql_concurrently=True,
+        )
+
+def downgrade() -> None:
+    op.drop_index('ix_integration_events_due', table_name='integration_events')
+    op.drop_column('integration_events', 'next_attempt_at')
+    op.drop_column('integration_events', 'attempts')
@@ -0,0 +1,34 @@
+"""audit log compact storage
+
+Revision ID: 0011
+Revises: 0010
+Create Date: 2026-10-16 00:00:00.000000
+
+Existing rows are not backfilled: with no snapshot in an entity's recent
+history, the first compact update of it writes one.
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = '0011'
+down_revision = '0010'
+branch_labels = None
+depends_on = None
+
+def upgrade() -> None:
+    op.add_column(
+        'audit_logs',
+        sa.Column('snapshot', sa.Boolean(), server_default='false', nullable=False)
+    )
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_audit_logs_entity_timestamp',
+            'audit_logs',
+            ['tenant_id', 'entity_type', 'entity_id', 'timestamp'],
+            postgresql_concurrently=True,
+        )
+
+def downgrade() -> None:
+    op.drop_index('ix_audit_logs_entity_timestamp', table_name='audit_logs')
+    op.drop_column('audit_logs', 'snapshot')
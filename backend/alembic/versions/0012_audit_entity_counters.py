@@ -0,0 +1,32 @@
+"""audit entity counters
+
+Revision ID: 0012
+Revises: 0011
+Create Date: 2026-10-16 00:00:00.000000
+
+Entities start with no counter, so the first compact update of each one
+after the upgrade writes a snapshot.
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision = '0012'
+down_revision = '0011'
+branch_labels = None
+depends_on = None
+
+def upgrade() -> None:
+    op.create_table(
+        'audit_entity_counters',
+        sa.Column('tenant_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('entity_type', sa.String(length=50), nullable=False),
+        sa.Column('entity_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('updates_since_snapshot', sa.Integer(), server_default='0', nullable=False),
+        sa.ForeignKeyConstraint(['tenant_id'], ['tenants.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('tenant_id', 'entity_type', 'entity_id'),
+    )
+
+def downgrade() -> None:
+    op.drop_table('audit_entity_counters')
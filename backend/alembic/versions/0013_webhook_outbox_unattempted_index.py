@@ -0,0 +1,27 @@
+"""webhook outbox unattempted index
+
+Revision ID: 0013
+Revises: 0012
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = '0013'
+down_revision = '0012'
+branch_labels = None
+depends_on = None
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_webhook_outbox_unattempted',
+            'webhook_outbox',
+            ['subscription_id'],
+            postgresql_where=sa.text("status = 'pending' AND attempts = 0"),
+            postgresql_concurrently=True,
+        )
+
+def downgrade() -> None:
+    op.drop_index('ix_webhook_outbox_unattempted', table_name='webhook_outbox')
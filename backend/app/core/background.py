@@ -0,0 +1,60 @@
+import asyncio
+import logging
+from typing import Awaitable, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class PeriodicTask:
+    """
+    Runs an async callable every ``interval`` seconds, or sooner when woken.
+
+    Used by the write-behind buffers: ``wake()`` lets a producer request an
+    early flush once a size threshold is reached, and ``stop()`` runs the
+    callable one last time so nothing buffered is lost on shutdown.
+    """
+
+    def __init__(self, name: str, interval: float, func: Callable[[], Awaitable[None]]):
+        self.name = name
+        self.interval = interval
+        self.func = func
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._stopping = False
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        if self.running:
+            return
+        self._stopping = False
+        self._task = asyncio.create_task(self._run(), name=self.name)
+
+    def wake(self) -> None:
+        self._wakeup.set()
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._stopping = True
+        self._wakeup.set()
+        await self._task
+        self._task = None
+
+    async def _run(self) -> None:
+        while not self._stopping:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            await self._call()
+        await self._call()
+
+    async def _call(self) -> None:
+        try:
+            await self.func()
+        except Exception:
+            logger.exception(f"{self.name} failed")
@@ -0,0 +1,71 @@
+"""
+Multi-row INSERTs for the write-behind buffers.
+
+A buffer flushes rows gathered from many requests, so one row the database
+rejects (a tenant deleted in the meantime, a value Postgres cannot store)
+must not hold up the rest. ``insert_rows`` isolates such rows instead of
+failing the whole batch.
+"""
+from sqlalchemy import insert
+from sqlalchemy.exc import DBAPIError
+from typing import Any, Dict, List, Tuple
+import json
+
+from app.core.database import AsyncSessionLocal
+
+# asyncpg binds at most 32767 parameters per statement
+MAX_BIND_PARAMETERS = 32767
+
+# SQLSTATE classes of errors caused by the rows themselves rather than by
+# the database: data exceptions and integrity constraint violations. The
+# asyncpg dialect does not map all of them to DataError or IntegrityError.
+ROW_ERROR_CLASSES = ("22", "23")
+
+Row = Dict[str, Any]
+
+
+async def insert_rows(model, rows: List[Row]) -> List[Tuple[Row, Exception]]:
+    """
+    Insert ``rows``, which must all have the same keys, in one transaction.
+
+    Statements stay within the bind parameter limit. A statement rejected
+    because of its rows is rolled back to a savepoint and retried in halves
+    until the rows that fail on their own are isolated; those are returned
+    with their errors and everything else is committed. Any other error,
+    such as a lost connection, propagates with nothing written.
+    """
+    if not rows:
+        return []
+    per_statement = max(1, MAX_BIND_PARAMETERS // len(rows[0]))
+    rejected: List[Tuple[Row, Exception]] = []
+    async with AsyncSessionLocal() as session:
+        for start in range(0, len(rows), per_statement):
+            await _insert(session, model, rows[start:start + per_statement], rejected)
+        await session.commit()
+    return rejected
+
+
+async def _insert(session, model, rows: List[Row], rejected: List[Tuple[Row, Exception]]) -> None:
+    try:
+        async with session.begin_nested():
+            await session.execute(insert(model).values(rows))
+    except DBAPIError as e:
+        if not _is_row_error(e):
+            raise
+        if len(rows) == 1:
+            rejected.append((rows[0], e))
+            return
+        middle = len(rows) // 2
+        await _insert(session, model, rows[:middle], rejected)
+        await _insert(session, model, rows[middle:], rejected)
+
+
+def _is_row_error(error: DBAPIError) -> bool:
+    sqlstate = getattr(error.orig, "pgcode", None) or ""
+    return sqlstate[:2] in ROW_ERROR_CLASSES
+
+
+def describe_rejected(row: Row, error: Exception, limit: int = 2000) -> str:
+    """One log line with the rejected row and the database's reason."""
+    reason = getattr(error, "orig", None) or error
+    return f"{json.dumps(row, default=str)[:limit]}: {reason}"
@@ -6,8 +6,117 @@ class Settings(BaseSettings):
     SECRET_KEY: str
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 10080
+    SESSION_TOKEN_EXPIRE_MINUTES: int = 15
+    SESSION_REVALIDATE_SECONDS: int = 60
+    SESSION_CACHE_MAX_SIZE: int = 50000
     CORS_ORIGINS: str = "*"
     FIREBASE_PROJECT_ID: str = "pythonapi-460914"
+    FIREBASE_CERTS_URL: str = "https://www.googleapis.com/robot/v1/metadata/x509/securetoken@system.gserviceaccount.com"
+    FIREBASE_CLOCK_SKEW_SECONDS: int = 0
+    TOKEN_CACHE_ENABLED: bool = True
+    TOKEN_CACHE_MAX_SIZE: int = 10000
+
+    # Write-behind last-login tracking
+    LOGIN_TRACKING_MIN_INTERVAL_SECONDS: int = 300
+    LOGIN_TRACKING_FLUSH_INTERVAL_SECONDS: float = 10.0
+
+    # Authenticated-user snapshot cache
+    USER_CACHE_TTL_SECONDS: int = 30
+    USER_CACHE_MAX_SIZE: int = 10000
+
+    # How often a cached tenant permission graph re-checks its version
+    PERMISSIONS_VERSION_CHECK_SECONDS: float = 5.0
+
+    # Key monitoring must send as X-Metrics-Key to read GET /api/health/metrics;
+    # the endpoint is disabled while it is empty
+    METRICS_API_KEY: str = ""
+
+    # Database connection pool (per worker process)
+    DB_POOL_ENABLED: bool = True
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_PRE_PING: bool = True
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_TIMEOUT: float = 30.0
+
+    # Bulk contact import
+    CONTACT_IMPORT_CHUNK_SIZE: int = 2000
+    CONTACT_IMPORT_MAX_REPORTED_ERRORS: int = 100
+
+    # Audit log writes. "inline" writes each record in the transaction of the
+    # change it describes; "batched" queues it once that transaction commits
+    # and writes the queue in multi-row batches, at the cost of losing
+    # whatever is queued if the process dies.
+    AUDIT_WRITE_MODE: str = "inline"
+    AUDIT_MAX_PENDING: int = 100000
+    AUDIT_FLUSH_SIZE: int = 500
+    AUDIT_FLUSH_INTERVAL_SECONDS: float = 1.0
+    # Audit update storage. "full" keeps the whole before and after state of
+    # every update; "compact" keeps only the changed fields, plus the full
+    # state on every AUDIT_SNAPSHOT_INTERVAL-th update of an entity, and
+    # rebuilds the states on read.
+    AUDIT_STORAGE_MODE: str = "full"
+    AUDIT_SNAPSHOT_INTERVAL: int = 20
+
+    # Rows changed per statement and transaction by contact bulk operations
+    CONTACT_BULK_CHUNK_SIZE: int = 1000
+
+    # Rows fetched per server-side cursor round trip by contact exports
+    CONTACT_EXPORT_BATCH_SIZE: int = 1000
+
+    # Inbound webhook API key cache; rotations reach other workers within the TTL
+    WEBHOOK_KEY_CACHE_TTL_SECONDS: int = 30
+    WEBHOOK_KEY_CACHE_MAX_SIZE: int = 10000
+
+    # Inbound webhook ingestion: request limits and the write-behind buffer
+    INBOUND_WEBHOOK_MAX_BODY_BYTES: int = 1048576
+    INBOUND_WEBHOOK_MAX_EVENTS_PER_REQUEST: int = 1000
+    INBOUND_EVENT_BUFFER_MAX_EVENTS: int = 50000
+    INBOUND_EVENT_FLUSH_SIZE: int = 1000
+    INBOUND_EVENT_FLUSH_INTERVAL_SECONDS: float = 0.5
+
+    # Inbound integration event processing. Disable it in the API process when
+    # it runs separately (python -m app.workers.integration_events).
+    INTEGRATION_WORKER_ENABLED: bool = True
+    INTEGRATION_HANDLER_MODULES: str = ""
+    INTEGRATION_POLL_SECONDS: float = 1.0
+    INTEGRATION_BATCH_SIZE: int = 100
+    INTEGRATION_PER_TENANT_BATCH: int = 20
+    INTEGRATION_CONCURRENCY: int = 10
+    INTEGRATION_LEASE_SECONDS: int = 300
+    INTEGRATION_HANDLER_TIMEOUT_SECONDS: float = 60.0
+    INTEGRATION_MAX_ATTEMPTS: int = 5
+    INTEGRATION_BACKOFF_BASE_SECONDS: float = 10.0
+    INTEGRATION_BACKOFF_MAX_SECONDS: float = 3600.0
+
+    # Shared outbound HTTP client, owned by the app lifespan
+    HTTP_CLIENT_HTTP2: bool = False
+    HTTP_CLIENT_TIMEOUT_SECONDS: float = 10.0
+    HTTP_CLIENT_CONNECT_TIMEOUT_SECONDS: float = 5.0
+    HTTP_CLIENT_MAX_CONNECTIONS: int = 100
+    HTTP_CLIENT_MAX_KEEPALIVE_CONNECTIONS: int = 20
+    HTTP_CLIENT_KEEPALIVE_EXPIRY_SECONDS: float = 30.0
+
+    # Outbound webhook dispatcher. Disable it in the API process when it
+    # runs separately (python -m app.workers.webhook_dispatcher).
+    WEBHOOK_DISPATCHER_ENABLED: bool = True
+    WEBHOOK_DISPATCH_POLL_SECONDS: float = 1.0
+    WEBHOOK_DISPATCH_BATCH_SIZE: int = 100
+    WEBHOOK_DISPATCH_CONCURRENCY: int = 20
+    WEBHOOK_PER_HOST_CONCURRENCY: int = 4
+    WEBHOOK_DISPATCH_LEASE_SECONDS: int = 60
+    WEBHOOK_MAX_ATTEMPTS: int = 8
+    WEBHOOK_BACKOFF_BASE_SECONDS: float = 5.0
+    WEBHOOK_BACKOFF_MAX_SECONDS: float = 3600.0
+    WEBHOOK_OUTBOX_RETENTION_HOURS: int = 72
+
+    # Per-target circuit breaker: consecutive failed deliveries before a
+    # target is tripped, and how long it stays open before a probe
+    WEBHOOK_BREAKER_FAILURE_THRESHOLD: int = 5
+    WEBHOOK_BREAKER_OPEN_SECONDS: int = 60
+
+    # How often a cached tenant subscription index re-checks its version
+    WEBHOOK_INDEX_VERSION_CHECK_SECONDS: float = 5.0
     
     class Config:
         env_file = Path(__file__).parent.parent.parent / ".env"
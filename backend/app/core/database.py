@@ -1,14 +1,101 @@
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
-from sqlalchemy.pool import NullPool
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool
+from sqlalchemy import event, exc
+from contextvars import ContextVar
+from typing import Optional
+import time
 from app.core.config import settings
+from app.core.metrics import register_metrics
+
+
+class PoolStats:
+    """Checkout wait and timeout counters shared by every pool the engine creates."""
+
+    def __init__(self):
+        self.checkouts = 0
+        self.timeouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def record_wait(self, elapsed: float) -> None:
+        self.checkouts += 1
+        self.total_wait += elapsed
+        if elapsed > self.max_wait:
+            self.max_wait = elapsed
+
+
+pool_stats = PoolStats()
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """Async queue pool that records how long callers wait for a connection."""
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            conn = super()._do_get()
+        except exc.TimeoutError:
+            pool_stats.timeouts += 1
+            raise
+        pool_stats.record_wait(time.perf_counter() - start)
+        return conn
+
+
+def _engine_options() -> dict:
+    if not settings.DB_POOL_ENABLED:
+        # Leave pooling to an external pooler such as PgBouncer
+        return {"poolclass": NullPool}
+    return {
+        "poolclass": InstrumentedQueuePool,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+    }
+
 
 engine = create_async_engine(
     settings.DATABASE_URL,
     echo=False,
-    poolclass=NullPool,
-    future=True
+    future=True,
+    **_engine_options()
 )
 
+class QueryCounter:
+    """Statements and commits issued while handling one request."""
+
+    __slots__ = ("statements", "commits")
+
+    def __init__(self):
+        self.statements = 0
+        self.commits = 0
+
+
+_query_counter: ContextVar[Optional[QueryCounter]] = ContextVar("db_query_counter", default=None)
+
+
+def track_queries() -> QueryCounter:
+    """Start counting database round trips for the current request context."""
+    counter = QueryCounter()
+    _query_counter.set(counter)
+    return counter
+
+
+@event.listens_for(engine.sync_engine, "before_cursor_execute")
+def _count_statement(conn, cursor, statement, parameters, context, executemany):
+    counter = _query_counter.get()
+    if counter is not None:
+        counter.statements += 1
+
+
+@event.listens_for(engine.sync_engine, "commit")
+def _count_commit(conn):
+    counter = _query_counter.get()
+    if counter is not None:
+        counter.commits += 1
+
+
 AsyncSessionLocal = async_sessionmaker(
     engine,
     class_=AsyncSession,
@@ -17,9 +104,36 @@ AsyncSessionLocal = async_sessionmaker(
     autoflush=False,
 )
 
+
+def get_pool_stats() -> dict:
+    """Current pool occupancy plus cumulative checkout wait statistics."""
+    pool = engine.pool
+    if not isinstance(pool, AsyncAdaptedQueuePool):
+        return {"mode": "null"}
+
+    capacity = pool.size() + max(pool._max_overflow, 0)
+    checked_out = pool.checkedout()
+    return {
+        "mode": "queue",
+        "size": pool.size(),
+        "max_overflow": pool._max_overflow,
+        "checked_out": checked_out,
+        "checked_in": pool.checkedin(),
+        "overflow": max(pool.overflow(), 0),
+        "saturation": round(checked_out / capacity, 3) if capacity else 0.0,
+        "checkouts": pool_stats.checkouts,
+        "timeouts": pool_stats.timeouts,
+        "avg_wait_ms": round(pool_stats.total_wait / pool_stats.checkouts * 1000, 3) if pool_stats.checkouts else 0.0,
+        "max_wait_ms": round(pool_stats.max_wait * 1000, 3),
+    }
+
+
+register_metrics("db_pool", get_pool_stats)
+
+
 async def get_db():
     async with AsyncSessionLocal() as session:
         try:
             yield session
         finally:
-            await session.close()
\ No newline at end of file
+            await session.close()
@@ -4,12 +4,15 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from typing import Optional
 from datetime import datetime, timezone
+from dataclasses import replace
 
 from app.core.database import get_db
-from app.core.firebase_auth import verify_firebase_token
+from app.core.firebase_auth import verify_firebase_token_async
+from app.core.user_cache import AuthenticatedUser, user_snapshot_cache
+from app.core.permissions import PermissionSet, permission_resolver
+from app.core.sessions import authenticate_session, is_session_token
 from app.models.user import User, UserSession
-from app.models.role import Role
-from app.models.permission import Permission
+from app.services.login_tracker import login_tracker
 
 security = HTTPBearer(auto_error=False)
 
@@ -24,9 +27,12 @@ async def get_firebase_token(request: Request, credentials: Optional[HTTPAuthori
 async def get_current_user_firebase(
     db: AsyncSession = Depends(get_db), 
     token: Optional[str] = Depends(get_firebase_token)
-) -> User:
+) -> AuthenticatedUser:
     """
     Validate Firebase token and get/create user in database.
+    
+    Returns a cached snapshot of the user; the database is only queried
+    when the snapshot is missing or has expired.
     """
     if not token:
         raise HTTPException(
@@ -36,7 +42,7 @@ async def get_current_user_firebase(
     
     try:
         # Verify Firebase token
-        decoded = verify_firebase_token(token)
+        decoded = await verify_firebase_token_async(token)
         firebase_uid = decoded['uid']
         email = decoded.get('email')
         name = decoded.get('name') or decoded.get('email', '').split('@')[0]
@@ -49,92 +55,95 @@ async def get_current_user_firebase(
             detail=str(e)
         )
     
-    # Find user by Firebase UID
-    stmt = select(User).where(User.firebase_uid == firebase_uid)
-    result = await db.execute(stmt)
-    user = result.scalar_one_or_none()
+    snapshot = user_snapshot_cache.get(firebase_uid)
+    cached = snapshot is not None
     
-    if not user:
-        # Create new user on first login (upsert pattern)
-        user = User(
-            firebase_uid=firebase_uid,
-            email=email,
-            name=name,
-            picture=picture,
-            email_verified=email_verified,
-            role='agent',  # Default role
-            is_active=True
-        )
-        db.add(user)
-        await db.commit()
-        await db.refresh(user)
-    else:
-        # Update user info on login
-        if name and user.name != name:
-            user.name = name
-        if picture and user.picture != picture:
-            user.picture = picture
-        if user.email_verified != email_verified:
-            user.email_verified = email_verified
-        user.last_login = datetime.now(timezone.utc)
-        await db.commit()
+    if not cached:
+        # Find user by Firebase UID
+        stmt = select(User).where(User.firebase_uid == firebase_uid)
+        result = await db.execute(stmt)
+        user = result.scalar_one_or_none()
+        
+        if not user:
+            # Create new user on first login (upsert pattern)
+            user = User(
+                firebase_uid=firebase_uid,
+                email=email,
+                name=name,
+                picture=picture,
+                email_verified=email_verified,
+                role='agent',  # Default role
+                is_active=True
+            )
+            db.add(user)
+            await db.commit()
+            await db.refresh(user)
+        
+        snapshot = AuthenticatedUser.from_model(user)
+    
+    # Queue login info for the write-behind tracker instead of committing here
+    changes = {}
+    if name and snapshot.name != name:
+        changes['name'] = name
+    if picture and snapshot.picture != picture:
+        changes['picture'] = picture
+    if snapshot.email_verified != email_verified:
+        changes['email_verified'] = email_verified
+    if changes:
+        snapshot = replace(snapshot, **changes)
+    login_tracker.touch(snapshot.id, datetime.now(timezone.utc), changes)
+    if changes or not cached:
+        user_snapshot_cache.set(firebase_uid, snapshot)
     
-    if not user.is_active:
+    if not snapshot.is_active:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="User account is deactivated"
         )
     
-    return user
+    return snapshot
 
 
 async def get_current_user(
     db: AsyncSession = Depends(get_db),
     token: Optional[str] = Depends(get_firebase_token)
-) -> User:
+) -> AuthenticatedUser:
     """
-    Get current authenticated user. Uses Firebase authentication.
+    Get current authenticated user.
+    
+    Accepts either a server-issued session token (checked with a local HMAC)
+    or a Firebase ID token.
     """
+    if token and is_session_token(token):
+        user = await authenticate_session(db, token)
+        if user is None:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Session expired or revoked"
+            )
+        if not user.is_active:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="User account is deactivated"
+            )
+        return user
     return await get_current_user_firebase(db, token)
 
 
-async def get_user_permissions(user: User, db: AsyncSession) -> set:
-    """Get all permissions for a user based on their roles."""
-    permissions = set()
-    
-    # Add default permissions based on role
-    role_permissions = {
-        'admin': {'*.*'},  # Full access
-        'manager': {
-            'contacts.read', 'contacts.create', 'contacts.update', 'contacts.delete',
-            'audit.read',
-            'webhooks.read', 'webhooks.create',
-        },
-        'agent': {
-            'contacts.read', 'contacts.create', 'contacts.update',
-            'audit.read',
-        },
-        'viewer': {
-            'contacts.read',
-            'audit.read',
-        }
-    }
-    
-    user_role = user.role or 'viewer'
-    permissions.update(role_permissions.get(user_role, set()))
-    
-    return permissions
+async def get_user_permissions(user: AuthenticatedUser, db: AsyncSession) -> PermissionSet:
+    """Get all permissions for a user based on their roles and groups."""
+    return await permission_resolver.resolve(db, user.tenant_id, user.id, user.role)
 
 
 def require_permission(permission: str):
     """Dependency to check if user has required permission."""
     async def permission_checker(
-        user: User = Depends(get_current_user),
+        user: AuthenticatedUser = Depends(get_current_user),
         db: AsyncSession = Depends(get_db)
     ):
         user_perms = await get_user_permissions(user, db)
         
-        if permission not in user_perms and '*.*' not in user_perms:
+        if not user_perms.allows(permission):
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail=f"Permission denied: {permission} required"
@@ -146,7 +155,7 @@ def require_permission(permission: str):
 def require_role(allowed_roles: list):
     """Dependency to check if user has one of the allowed roles."""
     async def role_checker(
-        user: User = Depends(get_current_user)
+        user: AuthenticatedUser = Depends(get_current_user)
     ):
         if user.role not in allowed_roles:
             raise HTTPException(
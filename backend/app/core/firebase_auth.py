@@ -4,6 +4,10 @@ import os
 import json
 import logging
 
+from app.core.config import settings
+from app.core.metrics import register_metrics
+from app.core.token_verifier import FirebaseTokenVerifier, GoogleCertKeySource, TokenClaimsCache
+
 logger = logging.getLogger(__name__)
 
 # Initialize Firebase Admin SDK
@@ -76,6 +80,48 @@ def verify_firebase_token(id_token: str) -> dict:
         raise ValueError(f"Token verification failed: {str(e)}")
 
 
+_token_verifier = None
+
+token_claims_cache = TokenClaimsCache(maxsize=settings.TOKEN_CACHE_MAX_SIZE)
+register_metrics("token_cache", token_claims_cache.stats)
+
+def get_token_verifier() -> FirebaseTokenVerifier:
+    """
+    Get the shared async token verifier, keyed to the configured Firebase project.
+    """
+    global _token_verifier
+    
+    if _token_verifier is None:
+        _token_verifier = FirebaseTokenVerifier(
+            project_id=settings.FIREBASE_PROJECT_ID,
+            key_source=GoogleCertKeySource(settings.FIREBASE_CERTS_URL),
+            clock_skew_seconds=settings.FIREBASE_CLOCK_SKEW_SECONDS,
+        )
+    return _token_verifier
+
+
+async def verify_firebase_token_async(id_token: str) -> dict:
+    """
+    Verify a Firebase ID token without blocking the event loop.
+    
+    Uses the in-memory signing key cache instead of the Admin SDK, and skips
+    signature verification entirely for tokens already seen and still valid.
+    
+    Raises:
+        ValueError: If token is invalid or expired
+    """
+    if settings.TOKEN_CACHE_ENABLED:
+        claims = token_claims_cache.get(id_token)
+        if claims is not None:
+            return claims
+    
+    claims = await get_token_verifier().verify(id_token)
+    
+    if settings.TOKEN_CACHE_ENABLED:
+        token_claims_cache.put(id_token, claims)
+    return claims
+
+
 def get_user_by_uid(uid: str):
     """
     Get Firebase user by UID.
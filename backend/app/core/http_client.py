@@ -0,0 +1,58 @@
+from typing import Optional
+import logging
+
+import httpx
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+_client: Optional[httpx.AsyncClient] = None
+
+
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+async def start_http_client() -> httpx.AsyncClient:
+    """
+    Create the process-wide outbound HTTP client. Connections are kept alive
+    and reused across requests, so repeat deliveries to a host skip the TCP
+    and TLS handshakes.
+    """
+    global _client
+    if _client is None:
+        http2 = settings.HTTP_CLIENT_HTTP2
+        if http2 and not _http2_available():
+            logger.warning("HTTP_CLIENT_HTTP2 is set but the h2 package is not installed; using HTTP/1.1")
+            http2 = False
+        _client = httpx.AsyncClient(
+            http2=http2,
+            timeout=httpx.Timeout(
+                settings.HTTP_CLIENT_TIMEOUT_SECONDS,
+                connect=settings.HTTP_CLIENT_CONNECT_TIMEOUT_SECONDS
+            ),
+            limits=httpx.Limits(
+                max_connections=settings.HTTP_CLIENT_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.HTTP_CLIENT_MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=settings.HTTP_CLIENT_KEEPALIVE_EXPIRY_SECONDS
+            ),
+        )
+    return _client
+
+
+def get_http_client() -> httpx.AsyncClient:
+    if _client is None:
+        raise RuntimeError("HTTP client is not started")
+    return _client
+
+
+async def close_http_client() -> None:
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
@@ -0,0 +1,13 @@
+from typing import Any, Callable, Dict
+
+_providers: Dict[str, Callable[[], Dict[str, Any]]] = {}
+
+
+def register_metrics(name: str, provider: Callable[[], Dict[str, Any]]) -> None:
+    """Register a callable returning a stats dict under the given name."""
+    _providers[name] = provider
+
+
+def collect_metrics() -> Dict[str, Any]:
+    """Snapshot every registered stats provider."""
+    return {name: provider() for name, provider in _providers.items()}
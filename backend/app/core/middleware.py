@@ -2,9 +2,15 @@ from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.requests import Request
 import uuid
 
+from app.core.database import track_queries
+
 class RequestContextMiddleware(BaseHTTPMiddleware):
     async def dispatch(self, request: Request, call_next):
         request.state.request_id = str(uuid.uuid4())
+        queries = track_queries()
         response = await call_next(request)
         response.headers["X-Request-ID"] = request.state.request_id
+        # Round trips made before the response started; streamed bodies are not included
+        response.headers["X-DB-Queries"] = str(queries.statements)
+        response.headers["X-DB-Commits"] = str(queries.commits)
         return response
\ No newline at end of file
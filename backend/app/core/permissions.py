@@ -0,0 +1,206 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, update
+from typing import Dict, FrozenSet, Iterable, Optional, Set
+from uuid import UUID
+import time
+
+from app.core.config import settings
+from app.models.permission import Permission
+from app.models.role import Role, Group, role_permissions, group_permissions
+from app.models.tenant import Tenant
+from app.models.user import user_roles, user_groups
+
+# Built-in permissions for the role stored on users.role. A tenant can
+# override one by defining a Role with the same name.
+BUILTIN_ROLE_PERMISSIONS = {
+    'admin': {'*.*'},  # Full access
+    'manager': {
+        'contacts.read', 'contacts.create', 'contacts.update', 'contacts.delete',
+        'audit.read',
+        'webhooks.read', 'webhooks.create',
+    },
+    'agent': {
+        'contacts.read', 'contacts.create', 'contacts.update',
+        'audit.read',
+    },
+    'viewer': {
+        'contacts.read',
+        'audit.read',
+    }
+}
+
+
+class PermissionSet:
+    """
+    Compiled, immutable set of granted permission names.
+
+    Grants of the form ``resource.*``, ``*.action`` and ``*.*`` are split out
+    at compile time so a check is at most three set lookups.
+    """
+
+    __slots__ = ('names', '_exact', '_resources', '_actions', '_all')
+
+    def __init__(self, names: Iterable[str]):
+        self.names: FrozenSet[str] = frozenset(names)
+        exact, resources, actions = set(), set(), set()
+        for name in self.names:
+            resource, _, action = name.partition('.')
+            if resource == '*' and action == '*':
+                continue
+            if action == '*':
+                resources.add(resource)
+            elif resource == '*':
+                actions.add(action)
+            else:
+                exact.add(name)
+        self._exact = frozenset(exact)
+        self._resources = frozenset(resources)
+        self._actions = frozenset(actions)
+        self._all = '*.*' in self.names
+
+    def allows(self, permission: str) -> bool:
+        if self._all or permission in self._exact:
+            return True
+        resource, _, action = permission.partition('.')
+        return resource in self._resources or action in self._actions
+
+    def __contains__(self, permission: str) -> bool:
+        return self.allows(permission)
+
+    def __iter__(self):
+        return iter(self.names)
+
+
+_BUILTIN_SETS = {
+    role: PermissionSet(names) for role, names in BUILTIN_ROLE_PERMISSIONS.items()
+}
+_EMPTY = PermissionSet(())
+
+
+class TenantPermissions:
+    """A tenant's role and group graph, compiled at one permissions_version."""
+
+    def __init__(
+        self,
+        version: int,
+        role_sets: Dict[str, PermissionSet],
+        user_grants: Dict[UUID, FrozenSet[str]]
+    ):
+        self.version = version
+        self.role_sets = role_sets
+        self.user_grants = user_grants
+        self.checked_at = time.monotonic()
+        self._user_sets: Dict[tuple, PermissionSet] = {}
+
+    def for_user(self, user_id: UUID, role: Optional[str]) -> PermissionSet:
+        role = role or 'viewer'
+        base = self.role_sets.get(role) or _BUILTIN_SETS.get(role, _EMPTY)
+        grants = self.user_grants.get(user_id)
+        if not grants:
+            return base
+
+        key = (user_id, role)
+        compiled = self._user_sets.get(key)
+        if compiled is None:
+            compiled = PermissionSet(base.names | grants)
+            self._user_sets[key] = compiled
+        return compiled
+
+
+class PermissionResolver:
+    """
+    Resolves a user's effective permissions from built-in roles, the tenant's
+    custom roles and their role/group memberships.
+
+    The whole tenant graph is loaded once and reused while the tenant's
+    permissions_version is unchanged; the version itself is re-read at most
+    every ``version_check_interval`` seconds.
+    """
+
+    def __init__(self, version_check_interval: float):
+        self.version_check_interval = version_check_interval
+        self._tenants: Dict[UUID, TenantPermissions] = {}
+
+    async def resolve(
+        self,
+        db: AsyncSession,
+        tenant_id: Optional[UUID],
+        user_id: UUID,
+        role: Optional[str]
+    ) -> PermissionSet:
+        if tenant_id is None:
+            return _BUILTIN_SETS.get(role or 'viewer', _EMPTY)
+
+        compiled = self._tenants.get(tenant_id)
+        if compiled is None or time.monotonic() - compiled.checked_at >= self.version_check_interval:
+            result = await db.execute(
+                select(Tenant.permissions_version).where(Tenant.id == tenant_id)
+            )
+            version = result.scalar() or 0
+            if compiled is not None and compiled.version == version:
+                compiled.checked_at = time.monotonic()
+            else:
+                compiled = await self._load(db, tenant_id, version)
+                self._tenants[tenant_id] = compiled
+
+        return compiled.for_user(user_id, role)
+
+    async def _load(self, db: AsyncSession, tenant_id: UUID, version: int) -> TenantPermissions:
+        role_names: Dict[str, Set[str]] = {}
+        result = await db.execute(
+            select(Role.name, Permission.name)
+            .select_from(Role)
+            .outerjoin(role_permissions, role_permissions.c.role_id == Role.id)
+            .outerjoin(Permission, Permission.id == role_permissions.c.permission_id)
+            .where(Role.tenant_id == tenant_id)
+        )
+        for role_name, permission_name in result.all():
+            names = role_names.setdefault(role_name, set())
+            if permission_name:
+                names.add(permission_name)
+
+        user_grants: Dict[UUID, Set[str]] = {}
+        role_grants = (
+            select(user_roles.c.user_id, Permission.name)
+            .join(Role, Role.id == user_roles.c.role_id)
+            .join(role_permissions, role_permissions.c.role_id == Role.id)
+            .join(Permission, Permission.id == role_permissions.c.permission_id)
+            .where(Role.tenant_id == tenant_id)
+        )
+        group_grants = (
+            select(user_groups.c.user_id, Permission.name)
+            .join(Group, Group.id == user_groups.c.group_id)
+            .join(group_permissions, group_permissions.c.group_id == Group.id)
+            .join(Permission, Permission.id == group_permissions.c.permission_id)
+            .where(Group.tenant_id == tenant_id)
+        )
+        result = await db.execute(role_grants.union(group_grants))
+        for user_id, permission_name in result.all():
+            user_grants.setdefault(user_id, set()).add(permission_name)
+
+        return TenantPermissions(
+            version=version,
+            role_sets={name: PermissionSet(names) for name, names in role_names.items()},
+            user_grants={user_id: frozenset(names) for user_id, names in user_grants.items()},
+        )
+
+    def invalidate(self, tenant_id: UUID) -> None:
+        self._tenants.pop(tenant_id, None)
+
+
+permission_resolver = PermissionResolver(
+    version_check_interval=settings.PERMISSIONS_VERSION_CHECK_SECONDS
+)
+
+
+async def bump_permissions_version(db: AsyncSession, tenant_id: UUID) -> None:
+    """
+    Mark a tenant's grants as changed. Call inside the transaction that
+    changes them so every worker recompiles after it commits.
+    """
+    await db.execute(
+        update(Tenant)
+        .where(Tenant.id == tenant_id)
+        .values(permissions_version=Tenant.permissions_version + 1)
+    )
+    permission_resolver.invalidate(tenant_id)
@@ -0,0 +1,137 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, delete
+from typing import Optional
+from uuid import UUID
+from datetime import datetime, timedelta, timezone
+from jose import JWTError, jwt
+import secrets
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.metrics import register_metrics
+from app.core.security import create_access_token, decode_access_token
+from app.core.user_cache import AuthenticatedUser, user_snapshot_cache
+from app.models.user import User, UserSession
+from app.services.login_tracker import login_tracker
+
+SESSION_TOKEN_TYPE = "session"
+
+# jti -> whether the session row still exists. Lets a token be accepted with
+# a single HMAC check; revocations on other workers apply within the TTL.
+session_validity_cache = TTLCache(
+    maxsize=settings.SESSION_CACHE_MAX_SIZE,
+    ttl=settings.SESSION_REVALIDATE_SECONDS,
+)
+register_metrics("session_cache", session_validity_cache.stats)
+
+
+def is_session_token(token: str) -> bool:
+    """Session tokens are HMAC-signed; Firebase ID tokens are RS256."""
+    try:
+        return jwt.get_unverified_header(token).get("alg") == settings.ALGORITHM
+    except JWTError:
+        return False
+
+
+async def create_session(db: AsyncSession, user: AuthenticatedUser) -> tuple[str, int]:
+    """Persist a session for the user and return (token, lifetime in seconds)."""
+    lifetime = timedelta(minutes=settings.SESSION_TOKEN_EXPIRE_MINUTES)
+    now = datetime.now(timezone.utc)
+    jti = secrets.token_urlsafe(32)
+
+    # Opportunistically clear out the user's expired sessions
+    await db.execute(
+        delete(UserSession).where(
+            UserSession.user_id == user.id,
+            UserSession.expires_at <= now
+        )
+    )
+    db.add(UserSession(user_id=user.id, session_token=jti, expires_at=now + lifetime))
+    await db.commit()
+
+    token = create_access_token(
+        {
+            "typ": SESSION_TOKEN_TYPE,
+            "jti": jti,
+            "sub": str(user.id),
+            "uid": user.firebase_uid,
+            "tid": str(user.tenant_id) if user.tenant_id else None,
+            "role": user.role,
+            "email": user.email,
+            "name": user.name,
+            "picture": user.picture,
+            "email_verified": user.email_verified,
+        },
+        expires_delta=lifetime
+    )
+    session_validity_cache.set(jti, True)
+    return token, int(lifetime.total_seconds())
+
+
+async def authenticate_session(db: AsyncSession, token: str) -> Optional[AuthenticatedUser]:
+    """
+    Validate a session token and return the user it was issued to, or None
+    if it is invalid, expired or revoked, or the user no longer exists.
+    Inactive users are returned as such; the caller rejects them.
+    """
+    claims = decode_access_token(token)
+    if not claims or claims.get("typ") != SESSION_TOKEN_TYPE:
+        return None
+
+    jti = claims["jti"]
+    valid = session_validity_cache.get(jti)
+    if valid is None:
+        result = await db.execute(
+            select(UserSession.id).where(
+                UserSession.session_token == jti,
+                UserSession.expires_at > datetime.now(timezone.utc)
+            )
+        )
+        valid = result.scalar_one_or_none() is not None
+        session_validity_cache.set(jti, valid, expires_at=min(claims["exp"], _revalidate_at()))
+    if not valid:
+        return None
+
+    # A cached snapshot, else the user's current row, wins over claims frozen
+    # at issue time, so deactivation and role changes apply to live sessions
+    snapshot = user_snapshot_cache.get(claims["uid"]) if claims.get("uid") else None
+    if snapshot is None:
+        user = await db.get(User, UUID(claims["sub"]))
+        if user is None:
+            return None
+        snapshot = AuthenticatedUser.from_model(user)
+        if snapshot.firebase_uid:
+            user_snapshot_cache.set(snapshot.firebase_uid, snapshot)
+
+    login_tracker.touch(snapshot.id, datetime.now(timezone.utc))
+    return snapshot
+
+
+def get_session_id(token: str) -> Optional[str]:
+    claims = decode_access_token(token)
+    if not claims or claims.get("typ") != SESSION_TOKEN_TYPE:
+        return None
+    return claims["jti"]
+
+
+async def revoke_session(db: AsyncSession, jti: str) -> None:
+    await db.execute(delete(UserSession).where(UserSession.session_token == jti))
+    await db.commit()
+    session_validity_cache.set(jti, False)
+
+
+async def revoke_user_sessions(db: AsyncSession, user_id: UUID) -> None:
+    """Revoke every session issued to a user, e.g. after a tenant or role change."""
+    result = await db.execute(
+        delete(UserSession)
+        .where(UserSession.user_id == user_id)
+        .returning(UserSession.session_token)
+    )
+    jtis = result.scalars().all()
+    await db.commit()
+    for jti in jtis:
+        session_validity_cache.set(jti, False)
+
+
+def _revalidate_at() -> float:
+    return datetime.now(timezone.utc).timestamp() + settings.SESSION_REVALIDATE_SECONDS
@@ -0,0 +1,253 @@
+import asyncio
+import hashlib
+import logging
+import re
+import time
+from typing import Any, Callable, Dict, Optional, Protocol, Tuple
+
+import httpx
+import jwt
+from cryptography import x509
+from cryptography.hazmat.primitives import serialization
+
+from app.core.cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+GOOGLE_CERTS_URL = "https://www.googleapis.com/robot/v1/metadata/x509/securetoken@system.gserviceaccount.com"
+
+_MAX_AGE_RE = re.compile(r"max-age=(\d+)")
+
+
+class KeySource(Protocol):
+    """Supplies PEM-encoded signing keys keyed by ``kid`` and how long they may be cached."""
+
+    async def fetch(self) -> Tuple[Dict[str, str], float]:
+        ...
+
+
+class GoogleCertKeySource:
+    """Fetches Firebase's public signing certificates from Google."""
+
+    def __init__(self, url: str = GOOGLE_CERTS_URL, timeout: float = 10.0, default_max_age: float = 3600.0):
+        self.url = url
+        self.timeout = timeout
+        self.default_max_age = default_max_age
+
+    async def fetch(self) -> Tuple[Dict[str, str], float]:
+        async with httpx.AsyncClient(timeout=self.timeout) as client:
+            response = await client.get(self.url)
+            response.raise_for_status()
+
+        match = _MAX_AGE_RE.search(response.headers.get("cache-control", ""))
+        max_age = float(match.group(1)) if match else self.default_max_age
+        return response.json(), max_age
+
+
+class StaticKeySource:
+    """Serves a fixed set of keys, e.g. locally generated ones for offline testing."""
+
+    def __init__(self, keys: Dict[str, str], max_age: float = 3600.0):
+        self.keys = keys
+        self.max_age = max_age
+
+    async def fetch(self) -> Tuple[Dict[str, str], float]:
+        return dict(self.keys), self.max_age
+
+
+def _load_public_key(pem: str):
+    data = pem.encode()
+    if b"BEGIN CERTIFICATE" in data:
+        return x509.load_pem_x509_certificate(data).public_key()
+    return serialization.load_pem_public_key(data)
+
+
+class FirebaseTokenVerifier:
+    """
+    Verifies Firebase ID tokens without blocking the event loop.
+
+    Signing keys are held in memory and refreshed in the background shortly
+    before the cache lifetime advertised by the key source runs out. The RSA
+    signature check itself runs in a worker thread.
+    """
+
+    def __init__(
+        self,
+        project_id: str,
+        key_source: Optional[KeySource] = None,
+        clock_skew_seconds: int = 0,
+        refresh_margin_seconds: float = 300.0,
+        retry_interval_seconds: float = 30.0,
+        min_forced_refresh_interval: float = 60.0,
+    ):
+        self.project_id = project_id
+        self.issuer = f"https://securetoken.google.com/{project_id}"
+        self.key_source = key_source or GoogleCertKeySource()
+        self.clock_skew_seconds = clock_skew_seconds
+        self.refresh_margin_seconds = refresh_margin_seconds
+        self.retry_interval_seconds = retry_interval_seconds
+        self.min_forced_refresh_interval = min_forced_refresh_interval
+
+        self._keys: Dict[str, Any] = {}
+        self._expires_at = 0.0
+        self._last_refresh = 0.0
+        self._lock = asyncio.Lock()
+        self._refresh_task: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        """Load the keys and keep them fresh in a background task."""
+        if self._refresh_task and not self._refresh_task.done():
+            return
+        try:
+            await self.refresh()
+        except Exception as e:
+            logger.warning(f"Initial signing key fetch failed: {str(e)}")
+        self._refresh_task = asyncio.create_task(self._refresh_loop())
+
+    async def stop(self) -> None:
+        if self._refresh_task:
+            self._refresh_task.cancel()
+            try:
+                await self._refresh_task
+            except asyncio.CancelledError:
+                pass
+            self._refresh_task = None
+
+    async def refresh(self) -> None:
+        """Fetch the current key set, replacing the cached one."""
+        async with self._lock:
+            await self._refresh_locked()
+
+    async def _refresh_locked(self) -> None:
+        pems, max_age = await self.key_source.fetch()
+        self._keys = {kid: _load_public_key(pem) for kid, pem in pems.items()}
+        now = time.time()
+        self._expires_at = now + max_age
+        self._last_refresh = now
+        logger.info(f"Loaded {len(self._keys)} Firebase signing keys (max-age {int(max_age)}s)")
+
+    async def _refresh_loop(self) -> None:
+        while True:
+            delay = max(self._expires_at - self.refresh_margin_seconds - time.time(), 1.0)
+            await asyncio.sleep(delay)
+            try:
+                await self.refresh()
+            except Exception as e:
+                # Keep serving the previous keys and try again shortly
+                logger.warning(f"Signing key refresh failed: {str(e)}")
+                self._expires_at = time.time() + self.refresh_margin_seconds + self.retry_interval_seconds
+
+    async def _get_key(self, kid: str):
+        key = self._keys.get(kid)
+        if key is not None:
+            return key
+
+        async with self._lock:
+            key = self._keys.get(kid)
+            if key is not None:
+                return key
+            # Unknown kid: the keys may have rotated, but don't let bad tokens trigger a fetch storm
+            if not self._keys or time.time() - self._last_refresh >= self.min_forced_refresh_interval:
+                try:
+                    await self._refresh_locked()
+                except Exception as e:
+                    logger.error(f"Signing key fetch failed: {str(e)}")
+                    raise ValueError("Token verification failed: signing keys unavailable")
+            return self._keys.get(kid)
+
+    def _decode(self, id_token: str, key) -> dict:
+        return jwt.decode(
+            id_token,
+            key,
+            algorithms=["RS256"],
+            audience=self.project_id,
+            issuer=self.issuer,
+            leeway=self.clock_skew_seconds,
+            options={"require": ["exp", "iat", "aud", "iss", "sub"]},
+        )
+
+    async def verify(self, id_token: str) -> dict:
+        """
+        Verify a Firebase ID token and return its claims with ``uid`` set.
+
+        Raises:
+            ValueError: If the token is malformed, expired or not signed by Firebase
+        """
+        try:
+            header = jwt.get_unverified_header(id_token)
+        except jwt.PyJWTError as e:
+            raise ValueError(f"Invalid token: {str(e)}")
+
+        if header.get("alg") != "RS256":
+            raise ValueError("Invalid token: unexpected signing algorithm")
+
+        key = await self._get_key(header.get("kid", ""))
+        if key is None:
+            raise ValueError("Invalid token: unknown signing key")
+
+        try:
+            claims = await asyncio.to_thread(self._decode, id_token, key)
+        except jwt.ExpiredSignatureError:
+            raise ValueError("Token has expired")
+        except jwt.PyJWTError as e:
+            raise ValueError(f"Invalid token: {str(e)}")
+
+        sub = claims.get("sub")
+        if not isinstance(sub, str) or not sub or len(sub) > 128:
+            raise ValueError("Invalid token: invalid subject")
+        auth_time = claims.get("auth_time")
+        if auth_time is not None and auth_time > time.time() + self.clock_skew_seconds:
+            raise ValueError("Invalid token: auth_time is in the future")
+
+        claims["uid"] = sub
+        return claims
+
+
+class TokenClaimsCache:
+    """
+    LRU of verified token claims keyed by a SHA-256 of the raw token.
+
+    Entries expire at the token's own ``exp`` (or sooner when ``max_ttl`` is
+    set), so a cached token is never honoured past its validity. An optional
+    ``is_revoked`` hook is consulted on every hit and drops the entry when it
+    returns True.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 10000,
+        max_ttl: Optional[float] = None,
+        is_revoked: Optional[Callable[[dict], bool]] = None,
+    ):
+        self.max_ttl = max_ttl
+        self.is_revoked = is_revoked
+        self._cache = TTLCache(maxsize)
+
+    @staticmethod
+    def _key(id_token: str) -> bytes:
+        return hashlib.sha256(id_token.encode()).digest()
+
+    def get(self, id_token: str) -> Optional[dict]:
+        key = self._key(id_token)
+        claims = self._cache.get(key)
+        if claims is None:
+            return None
+        if self.is_revoked is not None and self.is_revoked(claims):
+            self._cache.pop(key)
+            return None
+        return claims
+
+    def put(self, id_token: str, claims: dict) -> None:
+        expires_at = float(claims.get("exp", 0))
+        if self.max_ttl is not None:
+            expires_at = min(expires_at, time.time() + self.max_ttl)
+        self._cache.set(self._key(id_token), claims, expires_at=expires_at)
+
+    def invalidate(self, id_token: str) -> None:
+        self._cache.pop(self._key(id_token))
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def stats(self) -> dict:
+        return self._cache.stats()
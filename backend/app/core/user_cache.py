@@ -0,0 +1,52 @@
+from dataclasses import dataclass
+from typing import Optional
+from uuid import UUID
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.metrics import register_metrics
+from app.models.user import User
+
+
+@dataclass(frozen=True)
+class AuthenticatedUser:
+    """Immutable snapshot of the fields request handlers need about the caller."""
+
+    id: UUID
+    firebase_uid: Optional[str]
+    tenant_id: Optional[UUID]
+    email: str
+    name: Optional[str]
+    picture: Optional[str]
+    role: str
+    email_verified: bool
+    is_active: bool
+
+    @classmethod
+    def from_model(cls, user: User) -> "AuthenticatedUser":
+        return cls(
+            id=user.id,
+            firebase_uid=user.firebase_uid,
+            tenant_id=user.tenant_id,
+            email=user.email,
+            name=user.name,
+            picture=user.picture,
+            role=user.role,
+            email_verified=user.email_verified,
+            is_active=user.is_active,
+        )
+
+
+# Keyed by firebase_uid. Entries are short-lived so changes made by other
+# workers show up quickly; local writes invalidate explicitly.
+user_snapshot_cache = TTLCache(
+    maxsize=settings.USER_CACHE_MAX_SIZE,
+    ttl=settings.USER_CACHE_TTL_SECONDS,
+)
+register_metrics("user_cache", user_snapshot_cache.stats)
+
+
+def invalidate_user_snapshot(firebase_uid: Optional[str]) -> None:
+    """Drop a cached snapshot after the user's row has been changed."""
+    if firebase_uid:
+        user_snapshot_cache.pop(firebase_uid)
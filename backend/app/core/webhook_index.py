@@ -0,0 +1,100 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, update
+from typing import Dict, Optional, Tuple
+from uuid import UUID
+import time
+
+from app.core.config import settings
+from app.core.metrics import register_metrics
+from app.models.tenant import Tenant
+from app.models.webhook import WebhookSubscription
+
+
+class TenantWebhooks:
+    """A tenant's enabled subscription ids by event name, loaded at one webhooks_version."""
+
+    def __init__(self, version: int, by_event: Dict[str, Tuple[UUID, ...]]):
+        self.version = version
+        self.by_event = by_event
+        self.checked_at = time.monotonic()
+
+
+class WebhookSubscriptionIndex:
+    """
+    In-process index of tenant -> event name -> enabled subscription ids.
+
+    A tenant's subscriptions are loaded in one query and reused while its
+    webhooks_version is unchanged; the version itself is re-read at most
+    every ``version_check_interval`` seconds. Events and tenants with no
+    subscriptions are cached too, so emitting them costs no query between
+    version checks.
+    """
+
+    def __init__(self, version_check_interval: float):
+        self.version_check_interval = version_check_interval
+        self._tenants: Dict[UUID, TenantWebhooks] = {}
+        self.hits = 0
+        self.loads = 0
+
+    async def subscription_ids(
+        self,
+        db: AsyncSession,
+        tenant_id: UUID,
+        event_name: str
+    ) -> Tuple[UUID, ...]:
+        cached = self._tenants.get(tenant_id)
+        if cached is None or time.monotonic() - cached.checked_at >= self.version_check_interval:
+            result = await db.execute(
+                select(Tenant.webhooks_version).where(Tenant.id == tenant_id)
+            )
+            version = result.scalar() or 0
+            if cached is not None and cached.version == version:
+                cached.checked_at = time.monotonic()
+            else:
+                cached = await self._load(db, tenant_id, version)
+                self._tenants[tenant_id] = cached
+        else:
+            self.hits += 1
+
+        return cached.by_event.get(event_name, ())
+
+    async def _load(self, db: AsyncSession, tenant_id: UUID, version: int) -> TenantWebhooks:
+        self.loads += 1
+        result = await db.execute(
+            select(WebhookSubscription.event_name, WebhookSubscription.id).where(
+                WebhookSubscription.tenant_id == tenant_id,
+                WebhookSubscription.enabled == True
+            )
+        )
+        by_event: Dict[str, list] = {}
+        for event_name, subscription_id in result.all():
+            by_event.setdefault(event_name, []).append(subscription_id)
+        return TenantWebhooks(
+            version=version,
+            by_event={name: tuple(ids) for name, ids in by_event.items()}
+        )
+
+    def invalidate(self, tenant_id: Optional[UUID]) -> None:
+        self._tenants.pop(tenant_id, None)
+
+    def stats(self) -> dict:
+        return {"tenants": len(self._tenants), "hits": self.hits, "loads": self.loads}
+
+
+webhook_index = WebhookSubscriptionIndex(
+    version_check_interval=settings.WEBHOOK_INDEX_VERSION_CHECK_SECONDS
+)
+register_metrics("webhook_index", webhook_index.stats)
+
+
+async def bump_webhooks_version(db: AsyncSession, tenant_id: UUID) -> None:
+    """
+    Mark a tenant's subscriptions as changed. Call inside the transaction
+    that changes them so every worker reloads after it commits.
+    """
+    await db.execute(
+        update(Tenant)
+        .where(Tenant.id == tenant_id)
+        .values(webhooks_version=Tenant.webhooks_version + 1)
+    )
+    webhook_index.invalidate(tenant_id)
@@ -0,0 +1,58 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, update
+from typing import Optional
+from uuid import UUID
+import hashlib
+import hmac
+import secrets
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.metrics import register_metrics
+from app.models.tenant import Tenant
+
+# tenant_id -> SHA-256 digest of the tenant's inbound webhook API key, or None
+# when the tenant is unknown, inactive or has no key. Any presented key is
+# checked against the cached digest, so neither repeat callers nor callers
+# guessing keys reach the database; rotations on other workers apply within
+# the TTL.
+webhook_key_cache = TTLCache(
+    maxsize=settings.WEBHOOK_KEY_CACHE_MAX_SIZE,
+    ttl=settings.WEBHOOK_KEY_CACHE_TTL_SECONDS,
+)
+register_metrics("webhook_key_cache", webhook_key_cache.stats)
+
+_NO_KEY = b""
+
+
+def _digest(api_key: str) -> bytes:
+    return hashlib.sha256(api_key.encode()).digest()
+
+
+async def verify_webhook_api_key(db: AsyncSession, tenant_id: UUID, api_key: str) -> bool:
+    """Check an inbound webhook's API key against its tenant's current key."""
+    stored = webhook_key_cache.get(tenant_id)
+    if stored is None:
+        result = await db.execute(
+            select(Tenant.webhook_api_key).where(
+                Tenant.id == tenant_id,
+                Tenant.is_active == True
+            )
+        )
+        key: Optional[str] = result.scalar_one_or_none()
+        stored = _digest(key) if key else _NO_KEY
+        webhook_key_cache.set(tenant_id, stored)
+
+    # Fixed-length digests compared in constant time
+    return stored != _NO_KEY and hmac.compare_digest(stored, _digest(api_key))
+
+
+async def rotate_webhook_api_key(db: AsyncSession, tenant_id: UUID) -> str:
+    """Replace the tenant's inbound webhook API key and return the new one."""
+    api_key = secrets.token_urlsafe(32)
+    await db.execute(
+        update(Tenant).where(Tenant.id == tenant_id).values(webhook_api_key=api_key)
+    )
+    await db.commit()
+    webhook_key_cache.set(tenant_id, _digest(api_key))
+    return api_key
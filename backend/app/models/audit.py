@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, DateTime, ForeignKey, Text
+from sqlalchemy import Column, String, DateTime, Boolean, ForeignKey, Index, Integer, Text
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from datetime import datetime, timezone
 import uuid
@@ -16,4 +16,25 @@ class AuditLog(Base):
     timestamp = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), nullable=False, index=True)
     before_data = Column(JSONB, nullable=True)
     after_data = Column(JSONB, nullable=True)
-    changes = Column(JSONB, nullable=True)
\ No newline at end of file
+    changes = Column(JSONB, nullable=True)
+    # after_data holds the entity's complete state; compact storage replays
+    # the deltas that follow from the nearest such row
+    snapshot = Column(Boolean, default=False, server_default='false', nullable=False)
+    
+    __table_args__ = (
+        Index('ix_audit_logs_entity_timestamp', 'tenant_id', 'entity_type', 'entity_id', 'timestamp'),
+    )
+
+
+class AuditEntityCounter(Base):
+    """
+    Updates of one entity since its last compact-storage snapshot, kept in
+    the transaction of each change so the snapshot decision needs no look at
+    the entity's history. Entities with no row have no known snapshot.
+    """
+    __tablename__ = "audit_entity_counters"
+
+    tenant_id = Column(UUID(as_uuid=True), ForeignKey('tenants.id', ondelete='CASCADE'), primary_key=True)
+    entity_type = Column(String(50), primary_key=True)
+    entity_id = Column(UUID(as_uuid=True), primary_key=True)
+    updates_since_snapshot = Column(Integer, default=0, server_default='0', nullable=False)
@@ -1,9 +1,16 @@
-from sqlalchemy import Column, String, DateTime, ForeignKey
-from sqlalchemy.dialects.postgresql import UUID, JSONB
+from sqlalchemy import Column, String, DateTime, ForeignKey, Index, Text, Computed, Integer, PrimaryKeyConstraint
+from sqlalchemy.dialects.postgresql import UUID, JSONB, TSVECTOR
+from sqlalchemy.orm import deferred
 from datetime import datetime, timezone
 import uuid
 from app.models.base import Base
 
+# Fields covered by contact search, concatenated in this order
+SEARCH_DOCUMENT = (
+    "coalesce(first_name, '') || ' ' || coalesce(last_name, '') || ' ' || "
+    "coalesce(email, '') || ' ' || coalesce(phone, '') || ' ' || coalesce(company, '')"
+)
+
 class Contact(Base):
     __tablename__ = "contacts"
 
@@ -18,4 +25,43 @@ class Contact(Base):
     created_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), nullable=False, index=True)
     updated_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc), nullable=False)
     created_by = Column(UUID(as_uuid=True), ForeignKey('users.id', ondelete='SET NULL'), nullable=True)
-    updated_by = Column(UUID(as_uuid=True), ForeignKey('users.id', ondelete='SET NULL'), nullable=True)
\ No newline at end of file
+    updated_by = Column(UUID(as_uuid=True), ForeignKey('users.id', ondelete='SET NULL'), nullable=True)
+    
+    # Maintained by Postgres for indexed search; deferred so listings don't load them
+    search_text = deferred(Column(Text, Computed(f"lower({SEARCH_DOCUMENT})", persisted=True)))
+    search_vector = deferred(Column(TSVECTOR, Computed(f"to_tsvector('simple', {SEARCH_DOCUMENT})", persisted=True)))
+    
+    # Keyset pagination indexes, one per sortable column
+    __table_args__ = (
+        Index('ix_contacts_tenant_created_at_id', 'tenant_id', 'created_at', 'id'),
+        Index('ix_contacts_tenant_updated_at_id', 'tenant_id', 'updated_at', 'id'),
+        Index('ix_contacts_tenant_first_name_id', 'tenant_id', 'first_name', 'id'),
+        Index('ix_contacts_tenant_last_name_id', 'tenant_id', 'last_name', 'id'),
+        Index('ix_contacts_tenant_email_id', 'tenant_id', 'email', 'id'),
+        Index('ix_contacts_tenant_company_id', 'tenant_id', 'company', 'id'),
+        # tenant_id is a GIN key via btree_gin so searches stay within one tenant
+        Index(
+            'ix_contacts_search_text_trgm', 'tenant_id', 'search_text',
+            postgresql_using='gin', postgresql_ops={'search_text': 'gin_trgm_ops'}
+        ),
+        Index('ix_contacts_search_vector', 'tenant_id', 'search_vector', postgresql_using='gin'),
+        # Serves both @> (all tags) and ?| (any tag) filters
+        Index('ix_contacts_tags', 'tenant_id', 'tags', postgresql_using='gin'),
+    )
+
+class ContactTagCount(Base):
+    """
+    Number of contacts carrying each tag, per tenant.
+    
+    Kept current by statement-level triggers on contacts (see migration 0005);
+    rows whose count drops to zero are left in place and filtered on read.
+    """
+    __tablename__ = "contact_tag_counts"
+
+    tenant_id = Column(UUID(as_uuid=True), ForeignKey('tenants.id', ondelete='CASCADE'), nullable=False)
+    tag = Column(Text, nullable=False)
+    count = Column(Integer, default=0, server_default='0', nullable=False)
+    
+    __table_args__ = (
+        PrimaryKeyConstraint('tenant_id', 'tag'),
+    )
\ No newline at end of file
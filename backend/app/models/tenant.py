@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, DateTime, Boolean
+from sqlalchemy import Column, String, DateTime, Boolean, Integer
 from sqlalchemy.dialects.postgresql import UUID
 from datetime import datetime, timezone
 import uuid
@@ -15,4 +15,10 @@ class Tenant(Base):
     updated_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc), nullable=False)
     
     webhook_api_key = Column(String(255), nullable=True)
-    webhook_secret = Column(String(255), nullable=True)
\ No newline at end of file
+    webhook_secret = Column(String(255), nullable=True)
+    
+    # Bumped whenever a role/group grant in the tenant changes
+    permissions_version = Column(Integer, default=0, server_default='0', nullable=False)
+    
+    # Bumped whenever the tenant's webhook subscriptions change
+    webhooks_version = Column(Integer, default=0, server_default='0', nullable=False)
\ No newline at end of file
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, DateTime, Boolean, ForeignKey, Text
+from sqlalchemy import Column, String, DateTime, Boolean, ForeignKey, Text, Integer, Index, func, text
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from datetime import datetime, timezone
 import uuid
@@ -13,6 +13,11 @@ class WebhookSubscription(Base):
     target_url = Column(String(500), nullable=False)
     secret = Column(String(255), nullable=False)
     enabled = Column(Boolean, default=True, nullable=False)
+    # Opt-in: deliver events as one array payload per batch, sent once
+    # batch_max_size events are queued or the oldest has waited batch_max_wait_seconds
+    batch_enabled = Column(Boolean, default=False, server_default='false', nullable=False)
+    batch_max_size = Column(Integer, default=100, server_default='100', nullable=False)
+    batch_max_wait_seconds = Column(Integer, default=10, server_default='10', nullable=False)
     created_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), nullable=False)
     updated_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc), nullable=False)
 
@@ -23,7 +28,70 @@ class IntegrationEvent(Base):
     tenant_id = Column(UUID(as_uuid=True), ForeignKey('tenants.id', ondelete='CASCADE'), nullable=False, index=True)
     event_name = Column(String(100), nullable=False, index=True)
     payload = Column(JSONB, nullable=False)
+    # received -> processed, or failed once attempts run out
     status = Column(String(20), default='received', nullable=False)
     received_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), nullable=False, index=True)
     processed_at = Column(DateTime(timezone=True), nullable=True)
-    error_message = Column(Text, nullable=True)
\ No newline at end of file
+    error_message = Column(Text, nullable=True)
+    attempts = Column(Integer, default=0, server_default='0', nullable=False)
+    # When the event is next due; claiming pushes it out by the lease time
+    next_attempt_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    
+    __table_args__ = (
+        Index(
+            'ix_integration_events_due', 'tenant_id', 'next_attempt_at',
+            postgresql_where=text("status = 'received'")
+        ),
+    )
+
+class WebhookOutbox(Base):
+    """
+    One pending delivery of an event to a subscription, written in the same
+    transaction as the change that produced it and sent by the dispatcher.
+    """
+    __tablename__ = "webhook_outbox"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    tenant_id = Column(UUID(as_uuid=True), ForeignKey('tenants.id', ondelete='CASCADE'), nullable=False, index=True)
+    subscription_id = Column(UUID(as_uuid=True), ForeignKey('webhook_subscriptions.id', ondelete='CASCADE'), nullable=False, index=True)
+    event_name = Column(String(100), nullable=False)
+    payload = Column(JSONB, nullable=False)
+    # pending -> delivered, or dead once attempts run out
+    status = Column(String(20), default='pending', server_default='pending', nullable=False)
+    attempts = Column(Integer, default=0, server_default='0', nullable=False)
+    # When the row is next due; claiming pushes it out by the lease time
+    next_attempt_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), nullable=False)
+    last_error = Column(Text, nullable=True)
+    created_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), nullable=False)
+    delivered_at = Column(DateTime(timezone=True), nullable=True)
+    
+    __table_args__ = (
+        Index(
+            'ix_webhook_outbox_due', 'next_attempt_at',
+            postgresql_where=text("status = 'pending'")
+        ),
+        # Events waiting for their first delivery, counted per batched subscription
+        Index(
+            'ix_webhook_outbox_unattempted', 'subscription_id',
+            postgresql_where=text("status = 'pending' AND attempts = 0")
+        ),
+    )
+
+class WebhookTargetHealth(Base):
+    """
+    Circuit breaker state for one delivery target URL, shared by every
+    dispatcher process. Targets with no row are healthy (closed).
+    """
+    __tablename__ = "webhook_target_health"
+
+    target_url = Column(String(500), primary_key=True)
+    # closed -> open after repeated failures -> half_open while one probe
+    # delivery is in flight -> closed on success, or open again on failure
+    state = Column(String(20), default='closed', server_default='closed', nullable=False)
+    consecutive_failures = Column(Integer, default=0, server_default='0', nullable=False)
+    # While open: when a probe may be sent. While half_open: when the probe's lease runs out.
+    retry_at = Column(DateTime(timezone=True), nullable=True)
+    opened_at = Column(DateTime(timezone=True), nullable=True)
+    last_error = Column(Text, nullable=True)
+    last_failure_at = Column(DateTime(timezone=True), nullable=True)
+    last_success_at = Column(DateTime(timezone=True), nullable=True)
@@ -1,27 +1,71 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, or_
-from typing import List, Optional
+from sqlalchemy import select, insert, update, delete, func, or_, and_, tuple_, literal, union_all, Row, Select, Text
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB, UUID as PG_UUID
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence
 from uuid import UUID
+import re
 
-from app.models.contact import Contact
+from app.models.contact import Contact, ContactTagCount
+from app.repositories.counting import count_rows
+from app.repositories.pagination import Page, InvalidCursor, encode_cursor, decode_cursor
 from app.schemas.contact import ContactCreate, ContactUpdate
 
+# Columns contacts can be listed by; each has a (tenant_id, column, id) index
+CONTACT_SORT_FIELDS = ("created_at", "updated_at", "first_name", "last_name", "email", "company")
+
+SEARCH_MODES = ("contains", "ranked")
+
+# Matches ranked per ranked-search page request; beyond this many a broad
+# term is ordered by relevance only among the first matches found
+RANKED_SEARCH_CANDIDATES = 1000
+
+TAG_MATCH_MODES = ("all", "any")
+
+# Columns returned by writes and exports, enough to rebuild a ContactResponse
+_RECORD_COLUMNS = (
+    Contact.id, Contact.tenant_id, Contact.first_name, Contact.last_name, Contact.email,
+    Contact.phone, Contact.company, Contact.tags, Contact.created_at, Contact.updated_at,
+    Contact.created_by, Contact.updated_by
+)
+
+def _escape_like(term: str) -> str:
+    return term.replace("/", "//").replace("%", "/%").replace("_", "/_")
+
+def _search_terms(search: str) -> List[str]:
+    return re.findall(r"\w+", search.lower())
+
+def _prefix_query(search: str):
+    """
+    tsquery matching every search word as a prefix, e.g. ``'jo':* & 'smi':*``.
+    
+    plainto_tsquery splits the search with the same parser that built
+    search_vector, so an email stays one lexeme; each lexeme then gets :*.
+    """
+    parsed = func.plainto_tsquery("simple", search).cast(Text)
+    return func.to_tsquery("simple", func.regexp_replace(parsed, "'( |$)", "':*\\1", "g"))
+
+def _word_match(search: str):
+    return Contact.search_vector.op("@@")(_prefix_query(search))
+
+def _fuzzy_match(search: str):
+    """Trigram match of the search against any word run of search_text, not the whole document."""
+    return literal(search.lower(), Text).op("<%")(Contact.search_text)
+
 class ContactRepository:
     def __init__(self, db: AsyncSession, tenant_id: UUID):
         self.db = db
         self.tenant_id = tenant_id
     
-    async def create(self, contact_data: ContactCreate, created_by: UUID) -> Contact:
-        contact = Contact(
+    async def create(self, contact_data: ContactCreate, created_by: UUID) -> Row:
+        """INSERT ... RETURNING the new contact's row; the caller commits."""
+        stmt = insert(Contact).values(
             **contact_data.model_dump(),
             tenant_id=self.tenant_id,
             created_by=created_by,
             updated_by=created_by
-        )
-        self.db.add(contact)
-        await self.db.commit()
-        await self.db.refresh(contact)
-        return contact
+        ).returning(*_RECORD_COLUMNS)
+        result = await self.db.execute(stmt)
+        return result.one()
     
     async def get_by_id(self, contact_id: UUID) -> Optional[Contact]:
         stmt = select(Contact).where(
@@ -39,55 +83,331 @@ class ContactRepository:
         result = await self.db.execute(stmt)
         return result.scalar_one_or_none()
     
+    async def existing_emails(self, emails: List[str]) -> set[str]:
+        """The subset of ``emails`` already used by a contact in the tenant."""
+        if not emails:
+            return set()
+        stmt = select(Contact.email).where(
+            Contact.tenant_id == self.tenant_id,
+            Contact.email == func.any(literal(emails, ARRAY(Text)))
+        )
+        result = await self.db.execute(stmt)
+        return set(result.scalars().all())
+    
+    async def copy_insert(self, rows: List[dict]) -> None:
+        """
+        Insert fully populated contact rows with COPY.
+        
+        COPY bypasses ORM defaults, so every non-generated column must be
+        present in each row. It runs on the session's connection and joins
+        its open transaction.
+        """
+        columns = [
+            "id", "tenant_id", "first_name", "last_name", "email", "phone",
+            "company", "tags", "created_at", "updated_at", "created_by", "updated_by"
+        ]
+        connection = await self.db.connection()
+        raw = await connection.get_raw_connection()
+        await raw.driver_connection.copy_records_to_table(
+            Contact.__tablename__,
+            records=[tuple(row[column] for column in columns) for row in rows],
+            columns=columns
+        )
+    
+    def filtered(
+        self,
+        search: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        search_mode: str = "contains",
+        tag_match: str = "all"
+    ) -> Select:
+        """
+        Tenant-scoped SELECT of contacts matching the listing filters.
+        
+        A ranked search matches word prefixes, and falls back to fuzzy
+        trigram matches only when no contact matches by prefix.
+        """
+        scope = self._scope(tags, tag_match)
+        stmt = select(Contact).where(*scope)
+        
+        if search:
+            if search_mode == "ranked" and _search_terms(search):
+                by_words = select(Contact.id).where(*scope, _word_match(search))
+                # A UNION rather than an OR, so the trigram scan is skipped
+                # outright when a contact matches by prefix
+                by_trigrams = select(Contact.id).where(*scope, ~by_words.exists(), _fuzzy_match(search))
+                stmt = stmt.where(Contact.id.in_(union_all(by_words, by_trigrams)))
+            else:
+                # Substring match, served by the trigram index on search_text
+                stmt = stmt.where(
+                    Contact.search_text.like(f"%{_escape_like(search.lower())}%", escape="/")
+                )
+        
+        return stmt
+    
+    def _scope(self, tags: Optional[List[str]], tag_match: str) -> list:
+        """The tenant and tag conditions of a listing."""
+        scope = [Contact.tenant_id == self.tenant_id]
+        if tags:
+            if tag_match == "any":
+                scope.append(Contact.tags.has_any(literal(tags, ARRAY(Text))))
+            else:
+                scope.append(Contact.tags.contains(tags))
+        return scope
+    
+    def _ranked_candidates(self, search: str, tags: Optional[List[str]], tag_match: str):
+        """
+        Ids of at most RANKED_SEARCH_CANDIDATES contacts the ranked search
+        matches, so ranking never scores every match of a broad term.
+        
+        The fuzzy branch runs only when nothing matches by prefix; Postgres
+        evaluates the NOT EXISTS once and skips the trigram scan otherwise,
+        which is what keeps e-mail-like terms, whose trigrams occur in most
+        rows, cheap.
+        """
+        scope = self._scope(tags, tag_match)
+        by_words = (
+            select(Contact.id)
+            .where(*scope, _word_match(search))
+            .limit(RANKED_SEARCH_CANDIDATES)
+            .cte("by_words")
+        )
+        by_trigrams = (
+            select(Contact.id)
+            .where(*scope, ~select(by_words.c.id).exists(), _fuzzy_match(search))
+            .limit(RANKED_SEARCH_CANDIDATES)
+        )
+        return union_all(select(by_words.c.id), by_trigrams).subquery("candidates")
+    
     async def list(
         self,
         page: int = 1,
         page_size: int = 20,
         search: Optional[str] = None,
-        tag: Optional[str] = None,
+        tags: Optional[List[str]] = None,
         sort_by: str = "created_at",
-        sort_order: str = "desc"
-    ) -> tuple[List[Contact], int]:
-        stmt = select(Contact).where(Contact.tenant_id == self.tenant_id)
+        sort_order: str = "desc",
+        cursor: Optional[str] = None,
+        count_mode: str = "exact",
+        search_mode: str = "contains",
+        tag_match: str = "all"
+    ) -> Page:
+        """
+        List contacts with either page/page_size or keyset pagination.
         
-        if search:
-            search_filter = or_(
-                Contact.first_name.ilike(f"%{search}%"),
-                Contact.last_name.ilike(f"%{search}%"),
-                Contact.email.ilike(f"%{search}%"),
-                Contact.phone.ilike(f"%{search}%")
+        When ``cursor`` is given the page number is ignored and rows are read
+        from just after the cursor position via the (tenant_id, sort col, id)
+        indexes. A next cursor is returned whenever more rows follow.
+        
+        ``count_mode`` selects how the total is computed (see COUNT_MODES);
+        with "none" the total is None.
+        
+        With ``search_mode="ranked"`` the search matches word prefixes, or
+        fuzzy trigrams when nothing matches by prefix, and results are
+        ordered by relevance instead of ``sort_by``; cursors are not
+        available in that mode. Only the first RANKED_SEARCH_CANDIDATES
+        matches are ranked and paged.
+        
+        ``tags`` keeps contacts carrying all of the given tags, or any of
+        them when ``tag_match="any"``.
+        """
+        stmt = self.filtered(search, tags, search_mode, tag_match)
+        total = await count_rows(self.db, stmt, count_mode)
+        
+        if search and search_mode == "ranked" and _search_terms(search):
+            if cursor:
+                raise InvalidCursor("Cursor pagination is not available for ranked search")
+            rank = (
+                func.ts_rank_cd(Contact.search_vector, _prefix_query(search))
+                + func.word_similarity(search.lower(), Contact.search_text)
+            )
+            candidates = self._ranked_candidates(search, tags, tag_match)
+            stmt = (
+                select(Contact)
+                .where(Contact.id.in_(select(candidates.c.id)))
+                .order_by(rank.desc(), Contact.id)
+            )
+            stmt = stmt.offset((page - 1) * page_size).limit(page_size + 1)
+            result = await self.db.execute(stmt)
+            contacts = result.scalars().all()
+            return Page(
+                items=contacts[:page_size],
+                total=total,
+                has_more=len(contacts) > page_size
             )
-            stmt = stmt.where(search_filter)
         
-        if tag:
-            stmt = stmt.where(Contact.tags.contains([tag]))
+        sort_column = getattr(Contact, sort_by)
+        descending = sort_order == "desc"
         
-        count_stmt = select(func.count()).select_from(stmt.subquery())
-        total_result = await self.db.execute(count_stmt)
-        total = total_result.scalar()
+        if cursor:
+            value, last_id = decode_cursor(cursor, sort_by, sort_order, sort_column)
+            stmt = stmt.where(self._after(sort_column, value, last_id, descending))
         
-        if sort_order == "desc":
-            stmt = stmt.order_by(getattr(Contact, sort_by).desc())
+        # The id tie-breaker keeps the order total, which keyset paging relies on
+        if descending:
+            stmt = stmt.order_by(sort_column.desc(), Contact.id.desc())
         else:
-            stmt = stmt.order_by(getattr(Contact, sort_by).asc())
+            stmt = stmt.order_by(sort_column.asc(), Contact.id.asc())
         
-        stmt = stmt.offset((page - 1) * page_size).limit(page_size)
+        if not cursor:
+            stmt = stmt.offset((page - 1) * page_size)
+        stmt = stmt.limit(page_size + 1)
         
         result = await self.db.execute(stmt)
         contacts = result.scalars().all()
         
-        return contacts, total
+        page_result = Page(items=contacts, total=total)
+        if len(contacts) > page_size:
+            last = contacts[page_size - 1]
+            page_result.items = contacts[:page_size]
+            page_result.has_more = True
+            page_result.next_cursor = encode_cursor(sort_by, sort_order, getattr(last, sort_by), last.id)
+        
+        return page_result
+    
+    async def stream(
+        self,
+        search: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        sort_by: str = "created_at",
+        sort_order: str = "desc",
+        search_mode: str = "contains",
+        tag_match: str = "all",
+        batch_size: int = 1000
+    ) -> AsyncIterator[Sequence[Row]]:
+        """
+        Every matching contact in listing order, read through a server-side
+        cursor and yielded ``batch_size`` plain rows at a time.
+        """
+        stmt = self.filtered(search, tags, search_mode, tag_match).with_only_columns(*_RECORD_COLUMNS)
+        sort_column = getattr(Contact, sort_by)
+        if sort_order == "desc":
+            stmt = stmt.order_by(sort_column.desc(), Contact.id.desc())
+        else:
+            stmt = stmt.order_by(sort_column.asc(), Contact.id.asc())
+        
+        result = await self.db.stream(stmt.execution_options(yield_per=batch_size))
+        async for partition in result.partitions():
+            yield partition
+    
+    def selected(
+        self,
+        ids: Optional[List[UUID]] = None,
+        search: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        search_mode: str = "contains",
+        tag_match: str = "all"
+    ) -> Select:
+        """Like ``filtered``, optionally narrowed to explicit contact ids."""
+        stmt = self.filtered(search, tags, search_mode, tag_match)
+        if ids is not None:
+            stmt = stmt.where(Contact.id == func.any(literal(ids, ARRAY(PG_UUID(as_uuid=True)))))
+        return stmt
+    
+    @staticmethod
+    def tag_edit(add: List[str], remove: List[str]):
+        """SQL expression for the tags column with ``remove`` dropped and ``add`` appended once."""
+        tags = Contact.tags.op("-", return_type=JSONB)(literal(remove + add, ARRAY(Text)))
+        if add:
+            tags = tags.op("||", return_type=JSONB)(literal(add, JSONB))
+        return tags
+    
+    async def update_returning(
+        self,
+        targets: Select,
+        values: Dict[str, Any],
+        updated_by: UUID,
+        after_id: Optional[UUID],
+        limit: int
+    ) -> List[Row]:
+        """
+        Apply ``values`` to the next ``limit`` targeted contacts, in id order
+        after ``after_id``, with a single UPDATE.
+        
+        Contacts the change would not alter are skipped. Each returned row has
+        the contact id, the new value of every changed column and its previous
+        value as ``old_<column>``.
+        """
+        columns = [getattr(Contact, field) for field in values]
+        old = (
+            targets.with_only_columns(Contact.id, *columns)
+            .where(or_(*[column.is_distinct_from(values[column.key]) for column in columns]))
+        )
+        if after_id is not None:
+            old = old.where(Contact.id > after_id)
+        old = old.order_by(Contact.id).limit(limit).with_for_update().subquery("old")
+        
+        stmt = (
+            update(Contact)
+            .where(Contact.id == old.c.id)
+            .values(**values, updated_by=updated_by)
+            .returning(
+                Contact.id,
+                *columns,
+                *[old.c[column.key].label(f"old_{column.key}") for column in columns]
+            )
+        )
+        result = await self.db.execute(stmt)
+        return result.all()
+    
+    async def delete_returning(self, targets: Select, limit: int) -> List[Row]:
+        """Delete up to ``limit`` targeted contacts with one statement and return their rows."""
+        doomed = targets.with_only_columns(Contact.id).order_by(Contact.id).limit(limit).with_for_update()
+        stmt = delete(Contact).where(Contact.id.in_(doomed)).returning(*_RECORD_COLUMNS)
+        result = await self.db.execute(stmt)
+        return result.all()
+    
+    async def tag_counts(self, prefix: Optional[str] = None, limit: int = 100) -> List[tuple[str, int]]:
+        """Most used tags with their contact counts, read from the trigger-maintained summary."""
+        stmt = select(ContactTagCount.tag, ContactTagCount.count).where(
+            ContactTagCount.tenant_id == self.tenant_id,
+            ContactTagCount.count > 0
+        )
+        if prefix:
+            stmt = stmt.where(ContactTagCount.tag.startswith(prefix, autoescape=True))
+        stmt = stmt.order_by(ContactTagCount.count.desc(), ContactTagCount.tag).limit(limit)
+        
+        result = await self.db.execute(stmt)
+        return [(tag, count) for tag, count in result.all()]
+    
+    @staticmethod
+    def _after(column, value, last_id: UUID, descending: bool):
+        """
+        Rows strictly after (value, last_id) in the listing order.
+        
+        Postgres sorts NULLs last ascending and first descending, so nullable
+        sort columns need explicit branches around the row comparison.
+        """
+        if descending:
+            if value is None:
+                return or_(and_(column.is_(None), Contact.id < last_id), column.is_not(None))
+            return tuple_(column, Contact.id) < tuple_(value, last_id)
+        
+        if value is None:
+            return and_(column.is_(None), Contact.id > last_id)
+        after = tuple_(column, Contact.id) > tuple_(value, last_id)
+        if column.nullable:
+            return or_(after, column.is_(None))
+        return after
     
     async def update(self, contact: Contact, contact_data: ContactUpdate, updated_by: UUID) -> Contact:
-        update_data = contact_data.model_dump(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(contact, field, value)
-        contact.updated_by = updated_by
-        
-        await self.db.commit()
-        await self.db.refresh(contact)
-        return contact
-    
-    async def delete(self, contact: Contact) -> None:
-        await self.db.delete(contact)
-        await self.db.commit()
\ No newline at end of file
+        """UPDATE ... RETURNING the changed contact, refreshed in place; the caller commits."""
+        stmt = (
+            update(Contact)
+            .where(Contact.id == contact.id, Contact.tenant_id == self.tenant_id)
+            .values(**contact_data.model_dump(exclude_unset=True), updated_by=updated_by)
+            .returning(Contact)
+            .execution_options(populate_existing=True)
+        )
+        result = await self.db.execute(stmt)
+        return result.scalar_one()
+    
+    async def delete(self, contact_id: UUID) -> Optional[Row]:
+        """DELETE ... RETURNING the removed row, or None if there was none; the caller commits."""
+        stmt = (
+            delete(Contact)
+            .where(Contact.id == contact_id, Contact.tenant_id == self.tenant_id)
+            .returning(*_RECORD_COLUMNS)
+        )
+        result = await self.db.execute(stmt)
+        return result.one_or_none()
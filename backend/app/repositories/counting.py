@@ -0,0 +1,41 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, func
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import ClauseElement, Executable, Select
+from typing import Optional
+import json
+
+# exact: count(*) over the filtered query
+# estimated: the planner's row estimate for the filtered query
+# none: no total; callers report has_more from a page_size + 1 fetch
+COUNT_MODES = ("exact", "estimated", "none")
+
+
+class explain(Executable, ClauseElement):
+    """EXPLAIN (FORMAT JSON) wrapper that keeps the inner statement's bind parameters."""
+
+    inherit_cache = False
+
+    def __init__(self, statement: Select):
+        self.statement = statement
+
+
+@compiles(explain, "postgresql")
+def _compile_explain(element, compiler, **kw):
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+
+
+async def count_rows(db: AsyncSession, stmt: Select, mode: str = "exact") -> Optional[int]:
+    """Total rows matched by ``stmt`` according to the requested count mode."""
+    if mode == "none":
+        return None
+
+    if mode == "estimated":
+        result = await db.execute(explain(stmt))
+        plan = result.scalar()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"])
+
+    result = await db.execute(select(func.count()).select_from(stmt.subquery()))
+    return result.scalar()
@@ -0,0 +1,71 @@
+from dataclasses import dataclass, field
+from typing import Any, List, Optional
+from uuid import UUID
+from datetime import datetime
+import base64
+import json
+
+
+@dataclass
+class Page:
+    items: List[Any] = field(default_factory=list)
+    total: Optional[int] = None
+    has_more: bool = False
+    next_cursor: Optional[str] = None
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+def encode_cursor(sort_by: str, sort_order: str, value: Any, row_id: UUID) -> str:
+    """Encode the position after a row as an opaque, URL-safe cursor."""
+    is_datetime = isinstance(value, datetime)
+    data = {
+        "s": sort_by,
+        "o": sort_order,
+        "v": value.isoformat() if is_datetime else value,
+        "d": is_datetime,
+        "id": str(row_id),
+    }
+    raw = json.dumps(data, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, sort_by: str, sort_order: str, column) -> tuple[Optional[Any], UUID]:
+    """
+    Decode a cursor into (sort value, id). The value is checked against the
+    sort ``column``'s type, so a tampered cursor never reaches the database.
+
+    Raises:
+        InvalidCursor: If the cursor is malformed or was issued for a different sort
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        data = json.loads(raw)
+        sort = (data["s"], data["o"])
+        value = data["v"]
+        row_id = UUID(data["id"])
+    except (ValueError, KeyError, TypeError):
+        raise InvalidCursor("Invalid cursor")
+
+    if sort != (sort_by, sort_order):
+        raise InvalidCursor("Cursor does not match the requested sort order")
+    return _sort_value(value, column), row_id
+
+
+def _sort_value(value: Any, column) -> Optional[Any]:
+    if value is None:
+        if not column.nullable:
+            raise InvalidCursor("Invalid cursor")
+        return None
+    if not isinstance(value, str):
+        raise InvalidCursor("Invalid cursor")
+    if column.type.python_type is datetime:
+        try:
+            value = datetime.fromisoformat(value)
+        except ValueError:
+            raise InvalidCursor("Invalid cursor")
+        if value.tzinfo is None:
+            raise InvalidCursor("Invalid cursor")
+    return value
@@ -1,14 +1,16 @@
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
+from sqlalchemy import select
 from typing import Optional
 from uuid import UUID
 
 from app.core.database import get_db
 from app.core.dependencies import get_current_user
-from app.models.user import User
+from app.core.user_cache import AuthenticatedUser
 from app.models.audit import AuditLog
-from app.schemas.audit import AuditLogResponse, AuditLogListResponse
+from app.repositories.counting import count_rows
+from app.schemas.audit import AuditLogListResponse
+from app.services.audit_service import AuditService
 
 router = APIRouter(prefix="/audit", tags=["audit"])
 
@@ -19,7 +21,8 @@ async def get_audit_logs(
     entity_type: Optional[str] = Query(None),
     entity_id: Optional[UUID] = Query(None),
     action: Optional[str] = Query(None),
-    user: User = Depends(get_current_user),
+    count: str = Query("exact", pattern="^(exact|estimated|none)$"),
+    user: AuthenticatedUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
     stmt = select(AuditLog).where(AuditLog.tenant_id == user.tenant_id)
@@ -31,12 +34,10 @@ async def get_audit_logs(
     if action:
         stmt = stmt.where(AuditLog.action == action)
     
-    count_stmt = select(func.count()).select_from(stmt.subquery())
-    total_result = await db.execute(count_stmt)
-    total = total_result.scalar()
+    total = await count_rows(db, stmt, count)
     
     stmt = stmt.order_by(AuditLog.timestamp.desc())
-    stmt = stmt.offset((page - 1) * page_size).limit(page_size)
+    stmt = stmt.offset((page - 1) * page_size).limit(page_size + 1)
     
     result = await db.execute(stmt)
     logs = result.scalars().all()
@@ -45,5 +46,6 @@ async def get_audit_logs(
         total=total,
         page=page,
         page_size=page_size,
-        logs=[AuditLogResponse.model_validate(log) for log in logs]
+        has_more=len(logs) > page_size,
+        logs=await AuditService(db, user.tenant_id).with_states(logs[:page_size])
     )
\ No newline at end of file
@@ -7,9 +7,12 @@ from typing import Optional
 import re
 
 from app.core.database import get_db
-from app.core.dependencies import get_current_user
+from app.core.dependencies import get_current_user, get_current_user_firebase, get_firebase_token
+from app.core.sessions import create_session, get_session_id, revoke_session, revoke_user_sessions
+from app.core.user_cache import AuthenticatedUser, invalidate_user_snapshot
 from app.models.user import User
 from app.models.tenant import Tenant
+from app.schemas.auth import TokenResponse
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
@@ -34,7 +37,7 @@ class UpdateProfileRequest(BaseModel):
 
 @router.get("/me", response_model=UserResponse)
 async def get_current_user_info(
-    user: User = Depends(get_current_user),
+    user: AuthenticatedUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
     """Get current authenticated user info."""
@@ -52,10 +55,11 @@ async def get_current_user_info(
 @router.put("/me", response_model=UserResponse)
 async def update_profile(
     request: UpdateProfileRequest,
-    user: User = Depends(get_current_user),
+    user: AuthenticatedUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
     """Update current user's profile."""
+    user = await db.get(User, user.id)
     if request.name is not None:
         user.name = request.name
     if request.phone is not None:
@@ -64,6 +68,7 @@ async def update_profile(
     user.updated_at = datetime.now(timezone.utc)
     await db.commit()
     await db.refresh(user)
+    invalidate_user_snapshot(user.firebase_uid)
     
     return UserResponse(
         id=str(user.id),
@@ -76,22 +81,70 @@ async def update_profile(
     )
 
 
+@router.post("/session", response_model=TokenResponse)
+async def create_session_token(
+    user: AuthenticatedUser = Depends(get_current_user_firebase),
+    db: AsyncSession = Depends(get_db)
+):
+    """Exchange a verified Firebase ID token for a short-lived session token."""
+    token, expires_in = await create_session(db, user)
+    return TokenResponse(access_token=token, expires_in=expires_in)
+
+
+@router.delete("/session")
+async def revoke_current_session(
+    token: Optional[str] = Depends(get_firebase_token),
+    db: AsyncSession = Depends(get_db)
+):
+    """Revoke the session token used for this request."""
+    session_id = get_session_id(token) if token else None
+    if not session_id:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Request is not authenticated with a session token"
+        )
+    await revoke_session(db, session_id)
+    return {"message": "Session revoked"}
+
+
+@router.post("/sessions/revoke")
+async def revoke_all_sessions(
+    user: AuthenticatedUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """Revoke every session token issued to the current user."""
+    await revoke_user_sessions(db, user.id)
+    return {"message": "All sessions revoked"}
+
+
 @router.post("/logout")
-async def logout(response: Response):
+async def logout(
+    response: Response,
+    token: Optional[str] = Depends(get_firebase_token),
+    db: AsyncSession = Depends(get_db)
+):
     """Logout - clears any server-side session data."""
+    session_id = get_session_id(token) if token else None
+    if session_id:
+        await revoke_session(db, session_id)
     response.delete_cookie("session_token", path="/")
     return {"message": "Logged out successfully"}
 
 
 @router.post("/setup-tenant")
 async def setup_tenant(
-    user: User = Depends(get_current_user),
+    user: AuthenticatedUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
     """Create a tenant for the user if they don't have one."""
     if user.tenant_id:
         return {"message": "Tenant already exists", "tenant_id": str(user.tenant_id)}
     
+    user = await db.get(User, user.id)
+    if user.tenant_id:
+        invalidate_user_snapshot(user.firebase_uid)
+        return {"message": "Tenant already exists", "tenant_id": str(user.tenant_id)}
+    
     # Create tenant from user email
     slug = re.sub(r'[^a-z0-9]+', '-', user.email.split('@')[0].lower()).strip('-')
     
@@ -113,5 +166,8 @@ async def setup_tenant(
     user.tenant_id = tenant.id
     user.role = 'admin'  # First user of a tenant is admin
     await db.commit()
+    invalidate_user_snapshot(user.firebase_uid)
+    # Existing session tokens carry the old tenant and role claims
+    await revoke_user_sessions(db, user.id)
     
     return {"message": "Tenant created", "tenant_id": str(tenant.id)}
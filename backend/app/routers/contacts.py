@@ -1,51 +1,126 @@
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, File, Query, UploadFile
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import Optional
+from typing import List, Optional
 from uuid import UUID
 
 from app.core.database import get_db
 from app.core.dependencies import get_current_user, require_permission
-from app.models.user import User
-from app.schemas.contact import ContactCreate, ContactUpdate, ContactResponse, ContactListResponse
+from app.core.user_cache import AuthenticatedUser
+from app.schemas.contact import (
+    ContactCreate, ContactUpdate, ContactResponse, ContactListResponse, TagCountListResponse,
+    ContactImportResponse, ContactBulkUpdate, ContactBulkDelete, ContactBulkResponse
+)
 from app.services.contact_service import ContactService
+from app.services.contact_import_service import ContactImportService
+from app.services.contact_export_service import ContactExportService
 
 router = APIRouter(prefix="/contacts", tags=["contacts"])
 
 @router.post("", response_model=ContactResponse, dependencies=[Depends(require_permission("contacts.create"))])
 async def create_contact(
     contact_data: ContactCreate,
-    user: User = Depends(get_current_user),
+    user: AuthenticatedUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
     service = ContactService(db, user.tenant_id)
     return await service.create_contact(contact_data, user.id)
 
+@router.post("/import", response_model=ContactImportResponse, dependencies=[Depends(require_permission("contacts.create"))])
+async def import_contacts(
+    file: UploadFile = File(...),
+    format: Optional[str] = Query(None, pattern="^(csv|ndjson)$"),
+    user: AuthenticatedUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Import contacts from a CSV (header row with first_name, last_name, email,
+    phone, company, tags) or NDJSON upload. The format defaults from the
+    file name. Returns counts and the first row errors.
+    """
+    service = ContactImportService(db, user.tenant_id)
+    return await service.import_file(file, format, user.id)
+
+@router.post("/bulk-update", response_model=ContactBulkResponse, dependencies=[Depends(require_permission("contacts.update"))])
+async def bulk_update_contacts(
+    request: ContactBulkUpdate,
+    user: AuthenticatedUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    service = ContactService(db, user.tenant_id)
+    return await service.bulk_update(request, user.id)
+
+@router.post("/bulk-delete", response_model=ContactBulkResponse, dependencies=[Depends(require_permission("contacts.delete"))])
+async def bulk_delete_contacts(
+    request: ContactBulkDelete,
+    user: AuthenticatedUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    service = ContactService(db, user.tenant_id)
+    return await service.bulk_delete(request, user.id)
+
 @router.get("", response_model=ContactListResponse, dependencies=[Depends(require_permission("contacts.read"))])
 async def list_contacts(
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
     search: Optional[str] = Query(None),
-    tag: Optional[str] = Query(None),
+    tag: Optional[List[str]] = Query(None),
+    tag_match: str = Query("all", pattern="^(all|any)$"),
     sort_by: str = Query("created_at"),
-    sort_order: str = Query("desc"),
-    user: User = Depends(get_current_user),
+    sort_order: str = Query("desc", pattern="^(asc|desc)$"),
+    cursor: Optional[str] = Query(None),
+    count: str = Query("exact", pattern="^(exact|estimated|none)$"),
+    search_mode: str = Query("contains", pattern="^(contains|ranked)$"),
+    user: AuthenticatedUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
     service = ContactService(db, user.tenant_id)
-    contacts, total = await service.list_contacts(
-        page, page_size, search, tag, sort_by, sort_order
+    result = await service.list_contacts(
+        page, page_size, search, tag, sort_by, sort_order, cursor, count, search_mode, tag_match
     )
     return ContactListResponse(
-        total=total,
+        total=result.total,
         page=page,
         page_size=page_size,
-        contacts=contacts
+        has_more=result.has_more,
+        contacts=result.items,
+        next_cursor=result.next_cursor
+    )
+
+@router.get("/export", dependencies=[Depends(require_permission("contacts.read"))])
+async def export_contacts(
+    format: str = Query("csv", pattern="^(csv|ndjson)$"),
+    gzip: bool = Query(False),
+    search: Optional[str] = Query(None),
+    search_mode: str = Query("contains", pattern="^(contains|ranked)$"),
+    tag: Optional[List[str]] = Query(None),
+    tag_match: str = Query("all", pattern="^(all|any)$"),
+    sort_by: str = Query("created_at"),
+    sort_order: str = Query("desc", pattern="^(asc|desc)$"),
+    user: AuthenticatedUser = Depends(get_current_user)
+):
+    service = ContactExportService(user.tenant_id)
+    body = service.export(format, gzip, search, tag, sort_by, sort_order, search_mode, tag_match)
+    return StreamingResponse(
+        body,
+        media_type=service.media_type(format, gzip),
+        headers={"Content-Disposition": f'attachment; filename="{service.filename(format, gzip)}"'}
     )
 
+@router.get("/tags", response_model=TagCountListResponse, dependencies=[Depends(require_permission("contacts.read"))])
+async def list_contact_tags(
+    prefix: Optional[str] = Query(None),
+    limit: int = Query(100, ge=1, le=500),
+    user: AuthenticatedUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    service = ContactService(db, user.tenant_id)
+    return TagCountListResponse(tags=await service.list_tags(prefix, limit))
+
 @router.get("/{contact_id}", response_model=ContactResponse, dependencies=[Depends(require_permission("contacts.read"))])
 async def get_contact(
     contact_id: UUID,
-    user: User = Depends(get_current_user),
+    user: AuthenticatedUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
     service = ContactService(db, user.tenant_id)
@@ -55,7 +130,7 @@ async def get_contact(
 async def update_contact(
     contact_id: UUID,
     contact_data: ContactUpdate,
-    user: User = Depends(get_current_user),
+    user: AuthenticatedUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
     service = ContactService(db, user.tenant_id)
@@ -64,7 +139,7 @@ async def update_contact(
 @router.delete("/{contact_id}", dependencies=[Depends(require_permission("contacts.delete"))])
 async def delete_contact(
     contact_id: UUID,
-    user: User = Depends(get_current_user),
+    user: AuthenticatedUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
     service = ContactService(db, user.tenant_id)
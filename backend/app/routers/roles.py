@@ -0,0 +1,70 @@
+from fastapi import APIRouter, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+from uuid import UUID
+
+from app.core.database import get_db
+from app.core.dependencies import get_current_user, require_permission
+from app.core.user_cache import AuthenticatedUser
+from app.schemas.role import RoleCreate, RolePermissionsUpdate, RoleResponse
+from app.services.role_service import RoleService
+
+router = APIRouter(prefix="/roles", tags=["roles"])
+
+@router.get("", response_model=list[RoleResponse], dependencies=[Depends(require_permission("roles.read"))])
+async def list_roles(
+    user: AuthenticatedUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    service = RoleService(db, user.tenant_id)
+    return await service.list_roles()
+
+@router.post("", response_model=RoleResponse, dependencies=[Depends(require_permission("roles.manage"))])
+async def create_role(
+    role_data: RoleCreate,
+    user: AuthenticatedUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    service = RoleService(db, user.tenant_id)
+    return await service.create_role(role_data)
+
+@router.put("/{role_id}/permissions", response_model=RoleResponse, dependencies=[Depends(require_permission("roles.manage"))])
+async def set_role_permissions(
+    role_id: UUID,
+    permissions_data: RolePermissionsUpdate,
+    user: AuthenticatedUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    service = RoleService(db, user.tenant_id)
+    return await service.set_permissions(role_id, permissions_data.permissions)
+
+@router.delete("/{role_id}", dependencies=[Depends(require_permission("roles.manage"))])
+async def delete_role(
+    role_id: UUID,
+    user: AuthenticatedUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    service = RoleService(db, user.tenant_id)
+    await service.delete_role(role_id)
+    return {"message": "Role deleted successfully"}
+
+@router.put("/{role_id}/users/{user_id}", dependencies=[Depends(require_permission("roles.manage"))])
+async def assign_role(
+    role_id: UUID,
+    user_id: UUID,
+    user: AuthenticatedUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    service = RoleService(db, user.tenant_id)
+    await service.assign_user(role_id, user_id)
+    return {"message": "Role assigned successfully"}
+
+@router.delete("/{role_id}/users/{user_id}", dependencies=[Depends(require_permission("roles.manage"))])
+async def unassign_role(
+    role_id: UUID,
+    user_id: UUID,
+    user: AuthenticatedUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    service = RoleService(db, user.tenant_id)
+    await service.unassign_user(role_id, user_id)
+    return {"message": "Role unassigned successfully"}
@@ -3,67 +3,31 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from typing import Optional, Dict, Any
 from uuid import UUID
-import json
 
+from app.core.config import settings
 from app.core.database import get_db
-from app.core.dependencies import get_current_user
-from app.models.user import User
-from app.models.tenant import Tenant
-from app.models.webhook import WebhookSubscription
+from app.core.dependencies import get_current_user, require_permission
+from app.core.user_cache import AuthenticatedUser
+from app.core.webhook_index import bump_webhooks_version
+from app.core.webhook_keys import verify_webhook_api_key, rotate_webhook_api_key
+from app.models.webhook import WebhookSubscription, WebhookTargetHealth
 from app.schemas.webhook import (
     WebhookSubscriptionCreate,
     WebhookSubscriptionUpdate,
     WebhookSubscriptionResponse,
-    IntegrationEventResponse
+    WebhookTargetHealthResponse,
+    InboundEventsAccepted,
+    WebhookApiKeyResponse
 )
 from app.services.webhook_service import WebhookService
 from app.core.security import verify_webhook_signature, generate_webhook_secret
 
 router = APIRouter(prefix="/webhooks", tags=["webhooks"])
 
-@router.post("/{event_name}")
-async def inbound_webhook(
-    event_name: str,
-    request: Request,
-    db: AsyncSession = Depends(get_db),
-    x_tenant_id: Optional[str] = Header(None),
-    x_api_key: Optional[str] = Header(None)
-):
-    if not x_tenant_id or not x_api_key:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Missing tenant ID or API key"
-        )
-    
-    try:
-        tenant_id = UUID(x_tenant_id)
-    except ValueError:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid tenant ID format"
-        )
-    
-    stmt = select(Tenant).where(Tenant.id == tenant_id)
-    result = await db.execute(stmt)
-    tenant = result.scalar_one_or_none()
-    
-    if not tenant or tenant.webhook_api_key != x_api_key:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid tenant or API key"
-        )
-    
-    payload = await request.json()
-    
-    webhook_service = WebhookService(db, tenant_id)
-    event = await webhook_service.store_inbound_event(event_name, payload)
-    
-    return IntegrationEventResponse.model_validate(event)
-
 @router.post("/subscriptions", response_model=WebhookSubscriptionResponse)
 async def create_webhook_subscription(
     subscription_data: WebhookSubscriptionCreate,
-    user: User = Depends(get_current_user),
+    user: AuthenticatedUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
     subscription = WebhookSubscription(
@@ -72,29 +36,34 @@ async def create_webhook_subscription(
         secret=generate_webhook_secret()
     )
     db.add(subscription)
+    await bump_webhooks_version(db, user.tenant_id)
     await db.commit()
     await db.refresh(subscription)
     return WebhookSubscriptionResponse.model_validate(subscription)
 
 @router.get("/subscriptions", response_model=list[WebhookSubscriptionResponse])
 async def list_webhook_subscriptions(
-    user: User = Depends(get_current_user),
+    user: AuthenticatedUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
-    stmt = select(WebhookSubscription).where(
-        WebhookSubscription.tenant_id == user.tenant_id
+    stmt = (
+        select(WebhookSubscription, WebhookTargetHealth)
+        .outerjoin(WebhookTargetHealth, WebhookTargetHealth.target_url == WebhookSubscription.target_url)
+        .where(WebhookSubscription.tenant_id == user.tenant_id)
     )
     result = await db.execute(stmt)
-    subscriptions = result.scalars().all()
     return [
-        WebhookSubscriptionResponse.model_validate(sub)
-        for sub in subscriptions
+        WebhookSubscriptionResponse.model_validate(sub).model_copy(update={
+            # No health row means the target has never failed
+            "health": WebhookTargetHealthResponse.model_validate(health) if health else WebhookTargetHealthResponse()
+        })
+        for sub, health in result.all()
     ]
 
 @router.delete("/subscriptions/{subscription_id}")
 async def delete_webhook_subscription(
     subscription_id: UUID,
-    user: User = Depends(get_current_user),
+    user: AuthenticatedUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
     stmt = select(WebhookSubscription).where(
@@ -111,5 +80,78 @@ async def delete_webhook_subscription(
         )
     
     await db.delete(subscription)
+    await bump_webhooks_version(db, user.tenant_id)
     await db.commit()
-    return {"message": "Subscription deleted successfully"}
\ No newline at end of file
+    return {"message": "Subscription deleted successfully"}
+
+@router.post(
+    "/api-key/rotate",
+    response_model=WebhookApiKeyResponse,
+    dependencies=[Depends(require_permission("webhooks.manage"))]
+)
+async def rotate_inbound_api_key(
+    user: AuthenticatedUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """Issue a new inbound webhook API key for the caller's tenant; the old one stops working."""
+    api_key = await rotate_webhook_api_key(db, user.tenant_id)
+    return WebhookApiKeyResponse(tenant_id=user.tenant_id, api_key=api_key)
+
+async def _read_body(request: Request, limit: int) -> bytes:
+    """Read the request body, refusing anything larger than ``limit`` bytes."""
+    too_large = HTTPException(
+        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+        detail=f"Body exceeds {limit} bytes"
+    )
+    declared = request.headers.get("content-length")
+    if declared and declared.isdigit() and int(declared) > limit:
+        raise too_large
+    
+    body = bytearray()
+    async for chunk in request.stream():
+        body += chunk
+        if len(body) > limit:
+            raise too_large
+    return bytes(body)
+
+# Registered last so the catch-all path doesn't shadow /subscriptions
+@router.post(
+    "/{event_name}",
+    status_code=status.HTTP_202_ACCEPTED,
+    response_model=InboundEventsAccepted
+)
+async def inbound_webhook(
+    event_name: str,
+    request: Request,
+    db: AsyncSession = Depends(get_db),
+    x_tenant_id: Optional[str] = Header(None),
+    x_api_key: Optional[str] = Header(None)
+):
+    """
+    Accept one event (a JSON object) or many (an array of objects). Events
+    are buffered and written in batches, so a 202 means queued, not stored;
+    a 429 means the buffer is full and the request should be retried.
+    """
+    if not x_tenant_id or not x_api_key:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Missing tenant ID or API key"
+        )
+    
+    try:
+        tenant_id = UUID(x_tenant_id)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid tenant ID format"
+        )
+    
+    if not await verify_webhook_api_key(db, tenant_id, x_api_key):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid tenant or API key"
+        )
+    
+    body = await _read_body(request, settings.INBOUND_WEBHOOK_MAX_BODY_BYTES)
+    webhook_service = WebhookService(db, tenant_id)
+    return webhook_service.queue_inbound_events(event_name, body)
\ No newline at end of file
@@ -18,7 +18,8 @@ class AuditLogResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 class AuditLogListResponse(BaseModel):
-    total: int
+    total: Optional[int] = None
     page: int
     page_size: int
+    has_more: bool = False
     logs: list[AuditLogResponse]
\ No newline at end of file
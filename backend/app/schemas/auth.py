@@ -8,6 +8,7 @@ class GoogleAuthRequest(BaseModel):
 class TokenResponse(BaseModel):
     access_token: str
     token_type: str = "bearer"
+    expires_in: Optional[int] = None
 
 class SessionDataResponse(BaseModel):
     id: UUID
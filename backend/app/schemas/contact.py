@@ -1,25 +1,25 @@
-from pydantic import BaseModel, EmailStr, ConfigDict
-from typing import Optional, List
+from pydantic import BaseModel, EmailStr, ConfigDict, Field
+from typing import Literal, Optional, List
 from datetime import datetime
 from uuid import UUID
 
 class ContactBase(BaseModel):
-    first_name: str
-    last_name: str
+    first_name: str = Field(max_length=100)
+    last_name: str = Field(max_length=100)
     email: EmailStr
-    phone: Optional[str] = None
-    company: Optional[str] = None
+    phone: Optional[str] = Field(default=None, max_length=50)
+    company: Optional[str] = Field(default=None, max_length=255)
     tags: List[str] = []
 
 class ContactCreate(ContactBase):
     pass
 
 class ContactUpdate(BaseModel):
-    first_name: Optional[str] = None
-    last_name: Optional[str] = None
+    first_name: Optional[str] = Field(default=None, max_length=100)
+    last_name: Optional[str] = Field(default=None, max_length=100)
     email: Optional[EmailStr] = None
-    phone: Optional[str] = None
-    company: Optional[str] = None
+    phone: Optional[str] = Field(default=None, max_length=50)
+    company: Optional[str] = Field(default=None, max_length=255)
     tags: Optional[List[str]] = None
 
 class ContactResponse(ContactBase):
@@ -33,7 +33,56 @@ class ContactResponse(ContactBase):
     model_config = ConfigDict(from_attributes=True)
 
 class ContactListResponse(BaseModel):
-    total: int
+    total: Optional[int] = None
     page: int
     page_size: int
-    contacts: List[ContactResponse]
\ No newline at end of file
+    has_more: bool = False
+    contacts: List[ContactResponse]
+    next_cursor: Optional[str] = None
+
+class TagCount(BaseModel):
+    tag: str
+    count: int
+
+class TagCountListResponse(BaseModel):
+    tags: List[TagCount]
+
+class ContactImportError(BaseModel):
+    row: int
+    email: Optional[str] = None
+    error: str
+
+class ContactImportResponse(BaseModel):
+    import_id: UUID
+    processed: int = 0
+    imported: int = 0
+    duplicates: int = 0
+    invalid: int = 0
+    chunks: int = 0
+    errors: List[ContactImportError] = []
+    errors_truncated: bool = False
+
+class ContactSelector(BaseModel):
+    """Contacts targeted by a bulk operation: explicit ids, or the listing filters."""
+    ids: Optional[List[UUID]] = None
+    search: Optional[str] = None
+    search_mode: Literal["contains", "ranked"] = "contains"
+    tags: Optional[List[str]] = None
+    tag_match: Literal["all", "any"] = "all"
+
+class ContactBulkChanges(BaseModel):
+    phone: Optional[str] = Field(default=None, max_length=50)
+    company: Optional[str] = Field(default=None, max_length=255)
+    tags: Optional[List[str]] = None
+    add_tags: List[str] = []
+    remove_tags: List[str] = []
+
+class ContactBulkUpdate(ContactSelector):
+    changes: ContactBulkChanges
+
+class ContactBulkDelete(ContactSelector):
+    pass
+
+class ContactBulkResponse(BaseModel):
+    affected: int = 0
+    chunks: int = 0
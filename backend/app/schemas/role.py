@@ -0,0 +1,23 @@
+from pydantic import BaseModel, ConfigDict
+from typing import Optional, List
+from datetime import datetime
+from uuid import UUID
+
+class RoleBase(BaseModel):
+    name: str
+    description: Optional[str] = None
+
+class RoleCreate(RoleBase):
+    permissions: List[str] = []
+
+class RolePermissionsUpdate(BaseModel):
+    permissions: List[str]
+
+class RoleResponse(RoleBase):
+    id: UUID
+    tenant_id: UUID
+    permissions: List[str] = []
+    created_at: datetime
+    updated_at: datetime
+    
+    model_config = ConfigDict(from_attributes=True)
@@ -1,5 +1,5 @@
-from pydantic import BaseModel, ConfigDict, HttpUrl
-from typing import Optional, Any, Dict
+from pydantic import BaseModel, ConfigDict, Field, HttpUrl
+from typing import Optional, Any, Dict, List
 from datetime import datetime
 from uuid import UUID
 
@@ -7,6 +7,9 @@ class WebhookSubscriptionBase(BaseModel):
     event_name: str
     target_url: str
     enabled: bool = True
+    batch_enabled: bool = False
+    batch_max_size: int = Field(default=100, ge=1, le=1000)
+    batch_max_wait_seconds: int = Field(default=10, ge=1, le=3600)
 
 class WebhookSubscriptionCreate(WebhookSubscriptionBase):
     pass
@@ -14,12 +17,27 @@ class WebhookSubscriptionCreate(WebhookSubscriptionBase):
 class WebhookSubscriptionUpdate(BaseModel):
     target_url: Optional[str] = None
     enabled: Optional[bool] = None
+    batch_enabled: Optional[bool] = None
+    batch_max_size: Optional[int] = Field(default=None, ge=1, le=1000)
+    batch_max_wait_seconds: Optional[int] = Field(default=None, ge=1, le=3600)
+
+class WebhookTargetHealthResponse(BaseModel):
+    state: str = "closed"
+    consecutive_failures: int = 0
+    retry_at: Optional[datetime] = None
+    last_error: Optional[str] = None
+    last_failure_at: Optional[datetime] = None
+    last_success_at: Optional[datetime] = None
+    
+    model_config = ConfigDict(from_attributes=True)
 
 class WebhookSubscriptionResponse(WebhookSubscriptionBase):
     id: UUID
     tenant_id: UUID
     created_at: datetime
     updated_at: datetime
+    # Delivery health of target_url; filled in by the list endpoint
+    health: Optional[WebhookTargetHealthResponse] = None
     
     model_config = ConfigDict(from_attributes=True)
 
@@ -33,4 +51,12 @@ class IntegrationEventResponse(BaseModel):
     processed_at: Optional[datetime] = None
     error_message: Optional[str] = None
     
-    model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True)
+
+class InboundEventsAccepted(BaseModel):
+    accepted: int
+    event_ids: List[UUID]
+
+class WebhookApiKeyResponse(BaseModel):
+    tenant_id: UUID
+    api_key: str
@@ -1,14 +1,45 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import Optional, Dict, Any
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID, insert as pg_insert
+from sqlalchemy.orm import aliased
+from sqlalchemy import insert, select, func, and_, or_, case, values, column, String, DateTime
+from pydantic import BaseModel
+from pydantic_core import to_jsonable_python
+from typing import Optional, Dict, Any, List, Sequence, Tuple
 from uuid import UUID
 from datetime import datetime, timezone
 
-from app.models.audit import AuditLog
+from app.core.config import settings
+from app.models.audit import AuditLog, AuditEntityCounter
+from app.schemas.audit import AuditLogResponse
+from app.services.audit_sink import audit_sink
+
+def _old_values(changes: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    return {field: change["old"] for field, change in (changes or {}).items()}
+
+def _new_values(changes: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    return {field: change["new"] for field, change in (changes or {}).items()}
 
 class AuditService:
-    def __init__(self, db: AsyncSession, tenant_id: UUID):
+    """
+    Writes audit records into the caller's transaction. Nothing is committed
+    here, so an entity change and its audit record commit or roll back together.
+    
+    With AUDIT_WRITE_MODE=batched, records are instead handed to the audit
+    sink once the caller's transaction commits. Pass ``inline=True`` where a
+    record must be durable together with the change regardless of the mode.
+    
+    With AUDIT_STORAGE_MODE=compact, updates store only their changed fields,
+    with raw old and new values, plus the entity's full state on every
+    AUDIT_SNAPSHOT_INTERVAL-th update; ``with_states`` rebuilds the rest.
+    Updates are counted per entity in the caller's transaction, whatever the
+    write mode, to decide when a snapshot is due.
+    """
+    
+    def __init__(self, db: AsyncSession, tenant_id: UUID, inline: Optional[bool] = None):
         self.db = db
         self.tenant_id = tenant_id
+        self.inline = settings.AUDIT_WRITE_MODE != "batched" if inline is None else inline
+        self.compact = settings.AUDIT_STORAGE_MODE == "compact"
     
     async def log_create(
         self,
@@ -17,47 +48,61 @@ class AuditService:
         after_data: Dict[str, Any],
         user_id: UUID
     ):
-        log = AuditLog(
-            tenant_id=self.tenant_id,
-            entity_type=entity_type,
-            entity_id=entity_id,
-            action="CREATE",
-            changed_by_user_id=user_id,
-            after_data=after_data,
-            timestamp=datetime.now(timezone.utc)
-        )
-        self.db.add(log)
-        await self.db.commit()
+        await self._write([{
+            "tenant_id": self.tenant_id,
+            "entity_type": entity_type,
+            "entity_id": entity_id,
+            "action": "CREATE",
+            "changed_by_user_id": user_id,
+            "after_data": after_data,
+            "snapshot": True,
+            "timestamp": datetime.now(timezone.utc)
+        }])
     
     async def log_update(
         self,
         entity_type: str,
         entity_id: UUID,
-        before_data: Dict[str, Any],
-        after_data: Dict[str, Any],
+        before: Dict[str, Any],
+        after: BaseModel,
         user_id: UUID
     ):
-        changes = {}
-        for key in after_data.keys():
-            if key in before_data and before_data[key] != after_data[key]:
-                changes[key] = {
-                    "old": str(before_data[key]),
-                    "new": str(after_data[key])
-                }
+        """
+        ``before`` holds the prior values of the fields the update may have
+        touched, as read off the entity, and ``after`` is the updated entity's
+        response model. Only changed fields are serialized, unless the full
+        state is stored.
+        """
+        changed = [field for field, value in before.items() if value != getattr(after, field)]
+        old = {field: to_jsonable_python(before[field]) for field in changed}
+        row = {
+            "tenant_id": self.tenant_id,
+            "entity_type": entity_type,
+            "entity_id": entity_id,
+            "action": "UPDATE",
+            "changed_by_user_id": user_id,
+            "timestamp": datetime.now(timezone.utc)
+        }
         
-        log = AuditLog(
-            tenant_id=self.tenant_id,
-            entity_type=entity_type,
-            entity_id=entity_id,
-            action="UPDATE",
-            changed_by_user_id=user_id,
-            before_data=before_data,
-            after_data=after_data,
-            changes=changes,
-            timestamp=datetime.now(timezone.utc)
-        )
-        self.db.add(log)
-        await self.db.commit()
+        if self.compact:
+            row["changes"] = {
+                field: {"old": old[field], "new": to_jsonable_python(getattr(after, field))}
+                for field in changed
+            }
+            if await self._snapshot_due(entity_type, entity_id):
+                row["after_data"] = after.model_dump(mode='json')
+                row["snapshot"] = True
+        else:
+            after_data = after.model_dump(mode='json')
+            row["before_data"] = {**after_data, **old}
+            row["after_data"] = after_data
+            row["changes"] = {
+                field: {"old": str(old[field]), "new": str(after_data[field])}
+                for field in changed
+            }
+            row["snapshot"] = True
+        
+        await self._write([row])
     
     async def log_delete(
         self,
@@ -66,14 +111,230 @@ class AuditService:
         before_data: Dict[str, Any],
         user_id: UUID
     ):
-        log = AuditLog(
-            tenant_id=self.tenant_id,
-            entity_type=entity_type,
-            entity_id=entity_id,
-            action="DELETE",
-            changed_by_user_id=user_id,
-            before_data=before_data,
-            timestamp=datetime.now(timezone.utc)
+        await self._write([{
+            "tenant_id": self.tenant_id,
+            "entity_type": entity_type,
+            "entity_id": entity_id,
+            "action": "DELETE",
+            "changed_by_user_id": user_id,
+            "before_data": before_data,
+            "timestamp": datetime.now(timezone.utc)
+        }])
+    
+    async def log_import(
+        self,
+        entity_type: str,
+        import_id: UUID,
+        after_data: Dict[str, Any],
+        user_id: UUID
+    ):
+        """One record for a whole chunk of imported rows, keyed by the import id."""
+        await self._write([{
+            "tenant_id": self.tenant_id,
+            "entity_type": entity_type,
+            "entity_id": import_id,
+            "action": "IMPORT",
+            "changed_by_user_id": user_id,
+            "after_data": after_data,
+            "timestamp": datetime.now(timezone.utc)
+        }])
+    
+    async def log_bulk(
+        self,
+        entity_type: str,
+        action: str,
+        entries: List[Dict[str, Any]],
+        user_id: UUID
+    ):
+        """
+        Write one record per entity with a single multi-row INSERT. Each entry
+        carries entity_id and any of before_data, after_data and changes.
+        """
+        if not entries:
+            return
+        if self.compact and action == "UPDATE":
+            entries = [
+                {
+                    "entity_id": entry["entity_id"],
+                    "changes": {
+                        field: {"old": entry["before_data"][field], "new": value}
+                        for field, value in entry["after_data"].items()
+                        if entry["before_data"][field] != value
+                    }
+                }
+                for entry in entries
+            ]
+            await self._count_bulk_updates(entity_type, [entry["entity_id"] for entry in entries])
+        timestamp = datetime.now(timezone.utc)
+        await self._write([
+            {
+                "tenant_id": self.tenant_id,
+                "entity_type": entity_type,
+                "action": action,
+                "changed_by_user_id": user_id,
+                "timestamp": timestamp,
+                **entry
+            }
+            for entry in entries
+        ])
+    
+    async def with_states(self, logs: Sequence[AuditLog]) -> List[AuditLogResponse]:
+        """
+        Responses for ``logs``, with the before and after state of compact
+        updates rebuilt: from the record itself when it holds a snapshot,
+        otherwise by replaying the entity's records since its nearest earlier
+        snapshot. Updates with no snapshot before them keep only their changes.
+        """
+        responses = [AuditLogResponse.model_validate(log) for log in logs]
+        deltas = {}
+        for response in responses:
+            if response.action != "UPDATE" or response.before_data is not None:
+                continue
+            if response.after_data is not None:
+                response.before_data = {**response.after_data, **_old_values(response.changes)}
+            else:
+                deltas[response.id] = response
+        
+        if deltas:
+            for log_id, (before, after) in (await self._replay(deltas.values())).items():
+                if log_id in deltas:
+                    deltas[log_id].before_data = before
+                    deltas[log_id].after_data = after
+        return responses
+    
+    async def _replay(
+        self,
+        deltas: Sequence[AuditLogResponse]
+    ) -> Dict[UUID, Tuple[Dict[str, Any], Dict[str, Any]]]:
+        """Before and after state of every update between each entity's base snapshot and its last delta."""
+        spans = {}
+        for delta in deltas:
+            key = (delta.entity_type, delta.entity_id)
+            first, last = spans.get(key, (delta.timestamp, delta.timestamp))
+            spans[key] = (min(first, delta.timestamp), max(last, delta.timestamp))
+        wanted = values(
+            column("entity_type", String),
+            column("entity_id", PG_UUID(as_uuid=True)),
+            column("first_at", DateTime(timezone=True)),
+            column("last_at", DateTime(timezone=True)),
+            name="wanted"
+        ).data([(*key, *span) for key, span in spans.items()])
+        
+        base = aliased(AuditLog)
+        base_at = (
+            select(func.max(base.timestamp))
+            .where(
+                base.tenant_id == self.tenant_id,
+                base.entity_type == wanted.c.entity_type,
+                base.entity_id == wanted.c.entity_id,
+                base.snapshot,
+                base.timestamp <= wanted.c.first_at
+            )
+            .correlate(wanted)
+            .scalar_subquery()
+        )
+        stmt = (
+            select(
+                AuditLog.id, AuditLog.entity_type, AuditLog.entity_id,
+                AuditLog.snapshot, AuditLog.after_data, AuditLog.changes
+            )
+            .join(wanted, and_(
+                AuditLog.entity_type == wanted.c.entity_type,
+                AuditLog.entity_id == wanted.c.entity_id
+            ))
+            .where(
+                AuditLog.tenant_id == self.tenant_id,
+                AuditLog.timestamp >= base_at,
+                AuditLog.timestamp <= wanted.c.last_at,
+                or_(AuditLog.snapshot, AuditLog.action == "UPDATE")
+            )
+            .order_by(AuditLog.entity_type, AuditLog.entity_id, AuditLog.timestamp, AuditLog.id)
         )
-        self.db.add(log)
-        await self.db.commit()
\ No newline at end of file
+        result = await self.db.execute(stmt)
+        
+        states = {}
+        rebuilt = {}
+        for row in result:
+            key = (row.entity_type, row.entity_id)
+            if row.snapshot:
+                states[key] = row.after_data
+                continue
+            before = states.get(key)
+            if before is None:
+                continue
+            # Full-mode bulk updates keep the changed fields' raw values in after_data
+            updates = row.after_data if row.after_data is not None else _new_values(row.changes)
+            states[key] = {**before, **updates}
+            rebuilt[row.id] = (before, states[key])
+        return rebuilt
+    
+    async def _snapshot_due(self, entity_type: str, entity_id: UUID) -> bool:
+        """
+        Count an update of the entity; true when it is the entity's first
+        counted update or the AUDIT_SNAPSHOT_INTERVAL-th since its last
+        snapshot, which restarts the count.
+        """
+        counted = AuditEntityCounter.updates_since_snapshot + 1
+        stmt = (
+            pg_insert(AuditEntityCounter)
+            .values(
+                tenant_id=self.tenant_id,
+                entity_type=entity_type,
+                entity_id=entity_id,
+                updates_since_snapshot=0
+            )
+            .on_conflict_do_update(
+                index_elements=[
+                    AuditEntityCounter.tenant_id,
+                    AuditEntityCounter.entity_type,
+                    AuditEntityCounter.entity_id
+                ],
+                set_={
+                    "updates_since_snapshot": case(
+                        (counted >= settings.AUDIT_SNAPSHOT_INTERVAL, 0),
+                        else_=counted
+                    )
+                }
+            )
+            .returning(AuditEntityCounter.updates_since_snapshot)
+        )
+        result = await self.db.execute(stmt)
+        return result.scalar() == 0
+    
+    async def _count_bulk_updates(self, entity_type: str, entity_ids: List[UUID]) -> None:
+        """
+        Count a bulk update of each entity. Bulk records never hold the full
+        state, so the count stops one short of the interval and the entity's
+        next single update writes the snapshot.
+        """
+        if not entity_ids:
+            return
+        due = max(settings.AUDIT_SNAPSHOT_INTERVAL - 1, 0)
+        stmt = pg_insert(AuditEntityCounter).values([
+            {
+                "tenant_id": self.tenant_id,
+                "entity_type": entity_type,
+                "entity_id": entity_id,
+                "updates_since_snapshot": due
+            }
+            for entity_id in set(entity_ids)
+        ])
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[
+                AuditEntityCounter.tenant_id,
+                AuditEntityCounter.entity_type,
+                AuditEntityCounter.entity_id
+            ],
+            set_={
+                "updates_since_snapshot": func.least(AuditEntityCounter.updates_since_snapshot + 1, due)
+            }
+        )
+        await self.db.execute(stmt)
+    
+    async def _write(self, rows: List[Dict[str, Any]]):
+        if not self.inline:
+            audit_sink.queue_after_commit(self.db, rows)
+        elif len(rows) == 1:
+            self.db.add(AuditLog(**rows[0]))
+        else:
+            await self.db.execute(insert(AuditLog), rows)
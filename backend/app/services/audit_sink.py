@@ -0,0 +1,118 @@
+from sqlalchemy import event as sa_event
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Any, Dict, List
+import logging
+import uuid
+
+from app.core.background import PeriodicTask
+from app.core.bulk_insert import insert_rows, describe_rejected
+from app.core.config import settings
+from app.core.metrics import register_metrics
+from app.models.audit import AuditLog
+
+logger = logging.getLogger(__name__)
+
+_SESSION_KEY = "audit_sink_rows"
+_COLUMNS = [column.name for column in AuditLog.__table__.columns]
+
+
+def _hand_over(session) -> None:
+    rows = session.info.pop(_SESSION_KEY, None)
+    if rows:
+        audit_sink.add(rows)
+
+
+def _discard(session) -> None:
+    session.info.pop(_SESSION_KEY, None)
+
+
+class AuditSink:
+    """
+    Write-behind buffer for audit records.
+
+    Records are held on the session and queued only once its transaction
+    commits, so a rolled-back change is never audited. A background task
+    writes the queue with multi-row INSERTs every ``flush_interval`` seconds,
+    or as soon as ``flush_size`` records are waiting. At most ``max_pending``
+    records are queued; the change they describe has already committed, so
+    records beyond that are logged and dropped instead of refused. Records
+    the database rejects on their own are logged and dropped rather than
+    retried. Records still queued when the process dies are lost, which is
+    why inline writes stay the default (AUDIT_WRITE_MODE).
+    """
+
+    def __init__(self, max_pending: int, flush_size: int, flush_interval: float):
+        self.max_pending = max_pending
+        self.flush_size = flush_size
+        self._pending: List[Dict[str, Any]] = []
+        self._task = PeriodicTask("audit-sink-flush", flush_interval, self.flush)
+        self.flushed_rows = 0
+        self.failed_flushes = 0
+        self.overflow_rows = 0
+        self.dropped_rows = 0
+
+    def queue_after_commit(self, db: AsyncSession, rows: List[Dict[str, Any]]) -> None:
+        """Hold ``rows`` on the session until its transaction commits."""
+        session = db.sync_session
+        held = session.info.setdefault(_SESSION_KEY, [])
+        held.extend(rows)
+        if not sa_event.contains(session, "after_commit", _hand_over):
+            sa_event.listen(session, "after_commit", _hand_over)
+            sa_event.listen(session, "after_rollback", _discard)
+
+    def add(self, rows: List[Dict[str, Any]]) -> None:
+        room = max(0, self.max_pending - len(self._pending))
+        if len(rows) > room:
+            self.overflow_rows += len(rows) - room
+            logger.error(
+                f"Audit queue full ({self.max_pending} records); dropped {len(rows) - room} records"
+            )
+            rows = rows[:room]
+        # A multi-row INSERT needs the same keys in every row
+        self._pending.extend(
+            {column: row.get(column) for column in _COLUMNS}
+            | {"id": row.get("id") or uuid.uuid4(), "snapshot": row.get("snapshot", False)}
+            for row in rows
+        )
+        if len(self._pending) >= self.flush_size:
+            self._task.wake()
+
+    async def flush(self) -> None:
+        while self._pending:
+            batch = self._pending[:self.flush_size]
+            del self._pending[:self.flush_size]
+            try:
+                rejected = await insert_rows(AuditLog, batch)
+            except Exception:
+                self.failed_flushes += 1
+                self._pending[:0] = batch
+                raise
+            for row, error in rejected:
+                logger.error(f"Dropped audit record {describe_rejected(row, error)}")
+            self.dropped_rows += len(rejected)
+            self.flushed_rows += len(batch) - len(rejected)
+
+    def start(self) -> None:
+        self._task.start()
+
+    async def stop(self) -> None:
+        await self._task.stop()
+
+    def stats(self) -> dict:
+        return {
+            "mode": settings.AUDIT_WRITE_MODE,
+            "pending": len(self._pending),
+            "max_pending": self.max_pending,
+            "flushed_rows": self.flushed_rows,
+            "failed_flushes": self.failed_flushes,
+            "overflow_rows": self.overflow_rows,
+            "dropped_rows": self.dropped_rows,
+        }
+
+
+audit_sink = AuditSink(
+    max_pending=settings.AUDIT_MAX_PENDING,
+    flush_size=settings.AUDIT_FLUSH_SIZE,
+    flush_interval=settings.AUDIT_FLUSH_INTERVAL_SECONDS,
+)
+register_metrics("audit_sink", audit_sink.stats)
@@ -0,0 +1,215 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import HTTPException, UploadFile, status
+from fastapi.concurrency import run_in_threadpool
+from pydantic import ValidationError
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from uuid import UUID
+from datetime import datetime, timezone
+import codecs
+import csv
+import io
+import itertools
+import json
+import logging
+import re
+import uuid
+
+from app.core.config import settings
+from app.repositories.contact_repository import ContactRepository
+from app.schemas.contact import ContactCreate, ContactImportError, ContactImportResponse
+from app.services.audit_service import AuditService
+from app.services.webhook_service import WebhookService
+
+logger = logging.getLogger(__name__)
+
+IMPORT_FORMATS = ("csv", "ndjson")
+
+# (row number, parsed record or None, parse error or None)
+ParsedRow = Tuple[int, Optional[Dict[str, Any]], Optional[str]]
+
+
+def _csv_rows(file) -> Iterator[ParsedRow]:
+    reader = csv.DictReader(io.TextIOWrapper(file, encoding="utf-8-sig", newline=""))
+    for number, record in enumerate(reader, start=1):
+        if None in record:
+            yield number, None, "Row has more fields than the header"
+            continue
+        record = {key.strip().lower(): value for key, value in record.items() if key}
+        tags = record.get("tags")
+        if tags is not None:
+            try:
+                record["tags"] = _csv_tags(tags)
+            except ValueError as e:
+                yield number, None, f"tags: {e}"
+                continue
+        for field in ("phone", "company"):
+            if record.get(field) == "":
+                record[field] = None
+        yield number, record, None
+
+
+def _csv_tags(cell: str) -> List[str]:
+    """A JSON array of tags, as the export writes them, or tags separated by ; or ,"""
+    if cell.lstrip().startswith("["):
+        try:
+            tags = json.loads(cell)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid JSON array: {e.msg}")
+        if not isinstance(tags, list) or not all(isinstance(tag, str) for tag in tags):
+            raise ValueError("JSON value must be an array of strings")
+        return tags
+    return [tag.strip() for tag in re.split(r"[;,]", cell) if tag.strip()]
+
+
+def _ndjson_rows(file) -> Iterator[ParsedRow]:
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    for number, line in enumerate(file, start=1):
+        text = decoder.decode(line).strip()
+        if not text:
+            continue
+        try:
+            record = json.loads(text)
+        except json.JSONDecodeError as e:
+            yield number, None, f"Invalid JSON: {e.msg}"
+            continue
+        if not isinstance(record, dict):
+            yield number, None, "Each line must be a JSON object"
+            continue
+        yield number, record, None
+
+
+class ContactImportService:
+    """
+    Bulk contact import from a CSV or NDJSON upload.
+
+    The file is read in chunks of CONTACT_IMPORT_CHUNK_SIZE rows off the
+    event loop, so memory stays bounded whatever the upload size. Each chunk
+    is validated, deduplicated on email (within the chunk and against the
+    tenant with one query), written with COPY and committed together with a
+    single audit record. Earlier chunks stay imported if a later one fails.
+    """
+
+    def __init__(self, db: AsyncSession, tenant_id: UUID):
+        self.db = db
+        self.tenant_id = tenant_id
+        self.repository = ContactRepository(db, tenant_id)
+        self.audit_service = AuditService(db, tenant_id)
+        self.webhook_service = WebhookService(db, tenant_id)
+
+    async def import_file(
+        self,
+        file: UploadFile,
+        file_format: Optional[str],
+        user_id: UUID
+    ) -> ContactImportResponse:
+        file_format = file_format or self._detect_format(file)
+        if file_format not in IMPORT_FORMATS:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"format must be one of: {', '.join(IMPORT_FORMATS)}"
+            )
+
+        parse = _csv_rows if file_format == "csv" else _ndjson_rows
+        rows = parse(file.file)
+        summary = ContactImportResponse(import_id=uuid.uuid4())
+        chunk_size = settings.CONTACT_IMPORT_CHUNK_SIZE
+
+        while True:
+            try:
+                chunk = await run_in_threadpool(lambda: list(itertools.islice(rows, chunk_size)))
+            except (UnicodeDecodeError, csv.Error) as e:
+                self._add_error(summary, ContactImportError(row=summary.processed + 1, error=str(e)))
+                break
+            if not chunk:
+                break
+            await self._import_chunk(chunk, summary, user_id)
+            logger.info(
+                f"Contact import {summary.import_id}: {summary.processed} rows processed, "
+                f"{summary.imported} imported"
+            )
+
+        return summary
+
+    async def _import_chunk(
+        self,
+        chunk: List[ParsedRow],
+        summary: ContactImportResponse,
+        user_id: UUID
+    ) -> None:
+        now = datetime.now(timezone.utc)
+        candidates: Dict[str, Tuple[int, ContactCreate]] = {}
+
+        for number, record, error in chunk:
+            summary.processed += 1
+            if error is None:
+                try:
+                    contact = ContactCreate.model_validate(record)
+                except ValidationError as e:
+                    error = "; ".join(
+                        f"{'.'.join(str(part) for part in item['loc'])}: {item['msg']}"
+                        for item in e.errors()
+                    )
+            if error is not None:
+                summary.invalid += 1
+                self._add_error(summary, ContactImportError(row=number, error=error))
+                continue
+            if contact.email in candidates:
+                summary.duplicates += 1
+                self._add_error(summary, ContactImportError(
+                    row=number, email=contact.email, error="Duplicate email in file"
+                ))
+                continue
+            candidates[contact.email] = (number, contact)
+
+        existing = await self.repository.existing_emails(list(candidates))
+        rows = []
+        for email, (number, contact) in candidates.items():
+            if email in existing:
+                summary.duplicates += 1
+                self._add_error(summary, ContactImportError(
+                    row=number, email=email, error="Contact with this email already exists in your tenant"
+                ))
+                continue
+            rows.append({
+                **contact.model_dump(),
+                "id": uuid.uuid4(),
+                "tenant_id": self.tenant_id,
+                "tags": json.dumps(contact.tags),
+                "created_at": now,
+                "updated_at": now,
+                "created_by": user_id,
+                "updated_by": user_id,
+            })
+
+        summary.chunks += 1
+        if not rows:
+            return
+
+        contact_ids = [str(row["id"]) for row in rows]
+        await self.repository.copy_insert(rows)
+        await self.audit_service.log_import(
+            "contact",
+            summary.import_id,
+            {"chunk": summary.chunks, "count": len(rows), "contact_ids": contact_ids},
+            user_id
+        )
+        await self.webhook_service.emit_event(
+            "contacts.imported",
+            {"import_id": str(summary.import_id), "contact_ids": contact_ids}
+        )
+        await self.db.commit()
+        summary.imported += len(rows)
+
+    @staticmethod
+    def _add_error(summary: ContactImportResponse, error: ContactImportError) -> None:
+        if len(summary.errors) < settings.CONTACT_IMPORT_MAX_REPORTED_ERRORS:
+            summary.errors.append(error)
+        else:
+            summary.errors_truncated = True
+
+    @staticmethod
+    def _detect_format(file: UploadFile) -> str:
+        filename = (file.filename or "").lower()
+        if filename.endswith((".ndjson", ".jsonl")) or "ndjson" in (file.content_type or ""):
+            return "ndjson"
+        return "csv"
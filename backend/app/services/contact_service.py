@@ -3,8 +3,13 @@ from typing import List, Optional
 from uuid import UUID
 from fastapi import HTTPException, status
 
-from app.repositories.contact_repository import ContactRepository
-from app.schemas.contact import ContactCreate, ContactUpdate, ContactResponse
+from app.repositories.contact_repository import ContactRepository, CONTACT_SORT_FIELDS
+from app.repositories.pagination import InvalidCursor, Page
+from app.core.config import settings
+from app.schemas.contact import (
+    ContactCreate, ContactUpdate, ContactResponse, TagCount,
+    ContactSelector, ContactBulkUpdate, ContactBulkResponse
+)
 from app.services.audit_service import AuditService
 from app.services.webhook_service import WebhookService
 from pydantic import TypeAdapter
@@ -27,20 +32,21 @@ class ContactService:
         
         contact = await self.repository.create(contact_data, user_id)
         
-        contact_dict = ContactResponse.model_validate(contact).model_dump(mode='json')
+        response = ContactResponse.model_validate(contact)
         await self.audit_service.log_create(
             "contact",
             contact.id,
-            contact_dict,
+            response.model_dump(mode='json'),
             user_id
         )
-        
         await self.webhook_service.emit_event(
             "contact.created",
             {"contact_id": str(contact.id), "email": contact.email}
         )
+        # The contact, its audit record and queued webhooks commit together
+        await self.db.commit()
         
-        return ContactResponse.model_validate(contact)
+        return response
     
     async def get_contact(self, contact_id: UUID) -> ContactResponse:
         contact = await self.repository.get_by_id(contact_id)
@@ -56,16 +62,36 @@ class ContactService:
         page: int = 1,
         page_size: int = 20,
         search: Optional[str] = None,
-        tag: Optional[str] = None,
+        tags: Optional[List[str]] = None,
         sort_by: str = "created_at",
-        sort_order: str = "desc"
-    ) -> tuple[List[ContactResponse], int]:
-        contacts, total = await self.repository.list(
-            page, page_size, search, tag, sort_by, sort_order
-        )
-        return [
-            ContactResponse.model_validate(contact) for contact in contacts
-        ], total
+        sort_order: str = "desc",
+        cursor: Optional[str] = None,
+        count_mode: str = "exact",
+        search_mode: str = "contains",
+        tag_match: str = "all"
+    ) -> Page:
+        if sort_by not in CONTACT_SORT_FIELDS:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"sort_by must be one of: {', '.join(CONTACT_SORT_FIELDS)}"
+            )
+        
+        try:
+            result = await self.repository.list(
+                page, page_size, search, tags, sort_by, sort_order, cursor,
+                count_mode, search_mode, tag_match
+            )
+        except InvalidCursor as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(e)
+            )
+        result.items = [ContactResponse.model_validate(contact) for contact in result.items]
+        return result
+    
+    async def list_tags(self, prefix: Optional[str] = None, limit: int = 100) -> List[TagCount]:
+        counts = await self.repository.tag_counts(prefix, limit)
+        return [TagCount(tag=tag, count=count) for tag, count in counts]
     
     async def update_contact(
         self,
@@ -88,46 +114,146 @@ class ContactService:
                     detail="Contact with this email already exists"
                 )
         
-        before_data = ContactResponse.model_validate(contact).model_dump(mode='json')
+        # Only the fields the update can touch; the UPDATE refreshes contact in place
+        before = {
+            field: getattr(contact, field)
+            for field in (*contact_data.model_fields_set, "updated_at", "updated_by")
+        }
         
         updated_contact = await self.repository.update(contact, contact_data, user_id)
         
-        after_data = ContactResponse.model_validate(updated_contact).model_dump(mode='json')
-        await self.audit_service.log_update(
-            "contact",
-            contact.id,
-            before_data,
-            after_data,
-            user_id
-        )
-        
+        response = ContactResponse.model_validate(updated_contact)
+        await self.audit_service.log_update("contact", contact.id, before, response, user_id)
         await self.webhook_service.emit_event(
             "contact.updated",
             {"contact_id": str(contact.id), "email": updated_contact.email}
         )
+        await self.db.commit()
         
-        return ContactResponse.model_validate(updated_contact)
+        return response
     
     async def delete_contact(self, contact_id: UUID, user_id: UUID) -> None:
-        contact = await self.repository.get_by_id(contact_id)
-        if not contact:
+        # The DELETE returns the old row, so no separate lookup is needed
+        deleted = await self.repository.delete(contact_id)
+        if not deleted:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Contact not found"
             )
         
-        before_data = ContactResponse.model_validate(contact).model_dump(mode='json')
-        
-        await self.repository.delete(contact)
-        
         await self.audit_service.log_delete(
             "contact",
-            contact.id,
-            before_data,
+            contact_id,
+            ContactResponse.model_validate(deleted).model_dump(mode='json'),
             user_id
         )
-        
         await self.webhook_service.emit_event(
             "contact.deleted",
             {"contact_id": str(contact_id)}
-        )
\ No newline at end of file
+        )
+        await self.db.commit()
+    
+    async def bulk_update(self, request: ContactBulkUpdate, user_id: UUID) -> ContactBulkResponse:
+        """
+        Apply one change to every selected contact, CONTACT_BULK_CHUNK_SIZE
+        rows per UPDATE and transaction. Each chunk writes its audit records
+        in one INSERT and emits a single contacts.updated event.
+        """
+        targets = self._bulk_targets(request)
+        values = self._bulk_values(request)
+        chunk_size = settings.CONTACT_BULK_CHUNK_SIZE
+        response = ContactBulkResponse()
+        after_id = None
+        
+        while True:
+            rows = await self.repository.update_returning(targets, values, user_id, after_id, chunk_size)
+            if not rows:
+                break
+            
+            entries = []
+            for row in rows:
+                fields = row._mapping
+                before = {field: fields[f"old_{field}"] for field in values}
+                after = {field: fields[field] for field in values}
+                entries.append({
+                    "entity_id": row.id,
+                    "before_data": before,
+                    "after_data": after,
+                    "changes": {
+                        field: {"old": str(before[field]), "new": str(after[field])}
+                        for field in values if before[field] != after[field]
+                    }
+                })
+            await self.audit_service.log_bulk("contact", "UPDATE", entries, user_id)
+            await self.webhook_service.emit_event(
+                "contacts.updated",
+                {"contact_ids": [str(row.id) for row in rows], "fields": list(values)}
+            )
+            await self.db.commit()
+            
+            response.affected += len(rows)
+            response.chunks += 1
+            if len(rows) < chunk_size:
+                break
+            after_id = max(row.id for row in rows)
+        
+        return response
+    
+    async def bulk_delete(self, request: ContactSelector, user_id: UUID) -> ContactBulkResponse:
+        """Delete every selected contact in chunks, like ``bulk_update``."""
+        targets = self._bulk_targets(request)
+        chunk_size = settings.CONTACT_BULK_CHUNK_SIZE
+        response = ContactBulkResponse()
+        
+        while True:
+            rows = await self.repository.delete_returning(targets, chunk_size)
+            if not rows:
+                break
+            
+            entries = [
+                {
+                    "entity_id": row.id,
+                    "before_data": ContactResponse.model_validate(row).model_dump(mode='json')
+                }
+                for row in rows
+            ]
+            await self.audit_service.log_bulk("contact", "DELETE", entries, user_id)
+            await self.webhook_service.emit_event(
+                "contacts.deleted",
+                {"contact_ids": [str(row.id) for row in rows]}
+            )
+            await self.db.commit()
+            
+            response.affected += len(rows)
+            response.chunks += 1
+            if len(rows) < chunk_size:
+                break
+        
+        return response
+    
+    def _bulk_targets(self, selector: ContactSelector):
+        if selector.ids is None and not selector.search and not selector.tags:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Select contacts with ids or at least one of search and tags"
+            )
+        return self.repository.selected(
+            selector.ids, selector.search, selector.tags, selector.search_mode, selector.tag_match
+        )
+    
+    def _bulk_values(self, request: ContactBulkUpdate) -> dict:
+        changes = request.changes.model_dump(exclude_unset=True)
+        add_tags = changes.pop("add_tags", [])
+        remove_tags = changes.pop("remove_tags", [])
+        if "tags" in changes:
+            tags = [tag for tag in changes["tags"] or [] if tag not in remove_tags]
+            changes["tags"] = tags + [tag for tag in add_tags if tag not in tags]
+        elif add_tags or remove_tags:
+            changes["tags"] = self.repository.tag_edit(add_tags, remove_tags)
+        
+        if not changes:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="No changes given"
+            )
+        return changes
@@ -0,0 +1,90 @@
+from typing import Any, Dict, List
+import logging
+
+from app.core.background import PeriodicTask
+from app.core.bulk_insert import insert_rows, describe_rejected
+from app.core.config import settings
+from app.core.metrics import register_metrics
+from app.models.webhook import IntegrationEvent
+from app.workers.integration_events import integration_event_processor
+
+logger = logging.getLogger(__name__)
+
+
+class InboundEventBuffer:
+    """
+    Bounded write-behind buffer for inbound integration events.
+
+    The inbound webhook endpoint only appends rows here and answers 202; a
+    background task writes them with multi-row INSERTs every
+    ``flush_interval`` seconds, or as soon as ``flush_size`` rows are waiting.
+    Once ``max_events`` rows are pending ``offer`` refuses more, so a slow or
+    unavailable database turns into backpressure instead of memory growth.
+    Rows the database rejects on their own, such as events for a tenant
+    deleted in the meantime, are logged and dropped rather than retried.
+    Rows still buffered when the process dies are lost.
+    """
+
+    def __init__(self, max_events: int, flush_size: int, flush_interval: float):
+        self.max_events = max_events
+        self.flush_size = flush_size
+        self._pending: List[Dict[str, Any]] = []
+        self._task = PeriodicTask("inbound-event-flush", flush_interval, self.flush)
+        self.accepted = 0
+        self.rejected = 0
+        self.flushed_rows = 0
+        self.failed_flushes = 0
+        self.dropped_rows = 0
+
+    def offer(self, rows: List[Dict[str, Any]]) -> bool:
+        """Queue all of ``rows``, or none of them when the buffer is full."""
+        if len(self._pending) + len(rows) > self.max_events:
+            self.rejected += len(rows)
+            return False
+        self._pending.extend(rows)
+        self.accepted += len(rows)
+        if len(self._pending) >= self.flush_size:
+            self._task.wake()
+        return True
+
+    async def flush(self) -> None:
+        while self._pending:
+            batch = self._pending[:self.flush_size]
+            del self._pending[:self.flush_size]
+            try:
+                rejected = await insert_rows(IntegrationEvent, batch)
+            except Exception:
+                self.failed_flushes += 1
+                # Keep arrival order; the buffer stays full until the database recovers
+                self._pending[:0] = batch
+                raise
+            for row, error in rejected:
+                logger.error(f"Dropped inbound event {describe_rejected(row, error)}")
+            self.dropped_rows += len(rejected)
+            self.flushed_rows += len(batch) - len(rejected)
+            integration_event_processor.wake()
+
+    def start(self) -> None:
+        self._task.start()
+
+    async def stop(self) -> None:
+        await self._task.stop()
+
+    def stats(self) -> dict:
+        return {
+            "pending": len(self._pending),
+            "max_events": self.max_events,
+            "accepted": self.accepted,
+            "rejected": self.rejected,
+            "flushed_rows": self.flushed_rows,
+            "failed_flushes": self.failed_flushes,
+            "dropped_rows": self.dropped_rows,
+        }
+
+
+inbound_event_buffer = InboundEventBuffer(
+    max_events=settings.INBOUND_EVENT_BUFFER_MAX_EVENTS,
+    flush_size=settings.INBOUND_EVENT_FLUSH_SIZE,
+    flush_interval=settings.INBOUND_EVENT_FLUSH_INTERVAL_SECONDS,
+)
+register_metrics("inbound_events", inbound_event_buffer.stats)
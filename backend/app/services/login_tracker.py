@@ -0,0 +1,88 @@
+from sqlalchemy import update
+from typing import Any, Dict, Optional
+from uuid import UUID
+from datetime import datetime
+import logging
+
+from app.core.background import PeriodicTask
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.core.metrics import register_metrics
+from app.models.user import User
+
+logger = logging.getLogger(__name__)
+
+
+class LoginTracker:
+    """
+    Write-behind buffer for last-seen timestamps and profile claim changes.
+
+    Authenticated requests only record into memory; a background task writes
+    the pending rows with one batched UPDATE per flush. Last-seen updates for
+    a user are throttled to one per ``min_interval`` seconds, while profile
+    changes are always queued.
+    """
+
+    def __init__(self, min_interval: float, flush_interval: float, max_tracked_users: int = 100000):
+        self.min_interval = min_interval
+        self._pending: Dict[UUID, Dict[str, Any]] = {}
+        self._recent = TTLCache(max_tracked_users, ttl=min_interval)
+        self._task = PeriodicTask("login-tracker-flush", flush_interval, self.flush)
+        self.flushed_rows = 0
+        self.failed_flushes = 0
+
+    def touch(
+        self,
+        user_id: UUID,
+        seen_at: datetime,
+        profile_changes: Optional[Dict[str, Any]] = None
+    ) -> None:
+        if not profile_changes and user_id in self._recent:
+            return
+
+        values = self._pending.setdefault(user_id, {})
+        if profile_changes:
+            values.update(profile_changes)
+        values["last_login"] = seen_at
+        self._recent.set(user_id, True)
+
+    async def flush(self) -> None:
+        if not self._pending:
+            return
+
+        batch, self._pending = self._pending, {}
+        rows = [{"id": user_id, **values} for user_id, values in batch.items()]
+        try:
+            async with AsyncSessionLocal() as session:
+                await session.execute(update(User), rows)
+                await session.commit()
+        except Exception:
+            self.failed_flushes += 1
+            # Put the rows back unless a newer value arrived in the meantime
+            for user_id, values in batch.items():
+                pending = self._pending.setdefault(user_id, {})
+                for field, value in values.items():
+                    pending.setdefault(field, value)
+            raise
+        self.flushed_rows += len(rows)
+
+    def start(self) -> None:
+        self._task.start()
+
+    async def stop(self) -> None:
+        await self._task.stop()
+
+    def stats(self) -> dict:
+        return {
+            "pending": len(self._pending),
+            "flushed_rows": self.flushed_rows,
+            "failed_flushes": self.failed_flushes,
+        }
+
+
+login_tracker = LoginTracker(
+    min_interval=settings.LOGIN_TRACKING_MIN_INTERVAL_SECONDS,
+    flush_interval=settings.LOGIN_TRACKING_FLUSH_INTERVAL_SECONDS,
+)
+register_metrics("login_tracker", login_tracker.stats)
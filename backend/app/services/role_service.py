@@ -0,0 +1,173 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, delete
+from sqlalchemy.dialects.postgresql import insert
+from typing import Dict, List
+from uuid import UUID
+from fastapi import HTTPException, status
+import re
+
+from app.core.permissions import bump_permissions_version
+from app.models.permission import Permission
+from app.models.role import Role, role_permissions
+from app.models.user import User, user_roles
+from app.schemas.role import RoleCreate, RoleResponse
+
+PERMISSION_NAME_RE = re.compile(r'^(\*|[a-z_]+)\.(\*|[a-z_]+)$')
+
+class RoleService:
+    """Manages a tenant's custom roles; every grant change bumps the tenant's permissions_version."""
+
+    def __init__(self, db: AsyncSession, tenant_id: UUID):
+        self.db = db
+        self.tenant_id = tenant_id
+    
+    async def list_roles(self) -> List[RoleResponse]:
+        result = await self.db.execute(
+            select(Role).where(Role.tenant_id == self.tenant_id).order_by(Role.name)
+        )
+        roles = result.scalars().all()
+        granted = await self._permission_names([role.id for role in roles])
+        return [self._to_response(role, granted.get(role.id, [])) for role in roles]
+    
+    async def create_role(self, role_data: RoleCreate) -> RoleResponse:
+        existing = await self.db.execute(
+            select(Role.id).where(Role.tenant_id == self.tenant_id, Role.name == role_data.name)
+        )
+        if existing.scalar_one_or_none():
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Role with this name already exists"
+            )
+        
+        role = Role(
+            tenant_id=self.tenant_id,
+            name=role_data.name,
+            description=role_data.description
+        )
+        self.db.add(role)
+        await self.db.flush()
+        
+        names = await self._grant(role.id, role_data.permissions)
+        await bump_permissions_version(self.db, self.tenant_id)
+        await self.db.commit()
+        return self._to_response(role, names)
+    
+    async def set_permissions(self, role_id: UUID, permission_names: List[str]) -> RoleResponse:
+        role = await self._get_role(role_id)
+        await self.db.execute(
+            delete(role_permissions).where(role_permissions.c.role_id == role.id)
+        )
+        names = await self._grant(role.id, permission_names)
+        await bump_permissions_version(self.db, self.tenant_id)
+        await self.db.commit()
+        return self._to_response(role, names)
+    
+    async def delete_role(self, role_id: UUID) -> None:
+        role = await self._get_role(role_id)
+        # Memberships and grants go with it via ON DELETE CASCADE
+        await self.db.execute(delete(Role).where(Role.id == role.id))
+        await bump_permissions_version(self.db, self.tenant_id)
+        await self.db.commit()
+    
+    async def assign_user(self, role_id: UUID, user_id: UUID) -> None:
+        role = await self._get_role(role_id)
+        await self._get_user(user_id)
+        await self.db.execute(
+            insert(user_roles)
+            .values(user_id=user_id, role_id=role.id)
+            .on_conflict_do_nothing()
+        )
+        await bump_permissions_version(self.db, self.tenant_id)
+        await self.db.commit()
+    
+    async def unassign_user(self, role_id: UUID, user_id: UUID) -> None:
+        role = await self._get_role(role_id)
+        await self.db.execute(
+            delete(user_roles).where(
+                user_roles.c.role_id == role.id,
+                user_roles.c.user_id == user_id
+            )
+        )
+        await bump_permissions_version(self.db, self.tenant_id)
+        await self.db.commit()
+    
+    async def _get_role(self, role_id: UUID) -> Role:
+        result = await self.db.execute(
+            select(Role).where(Role.id == role_id, Role.tenant_id == self.tenant_id)
+        )
+        role = result.scalar_one_or_none()
+        if not role:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Role not found"
+            )
+        return role
+    
+    async def _get_user(self, user_id: UUID) -> User:
+        result = await self.db.execute(
+            select(User).where(User.id == user_id, User.tenant_id == self.tenant_id)
+        )
+        user = result.scalar_one_or_none()
+        if not user:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="User not found"
+            )
+        return user
+    
+    async def _grant(self, role_id: UUID, permission_names: List[str]) -> List[str]:
+        names = sorted(set(permission_names))
+        invalid = [name for name in names if not PERMISSION_NAME_RE.match(name)]
+        if invalid:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Invalid permission names: {', '.join(invalid)}"
+            )
+        if not names:
+            return []
+        
+        # Permission rows are shared across tenants; create any that are missing
+        await self.db.execute(
+            insert(Permission)
+            .values([
+                {"name": name, "resource": name.split('.')[0], "action": name.split('.')[1]}
+                for name in names
+            ])
+            .on_conflict_do_nothing(index_elements=[Permission.name])
+        )
+        result = await self.db.execute(
+            select(Permission.id).where(Permission.name.in_(names))
+        )
+        await self.db.execute(
+            insert(role_permissions).values([
+                {"role_id": role_id, "permission_id": permission_id}
+                for permission_id in result.scalars().all()
+            ])
+        )
+        return names
+    
+    async def _permission_names(self, role_ids: List[UUID]) -> Dict[UUID, List[str]]:
+        if not role_ids:
+            return {}
+        result = await self.db.execute(
+            select(role_permissions.c.role_id, Permission.name)
+            .join(Permission, Permission.id == role_permissions.c.permission_id)
+            .where(role_permissions.c.role_id.in_(role_ids))
+            .order_by(Permission.name)
+        )
+        granted: Dict[UUID, List[str]] = {}
+        for role_id, name in result.all():
+            granted.setdefault(role_id, []).append(name)
+        return granted
+    
+    @staticmethod
+    def _to_response(role: Role, permissions: List[str]) -> RoleResponse:
+        return RoleResponse(
+            id=role.id,
+            tenant_id=role.tenant_id,
+            name=role.name,
+            description=role.description,
+            permissions=permissions,
+            created_at=role.created_at,
+            updated_at=role.updated_at
+        )
@@ -1,14 +1,48 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, insert, case, func, literal, event as sa_event
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID, JSONB
+from fastapi import HTTPException, status
 from typing import Dict, Any
 from uuid import UUID
-import httpx
-import asyncio
-import json
 from datetime import datetime, timezone
+import json
+import uuid
+
+from app.core.config import settings
+from app.core.webhook_index import webhook_index
+from app.models.webhook import WebhookSubscription, WebhookOutbox, IntegrationEvent
+from app.schemas.webhook import InboundEventsAccepted
+from app.services.inbound_event_buffer import inbound_event_buffer
+from app.workers.webhook_dispatcher import webhook_dispatcher
+
+_WAKE_KEY = "webhook_outbox_queued"
+
+
+def _wake_dispatcher(session) -> None:
+    if session.info.pop(_WAKE_KEY, False):
+        webhook_dispatcher.wake()
+
+
+def _forget_queued(session) -> None:
+    session.info.pop(_WAKE_KEY, None)
+
+
+def _contains_nul(value: Any) -> bool:
+    """Whether any string or key in a decoded JSON value holds a NUL character."""
+    # Iterative, so nesting json.loads accepts cannot exhaust the stack here
+    pending = [value]
+    while pending:
+        item = pending.pop()
+        if isinstance(item, str):
+            if "\x00" in item:
+                return True
+        elif isinstance(item, dict):
+            pending.extend(item.keys())
+            pending.extend(item.values())
+        elif isinstance(item, list):
+            pending.extend(item)
+    return False
 
-from app.models.webhook import WebhookSubscription, IntegrationEvent
-from app.core.security import create_webhook_signature
 
 class WebhookService:
     def __init__(self, db: AsyncSession, tenant_id: UUID):
@@ -20,48 +54,104 @@ class WebhookService:
         event_name: str,
         payload: Dict[str, Any]
     ):
-        stmt = select(WebhookSubscription).where(
-            WebhookSubscription.tenant_id == self.tenant_id,
-            WebhookSubscription.event_name == event_name,
+        """
+        Queue the event for each enabled subscription as outbox rows in the
+        caller's transaction. Nothing is sent unless that transaction commits;
+        the dispatcher is woken once it does. Subscriptions come from the
+        cached per-tenant index, so events nobody subscribes to cost nothing.
+        """
+        subscription_ids = await webhook_index.subscription_ids(self.db, self.tenant_id, event_name)
+        if not subscription_ids:
+            return
+        
+        # The index can trail a change made on another worker by up to its
+        # version-check interval; selecting through the table skips ids that
+        # were deleted or disabled meanwhile instead of failing the caller.
+        subscriptions = select(
+            func.gen_random_uuid(),
+            literal(self.tenant_id, PG_UUID(as_uuid=True)),
+            WebhookSubscription.id,
+            literal(event_name),
+            literal(payload, JSONB),
+            # Batched subscriptions hold events until the batch deadline,
+            # unless the dispatcher finds the batch full first
+            case(
+                (
+                    WebhookSubscription.batch_enabled,
+                    func.now() + func.make_interval(0, 0, 0, 0, 0, 0, WebhookSubscription.batch_max_wait_seconds)
+                ),
+                else_=func.now()
+            ),
+            func.now()
+        ).where(
+            WebhookSubscription.id.in_(subscription_ids),
             WebhookSubscription.enabled == True
         )
-        result = await self.db.execute(stmt)
-        subscriptions = result.scalars().all()
-        
-        for subscription in subscriptions:
-            asyncio.create_task(self._send_webhook(subscription, payload))
+        await self.db.execute(
+            insert(WebhookOutbox).from_select(
+                ["id", "tenant_id", "subscription_id", "event_name", "payload", "next_attempt_at", "created_at"],
+                subscriptions
+            )
+        )
+        # One listener per session, however many events it queues
+        session = self.db.sync_session
+        session.info[_WAKE_KEY] = True
+        if not sa_event.contains(session, "after_commit", _wake_dispatcher):
+            sa_event.listen(session, "after_commit", _wake_dispatcher)
+            sa_event.listen(session, "after_rollback", _forget_queued)
     
-    async def _send_webhook(self, subscription: WebhookSubscription, payload: Dict[str, Any]):
+    def queue_inbound_events(self, event_name: str, body: bytes) -> InboundEventsAccepted:
+        """
+        Validate an inbound webhook body, a JSON object or an array of them,
+        and hand one integration event per object to the write-behind buffer.
+        """
+        if len(event_name) > IntegrationEvent.__table__.c.event_name.type.length:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Event name is too long"
+            )
         try:
-            payload_bytes = json.dumps(payload).encode()
-            signature = create_webhook_signature(payload_bytes, subscription.secret)
-            
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(
-                    subscription.target_url,
-                    json=payload,
-                    headers={
-                        "X-Webhook-Signature": signature,
-                        "X-Event-Name": subscription.event_name
-                    }
-                )
-                response.raise_for_status()
-        except Exception as e:
-            print(f"Webhook delivery failed: {e}")
-    
-    async def store_inbound_event(
-        self,
-        event_name: str,
-        payload: Dict[str, Any]
-    ) -> IntegrationEvent:
-        event = IntegrationEvent(
-            tenant_id=self.tenant_id,
-            event_name=event_name,
-            payload=payload,
-            status="received",
-            received_at=datetime.now(timezone.utc)
-        )
-        self.db.add(event)
-        await self.db.commit()
-        await self.db.refresh(event)
-        return event
\ No newline at end of file
+            data = json.loads(body)
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Body must be valid JSON"
+            )
+        # jsonb cannot store NUL; one such row would fail its whole flush
+        if _contains_nul(data):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Payload must not contain NUL characters"
+            )
+        
+        events = [data] if isinstance(data, dict) else data
+        if not isinstance(events, list) or not events or not all(isinstance(item, dict) for item in events):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Body must be a JSON object or a non-empty array of objects"
+            )
+        if len(events) > settings.INBOUND_WEBHOOK_MAX_EVENTS_PER_REQUEST:
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail=f"At most {settings.INBOUND_WEBHOOK_MAX_EVENTS_PER_REQUEST} events per request"
+            )
+        
+        received_at = datetime.now(timezone.utc)
+        rows = [
+            {
+                "id": uuid.uuid4(),
+                "tenant_id": self.tenant_id,
+                "event_name": event_name,
+                "payload": payload,
+                "status": "received",
+                "received_at": received_at,
+            }
+            for payload in events
+        ]
+        if not inbound_event_buffer.offer(rows):
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail="Too many inbound events; retry shortly",
+                headers={"Retry-After": "1"}
+            )
+        return InboundEventsAccepted(accepted=len(rows), event_ids=[row["id"] for row in rows])
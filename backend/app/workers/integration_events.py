@@ -0,0 +1,332 @@
+"""
+Processes inbound integration events from the integration_events table.
+
+Handlers are registered per event name, in modules listed in
+INTEGRATION_HANDLER_MODULES so both the API and a standalone worker load them:
+
+    @integration_event_processor.handler("lead.captured")
+    async def create_lead(db: AsyncSession, event: Row) -> None:
+        ...
+
+A handler gets its own session and must not commit; its writes are committed
+together with the event's processed status.
+
+Runs inside the API process by default (see INTEGRATION_WORKER_ENABLED), or
+on its own with:
+
+    python -m app.workers.integration_events
+"""
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, update, func, bindparam, true
+from sqlalchemy.engine import Row
+from typing import Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+from datetime import datetime, timedelta, timezone
+import asyncio
+import importlib
+import logging
+import math
+import random
+import signal
+
+from app.core.background import PeriodicTask
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal, engine
+from app.core.metrics import register_metrics
+from app.models.tenant import Tenant
+from app.models.webhook import IntegrationEvent
+from app.services.audit_sink import audit_sink
+
+logger = logging.getLogger(__name__)
+
+IntegrationHandler = Callable[[AsyncSession, Row], Awaitable[None]]
+
+# Left at the end of a lease for recording results
+LEASE_MARGIN_SECONDS = 5.0
+
+
+class IntegrationEventProcessor:
+    """
+    Claims due integration events with FOR UPDATE SKIP LOCKED and runs the
+    handler registered for each event name.
+
+    Like the webhook dispatcher, a claim commits straight away and pushes the
+    event's next_attempt_at out by the lease time, so any number of worker
+    processes can drain the table without running an event twice at once.
+    The lease is at least as long as the slowest possible batch, every
+    handler timing out while only ``concurrency`` of them run at a time.
+    Each claim takes at most ``per_tenant_batch`` events per tenant, oldest
+    first and interleaved across tenants, so one tenant's backlog cannot hold
+    up the others.
+
+    A handler runs in its own session and its writes commit together with the
+    event's processed status, provided the event is still claimed by this
+    worker; otherwise they are rolled back. Failures are retried with
+    exponential backoff and jitter until ``max_attempts`` is reached, after
+    which the event is marked failed. Events with no registered handler are
+    left as received.
+    """
+
+    def __init__(
+        self,
+        poll_interval: float,
+        batch_size: int,
+        per_tenant_batch: int,
+        concurrency: int,
+        lease_seconds: int,
+        handler_timeout: float,
+        max_attempts: int,
+        backoff_base: float,
+        backoff_max: float
+    ):
+        self.batch_size = batch_size
+        self.per_tenant_batch = per_tenant_batch
+        self.lease_seconds = max(
+            lease_seconds,
+            math.ceil(batch_size / concurrency) * handler_timeout + LEASE_MARGIN_SECONDS
+        )
+        self.handler_timeout = handler_timeout
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.handlers: Dict[str, IntegrationHandler] = {}
+        self._task = PeriodicTask("integration-events", poll_interval, self.process)
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._stopping = False
+        self.processed = 0
+        self.failed_attempts = 0
+        self.failed = 0
+        self.lease_lost = 0
+
+    def handler(self, event_name: str) -> Callable[[IntegrationHandler], IntegrationHandler]:
+        """Decorator registering the handler for ``event_name``."""
+        def register(func: IntegrationHandler) -> IntegrationHandler:
+            if event_name in self.handlers:
+                raise ValueError(f"A handler for {event_name} is already registered")
+            self.handlers[event_name] = func
+            return func
+        return register
+
+    def load_handlers(self, modules: str) -> None:
+        """Import the comma-separated handler modules, which register on import."""
+        for module in filter(None, (name.strip() for name in modules.split(","))):
+            importlib.import_module(module)
+
+    def start(self) -> None:
+        self._stopping = False
+        self._task.start()
+
+    def wake(self) -> None:
+        self._task.wake()
+
+    async def stop(self) -> None:
+        self._stopping = True
+        await self._task.stop()
+
+    async def process(self) -> None:
+        while self.handlers and not self._stopping:
+            rows = await self._claim()
+            if not rows:
+                break
+            errors = await asyncio.gather(*(self._run(row) for row in rows))
+            await self._record_failures(rows, errors)
+            if len(rows) < self.batch_size:
+                break
+
+    async def _claim(self) -> Sequence[Row]:
+        due = (
+            IntegrationEvent.status == 'received',
+            IntegrationEvent.next_attempt_at <= func.now(),
+            IntegrationEvent.event_name.in_(list(self.handlers))
+        )
+        # Each tenant's oldest events, found with one probe of the due index
+        # per tenant, so a claim costs the same however large a backlog is
+        oldest = (
+            select(
+                IntegrationEvent.id,
+                IntegrationEvent.next_attempt_at,
+                func.row_number().over(order_by=IntegrationEvent.next_attempt_at).label("position")
+            )
+            .where(IntegrationEvent.tenant_id == Tenant.id, *due)
+            .order_by(IntegrationEvent.next_attempt_at)
+            .limit(self.per_tenant_batch)
+            .lateral("oldest")
+        )
+        # Round-robin across tenants: every tenant's oldest event, then every
+        # tenant's second oldest, and so on
+        fair = (
+            select(oldest.c.id)
+            .select_from(Tenant)
+            .join(oldest, true())
+            .order_by(oldest.c.position, oldest.c.next_attempt_at)
+            .limit(self.batch_size)
+        )
+        claimed = (
+            select(IntegrationEvent.id)
+            .where(IntegrationEvent.id.in_(fair), *due)
+            .with_for_update(skip_locked=True)
+            .cte("claimed")
+        )
+        stmt = (
+            update(IntegrationEvent)
+            .where(IntegrationEvent.id == claimed.c.id)
+            .values(
+                attempts=IntegrationEvent.attempts + 1,
+                next_attempt_at=func.now() + timedelta(seconds=self.lease_seconds)
+            )
+            .returning(
+                IntegrationEvent.id,
+                IntegrationEvent.tenant_id,
+                IntegrationEvent.event_name,
+                IntegrationEvent.payload,
+                IntegrationEvent.attempts,
+                IntegrationEvent.received_at
+            )
+        )
+        async with AsyncSessionLocal() as session:
+            result = await session.execute(stmt)
+            rows = result.all()
+            await session.commit()
+        return rows
+
+    async def _run(self, row: Row) -> Optional[str]:
+        """Run one event's handler; returns an error message, or None on success."""
+        handler = self.handlers[row.event_name]
+        async with self._semaphore:
+            async with AsyncSessionLocal() as session:
+                try:
+                    await asyncio.wait_for(handler(session, row), timeout=self.handler_timeout)
+                    result = await session.execute(
+                        self._update_claimed("status", "processed_at", "error_message"),
+                        self._claimed_params(row, {
+                            "status": "processed",
+                            "processed_at": datetime.now(timezone.utc),
+                            "error_message": None
+                        })
+                    )
+                    if result.rowcount == 0:
+                        await session.rollback()
+                        self.lease_lost += 1
+                        logger.warning(
+                            f"Integration event {row.id} ({row.event_name}) was claimed again before "
+                            f"its handler finished; its writes were rolled back"
+                        )
+                        return None
+                    await session.commit()
+                except asyncio.TimeoutError:
+                    await session.rollback()
+                    return f"Handler timed out after {self.handler_timeout:g}s"
+                except Exception as e:
+                    await session.rollback()
+                    logger.debug(f"Integration event {row.id} ({row.event_name}) failed", exc_info=True)
+                    return f"{type(e).__name__}: {e}"[:1000]
+        self.processed += 1
+        return None
+
+    async def _record_failures(self, rows: Sequence[Row], errors: List[Optional[str]]) -> None:
+        now = datetime.now(timezone.utc)
+        values: List[Tuple[Row, dict]] = []
+        for row, error in zip(rows, errors):
+            if error is None:
+                continue
+            if row.attempts >= self.max_attempts:
+                self.failed += 1
+                values.append((row, {"status": "failed", "error_message": error}))
+                logger.warning(
+                    f"Integration event {row.id} ({row.event_name}) failed after {row.attempts} attempts: {error}"
+                )
+            else:
+                self.failed_attempts += 1
+                values.append((row, {
+                    "next_attempt_at": now + timedelta(seconds=self._backoff(row.attempts)),
+                    "error_message": error
+                }))
+        if not values:
+            return
+
+        by_columns: Dict[Tuple[str, ...], List[dict]] = {}
+        for row, changes in values:
+            by_columns.setdefault(tuple(changes), []).append(self._claimed_params(row, changes))
+        async with AsyncSessionLocal() as session:
+            for columns, params in by_columns.items():
+                await session.execute(self._update_claimed(*columns), params)
+            await session.commit()
+
+    @staticmethod
+    def _update_claimed(*columns: str):
+        """
+        UPDATE of ``columns`` that only matches an event this worker still
+        holds: still received, with the attempt count its claim returned. An
+        event whose lease ran out and was claimed again is left to its new
+        owner.
+        """
+        events = IntegrationEvent.__table__
+        return (
+            update(events)
+            .where(
+                events.c.id == bindparam("claimed_id"),
+                events.c.status == 'received',
+                events.c.attempts == bindparam("claimed_attempts")
+            )
+            .values({column: bindparam(f"new_{column}") for column in columns})
+        )
+
+    @staticmethod
+    def _claimed_params(row: Row, changes: dict) -> dict:
+        return {
+            **{f"new_{column}": value for column, value in changes.items()},
+            "claimed_id": row.id,
+            "claimed_attempts": row.attempts,
+        }
+
+    def _backoff(self, attempts: int) -> float:
+        delay = min(self.backoff_base * 2 ** (attempts - 1), self.backoff_max)
+        return delay * random.uniform(0.5, 1.0)
+
+    def stats(self) -> dict:
+        return {
+            "running": self._task.running,
+            "handlers": len(self.handlers),
+            "processed": self.processed,
+            "failed_attempts": self.failed_attempts,
+            "failed": self.failed,
+            "lease_lost": self.lease_lost,
+        }
+
+
+integration_event_processor = IntegrationEventProcessor(
+    poll_interval=settings.INTEGRATION_POLL_SECONDS,
+    batch_size=settings.INTEGRATION_BATCH_SIZE,
+    per_tenant_batch=settings.INTEGRATION_PER_TENANT_BATCH,
+    concurrency=settings.INTEGRATION_CONCURRENCY,
+    lease_seconds=settings.INTEGRATION_LEASE_SECONDS,
+    handler_timeout=settings.INTEGRATION_HANDLER_TIMEOUT_SECONDS,
+    max_attempts=settings.INTEGRATION_MAX_ATTEMPTS,
+    backoff_base=settings.INTEGRATION_BACKOFF_BASE_SECONDS,
+    backoff_max=settings.INTEGRATION_BACKOFF_MAX_SECONDS,
+)
+register_metrics("integration_events", integration_event_processor.stats)
+
+
+async def run() -> None:
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+
+    integration_event_processor.load_handlers(settings.INTEGRATION_HANDLER_MODULES)
+    audit_sink.start()
+    integration_event_processor.start()
+    logger.info("Integration event processor started")
+    await stop.wait()
+    await integration_event_processor.stop()
+    await audit_sink.stop()
+    await engine.dispose()
+    logger.info("Integration event processor stopped")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    asyncio.run(run())
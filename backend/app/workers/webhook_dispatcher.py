@@ -0,0 +1,649 @@
+"""
+Delivers queued outbound webhooks from the webhook_outbox table.
+
+Runs inside the API process by default (see WEBHOOK_DISPATCHER_ENABLED), or
+on its own with:
+
+    python -m app.workers.webhook_dispatcher
+"""
+from sqlalchemy import select, update, delete, exists, func, and_, or_, case, bindparam, values, column, true, Integer
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.engine import Row
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+from uuid import UUID
+from datetime import datetime, timedelta, timezone
+import asyncio
+import json
+import logging
+import random
+import signal
+import time
+from urllib.parse import urlsplit
+
+import httpx
+
+from app.core.background import PeriodicTask
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal, engine
+from app.core.http_client import get_http_client, start_http_client, close_http_client
+from app.core.metrics import register_metrics
+from app.core.security import create_webhook_signature
+from app.models.webhook import WebhookOutbox, WebhookSubscription, WebhookTargetHealth
+
+logger = logging.getLogger(__name__)
+
+PURGE_INTERVAL_SECONDS = 3600
+
+# Due rows ranked per host on each claim, as a multiple of the batch size
+CLAIM_WINDOW_FACTOR = 10
+
+# Left at the end of a lease for recording results
+LEASE_MARGIN_SECONDS = 5.0
+
+
+def _host(target_url):
+    """SQL for the host part of a URL, matching ``urlsplit(url).netloc``."""
+    return func.substring(target_url, "://([^/?#]*)")
+
+
+class DeliveryResult(NamedTuple):
+    error: Optional[str]
+    # Whether the target answered; None when no request was made
+    target_ok: Optional[bool]
+    # False when the lease ran too low to send; the claim is handed back
+    sent: bool = True
+
+
+class WebhookDispatcher:
+    """
+    Claims due outbox rows with FOR UPDATE SKIP LOCKED and delivers them.
+
+    A claim commits straight away and pushes the row's next_attempt_at out by
+    the lease time, so deliveries happen outside any transaction and a row
+    whose worker dies is picked up again once the lease runs out. Failed
+    deliveries are retried with exponential backoff and jitter until
+    ``max_attempts`` is reached, after which the row is marked dead.
+
+    Requests go through the shared HTTP client. At most ``concurrency``
+    deliveries are in flight overall and ``per_host_concurrency`` per target
+    host, so one busy receiver cannot take every slot. A claim takes at most
+    ``per_host_concurrency`` rows per host, so rows do not sit out their
+    lease waiting for a host slot. A delivery that could no longer finish
+    within ``request_timeout`` before the lease ends is not sent, and its
+    results are only written while the claim still holds the row, so another
+    worker never delivers the same row at the same time.
+
+    Each target URL has a circuit breaker (webhook_target_health). After
+    ``breaker_threshold`` consecutive failures it opens and deliveries to the
+    target are deferred, without using up attempts, until a single probe
+    delivery gets through.
+
+    Subscriptions with batching enabled get one request per batch whose body
+    is a JSON array of events; the whole batch succeeds or is retried
+    together, refilled with any newer events up to the batch size.
+    """
+
+    def __init__(
+        self,
+        poll_interval: float,
+        batch_size: int,
+        concurrency: int,
+        per_host_concurrency: int,
+        lease_seconds: int,
+        request_timeout: float,
+        breaker_threshold: int,
+        breaker_open_seconds: int,
+        max_attempts: int,
+        backoff_base: float,
+        backoff_max: float,
+        retention_hours: int
+    ):
+        self.batch_size = batch_size
+        self.concurrency = concurrency
+        self.per_host_concurrency = per_host_concurrency
+        self.request_timeout = request_timeout
+        self.lease_seconds = max(lease_seconds, request_timeout + 2 * LEASE_MARGIN_SECONDS)
+        self.breaker_threshold = breaker_threshold
+        self.breaker_open_seconds = breaker_open_seconds
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.retention = timedelta(hours=retention_hours)
+        self._task = PeriodicTask("webhook-dispatcher", poll_interval, self.dispatch)
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._host_semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._stopping = False
+        self._last_purge: Optional[float] = None
+        self.delivered = 0
+        self.failed_attempts = 0
+        self.dead = 0
+        self.deferred = 0
+        self.lease_skips = 0
+        self.breaker_trips = 0
+        self.in_flight = 0
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+        self.requests = 0
+
+    def start(self) -> None:
+        self._stopping = False
+        self._task.start()
+
+    def wake(self) -> None:
+        self._task.wake()
+
+    async def stop(self) -> None:
+        self._stopping = True
+        await self._task.stop()
+
+    async def dispatch(self) -> None:
+        while not self._stopping:
+            # Measured before the claim, so it never outlasts the database's lease
+            lease_ends = time.monotonic() + self.lease_seconds
+            rows = await self._claim()
+            if not rows:
+                break
+            deliveries, deferred = await self._check_targets(self._group(rows))
+            results = await asyncio.gather(*(self._deliver(group, lease_ends) for group in deliveries))
+            await self._record(deliveries, results, deferred)
+
+        if self._stopping:
+            return
+        if self._last_purge is None or time.monotonic() - self._last_purge >= PURGE_INTERVAL_SECONDS:
+            await self._purge()
+
+    async def _claim(self) -> List[Row]:
+        is_due = (
+            WebhookOutbox.status == 'pending',
+            WebhookOutbox.next_attempt_at <= func.now()
+        )
+        # Rank only the oldest due rows, so a claim costs the same however
+        # large the backlog is
+        window = (
+            select(WebhookOutbox.id, WebhookOutbox.next_attempt_at, WebhookSubscription.target_url)
+            .join(WebhookSubscription, WebhookSubscription.id == WebhookOutbox.subscription_id)
+            .where(*is_due)
+            .order_by(WebhookOutbox.next_attempt_at)
+            .limit(self.batch_size * CLAIM_WINDOW_FACTOR)
+            .subquery()
+        )
+        ranked = select(
+            window.c.id,
+            window.c.next_attempt_at,
+            func.row_number().over(
+                partition_by=_host(window.c.target_url),
+                order_by=window.c.next_attempt_at
+            ).label("position")
+        ).subquery()
+        due = (
+            select(WebhookOutbox.id)
+            .where(
+                WebhookOutbox.id.in_(
+                    select(ranked.c.id)
+                    .where(ranked.c.position <= self.per_host_concurrency)
+                    .order_by(ranked.c.next_attempt_at)
+                    .limit(self.batch_size)
+                ),
+                *is_due
+            )
+            .with_for_update(skip_locked=True)
+            .cte("due")
+        )
+        async with AsyncSessionLocal() as session:
+            result = await session.execute(self._claim_statement(due))
+            rows = list(result.all())
+
+            # Batched subscriptions flush when their oldest event is due (claimed
+            # above) or once a full batch is waiting; either way, fill the batch
+            # with the events still inside their wait window
+            batched: Dict[UUID, int] = {}
+            for row in rows:
+                if row.batch_enabled:
+                    batched[row.subscription_id] = batched.get(row.subscription_id, 0) + 1
+            # Count at most one batch per subscription, so the probe reads a
+            # bounded slice of the queue however long the backlog grows
+            queued = (
+                select(WebhookOutbox.id)
+                .where(
+                    WebhookOutbox.subscription_id == WebhookSubscription.id,
+                    WebhookOutbox.status == 'pending',
+                    WebhookOutbox.attempts == 0
+                )
+                .limit(WebhookSubscription.batch_max_size)
+                .lateral("queued")
+            )
+            full = await session.execute(
+                select(WebhookSubscription.id)
+                .join(queued, true())
+                .where(
+                    WebhookSubscription.batch_enabled == True,
+                    # A tripped target's batches wait for its breaker instead
+                    ~exists().where(
+                        WebhookTargetHealth.target_url == WebhookSubscription.target_url,
+                        WebhookTargetHealth.state != 'closed'
+                    )
+                )
+                .group_by(WebhookSubscription.id, WebhookSubscription.batch_max_size)
+                .having(func.count() >= WebhookSubscription.batch_max_size)
+            )
+            for subscription_id in full.scalars():
+                batched.setdefault(subscription_id, 0)
+            if batched:
+                result = await session.execute(self._claim_statement(self._batch_fill(batched)))
+                rows.extend(result.all())
+            await session.commit()
+        return rows
+
+    def _claim_statement(self, claimed):
+        """UPDATE ... RETURNING that leases the outbox rows whose ids ``claimed`` selects."""
+        # Core UPDATE: the ORM form drops the joined subscription columns from RETURNING
+        return (
+            update(WebhookOutbox.__table__)
+            .where(
+                WebhookOutbox.id == claimed.c.id,
+                WebhookSubscription.id == WebhookOutbox.subscription_id
+            )
+            .values(
+                attempts=WebhookOutbox.attempts + 1,
+                next_attempt_at=func.now() + timedelta(seconds=self.lease_seconds)
+            )
+            .returning(
+                WebhookOutbox.id,
+                WebhookOutbox.subscription_id,
+                WebhookOutbox.event_name,
+                WebhookOutbox.payload,
+                WebhookOutbox.attempts,
+                WebhookOutbox.next_attempt_at,
+                WebhookOutbox.created_at,
+                WebhookSubscription.target_url,
+                WebhookSubscription.secret,
+                WebhookSubscription.enabled,
+                WebhookSubscription.batch_enabled,
+                WebhookSubscription.batch_max_size
+            )
+        )
+
+    @staticmethod
+    def _batch_fill(claimed: Dict[UUID, int]):
+        """
+        The rest of each batched subscription's next batch, oldest first:
+        events still inside their wait window and retries that are due, up
+        to batch_max_size less the ``claimed`` rows already taken for it. A
+        failed batch shares one retry time, so it comes back as one batch.
+        """
+        room = values(
+            column("subscription_id", PG_UUID(as_uuid=True)),
+            column("claimed", Integer),
+            name="room"
+        ).data(list(claimed.items()))
+        fillable = (
+            WebhookOutbox.status == 'pending',
+            or_(WebhookOutbox.attempts == 0, WebhookOutbox.next_attempt_at <= func.now())
+        )
+        queued = (
+            select(WebhookOutbox.id)
+            .where(WebhookOutbox.subscription_id == room.c.subscription_id, *fillable)
+            .order_by(WebhookOutbox.created_at)
+            .limit(func.greatest(WebhookSubscription.batch_max_size - room.c.claimed, 0))
+            .lateral("queued")
+        )
+        return (
+            select(WebhookOutbox.id)
+            .where(
+                WebhookOutbox.id.in_(
+                    select(queued.c.id)
+                    .select_from(room)
+                    .join(WebhookSubscription, WebhookSubscription.id == room.c.subscription_id)
+                    .join(queued, true())
+                ),
+                *fillable
+            )
+            .with_for_update(skip_locked=True)
+            .cte("fill")
+        )
+
+    @staticmethod
+    def _group(rows: Sequence[Row]) -> List[List[Row]]:
+        """One delivery per row, or per batch_max_size rows for batched subscriptions."""
+        deliveries: List[List[Row]] = []
+        batches: Dict[UUID, List[Row]] = {}
+        for row in sorted(rows, key=lambda row: row.created_at):
+            if row.batch_enabled:
+                batches.setdefault(row.subscription_id, []).append(row)
+            else:
+                deliveries.append([row])
+        for batch in batches.values():
+            size = batch[0].batch_max_size
+            deliveries.extend(batch[i:i + size] for i in range(0, len(batch), size))
+        return deliveries
+
+    async def _check_targets(
+        self,
+        deliveries: List[List[Row]]
+    ) -> Tuple[List[List[Row]], List[Tuple[List[Row], datetime]]]:
+        """
+        Split deliveries into those to send now and those to defer because
+        their target's breaker is open. Once an open target's cool-down is
+        over, the one dispatcher that moves it to half_open sends a single
+        probe delivery and defers the rest.
+        """
+        urls = {group[0].target_url for group in deliveries}
+        now = datetime.now(timezone.utc)
+        hold_until: Dict[str, datetime] = {}
+        probes = set()
+        async with AsyncSessionLocal() as session:
+            result = await session.execute(
+                select(WebhookTargetHealth.target_url, WebhookTargetHealth.retry_at).where(
+                    WebhookTargetHealth.target_url.in_(urls),
+                    WebhookTargetHealth.state != 'closed'
+                )
+            )
+            for url, retry_at in result.all():
+                if retry_at > now:
+                    hold_until[url] = retry_at
+                    continue
+                probe_lease = now + timedelta(seconds=self.lease_seconds)
+                won = await session.execute(
+                    update(WebhookTargetHealth)
+                    .where(
+                        WebhookTargetHealth.target_url == url,
+                        WebhookTargetHealth.state != 'closed',
+                        WebhookTargetHealth.retry_at <= now
+                    )
+                    .values(state='half_open', retry_at=probe_lease)
+                    .returning(WebhookTargetHealth.target_url)
+                )
+                if won.first() is not None:
+                    probes.add(url)
+                hold_until[url] = probe_lease
+            await session.commit()
+
+        send, deferred = [], []
+        for group in deliveries:
+            url = group[0].target_url
+            if url not in hold_until or not group[0].enabled:
+                send.append(group)
+            elif url in probes:
+                probes.discard(url)
+                send.append(group)
+            else:
+                deferred.append((group, hold_until[url]))
+        return send, deferred
+
+    async def _deliver(self, rows: List[Row], lease_ends: float) -> DeliveryResult:
+        """Send one delivery of one row, or of a batch of rows."""
+        row = rows[0]
+        if not row.enabled:
+            return DeliveryResult("Subscription disabled", None)
+
+        if row.batch_enabled:
+            body = json.dumps([
+                {
+                    "id": str(item.id),
+                    "event_name": item.event_name,
+                    "attempt": item.attempts,
+                    "payload": item.payload,
+                }
+                for item in rows
+            ]).encode()
+            headers = {"X-Webhook-Batch-Size": str(len(rows))}
+        else:
+            body = json.dumps(row.payload).encode()
+            headers = {
+                "X-Event-Name": row.event_name,
+                "X-Webhook-Id": str(row.id),
+                "X-Webhook-Attempt": str(row.attempts),
+            }
+        headers["Content-Type"] = "application/json"
+        # Signed over the exact bytes sent
+        headers["X-Webhook-Signature"] = create_webhook_signature(body, row.secret)
+
+        host = urlsplit(row.target_url).netloc
+        host_semaphore = self._host_semaphores.get(host)
+        if host_semaphore is None:
+            host_semaphore = self._host_semaphores[host] = asyncio.Semaphore(self.per_host_concurrency)
+
+        async with self._semaphore, host_semaphore:
+            if time.monotonic() + self.request_timeout > lease_ends - LEASE_MARGIN_SECONDS:
+                return DeliveryResult(None, None, sent=False)
+            self.in_flight += 1
+            started = time.perf_counter()
+            try:
+                # The client's timeouts apply per phase; this bounds the whole request
+                response = await asyncio.wait_for(
+                    get_http_client().post(row.target_url, content=body, headers=headers),
+                    timeout=self.request_timeout
+                )
+            except asyncio.TimeoutError:
+                return DeliveryResult(f"Timed out after {self.request_timeout:g}s", False)
+            except httpx.HTTPError as e:
+                return DeliveryResult(f"{type(e).__name__}: {e}"[:1000], False)
+            finally:
+                self.in_flight -= 1
+                self._record_latency(time.perf_counter() - started)
+        if response.is_error:
+            # Other 4xx answers mean the target is up but rejected this request
+            target_ok = response.status_code < 500 and response.status_code != 429
+            return DeliveryResult(f"HTTP {response.status_code}", target_ok)
+        return DeliveryResult(None, True)
+
+    async def _record(
+        self,
+        deliveries: List[List[Row]],
+        results: List[DeliveryResult],
+        deferred: List[Tuple[List[Row], datetime]]
+    ) -> None:
+        now = datetime.now(timezone.utc)
+        values = []
+        for rows, until in deferred:
+            # Not attempted: hand back the attempt the claim took
+            for row in rows:
+                self.deferred += 1
+                values.append((row, {"attempts": row.attempts - 1, "next_attempt_at": until}))
+
+        target_failures: Dict[str, Tuple[int, str]] = {}
+        target_ok = set()
+        for rows, (error, ok, sent) in zip(deliveries, results):
+            if not sent:
+                for row in rows:
+                    self.lease_skips += 1
+                    values.append((row, {"attempts": row.attempts - 1, "next_attempt_at": now}))
+                continue
+            url = rows[0].target_url
+            if ok:
+                target_ok.add(url)
+            elif ok is False:
+                failures, _ = target_failures.get(url, (0, error))
+                target_failures[url] = (failures + 1, error)
+
+            # One retry time per delivery so a failed batch is retried together
+            retry_at = now + timedelta(seconds=self._backoff(max(row.attempts for row in rows)))
+            for row in rows:
+                if error is None:
+                    self.delivered += 1
+                    values.append((row, {"status": "delivered", "delivered_at": now, "last_error": None}))
+                elif not row.enabled or row.attempts >= self.max_attempts:
+                    self.dead += 1
+                    values.append((row, {"status": "dead", "last_error": error}))
+                    logger.warning(f"Webhook {row.id} to {row.target_url} is dead after {row.attempts} attempts: {error}")
+                else:
+                    self.failed_attempts += 1
+                    values.append((row, {"next_attempt_at": retry_at, "last_error": error}))
+
+        async with AsyncSessionLocal() as session:
+            await self._write_results(session, values)
+            await self._record_target_health(session, now, target_ok, {
+                url: failure for url, failure in target_failures.items() if url not in target_ok
+            })
+            await session.commit()
+
+    @staticmethod
+    async def _write_results(session, values: List[Tuple[Row, dict]]) -> None:
+        """
+        Update each claimed row only while this worker's lease still holds it:
+        same attempt count and lease time as the claim returned. A row whose
+        lease ran out and was claimed again is left to its new owner.
+        """
+        outbox = WebhookOutbox.__table__
+        by_columns: Dict[Tuple[str, ...], List[dict]] = {}
+        for row, changes in values:
+            by_columns.setdefault(tuple(changes), []).append({
+                **{f"new_{column}": value for column, value in changes.items()},
+                "claimed_id": row.id,
+                "claimed_attempts": row.attempts,
+                "claimed_lease": row.next_attempt_at,
+            })
+        for columns, params in by_columns.items():
+            stmt = (
+                update(outbox)
+                .where(
+                    outbox.c.id == bindparam("claimed_id"),
+                    outbox.c.status == 'pending',
+                    outbox.c.attempts == bindparam("claimed_attempts"),
+                    outbox.c.next_attempt_at == bindparam("claimed_lease")
+                )
+                .values({column: bindparam(f"new_{column}") for column in columns})
+            )
+            await session.execute(stmt, params)
+
+    async def _record_target_health(
+        self,
+        session,
+        now: datetime,
+        healthy: set,
+        failing: Dict[str, Tuple[int, str]]
+    ) -> None:
+        """Close the breaker of targets that answered; count failures against the rest."""
+        if healthy:
+            # Matches nothing, and writes nothing, for targets already healthy
+            await session.execute(
+                update(WebhookTargetHealth)
+                .where(
+                    WebhookTargetHealth.target_url.in_(healthy),
+                    or_(
+                        WebhookTargetHealth.state != 'closed',
+                        WebhookTargetHealth.consecutive_failures > 0
+                    )
+                )
+                .values(state='closed', consecutive_failures=0, retry_at=None, last_success_at=now)
+            )
+        if not failing:
+            return
+
+        reopen_at = now + timedelta(seconds=self.breaker_open_seconds)
+        stmt = pg_insert(WebhookTargetHealth).values([
+            {
+                "target_url": url,
+                "state": "open" if failures >= self.breaker_threshold else "closed",
+                "consecutive_failures": failures,
+                "retry_at": reopen_at if failures >= self.breaker_threshold else None,
+                "opened_at": now if failures >= self.breaker_threshold else None,
+                "last_error": error,
+                "last_failure_at": now,
+            }
+            for url, (failures, error) in failing.items()
+        ])
+        health = WebhookTargetHealth.__table__.c
+        # A failed probe re-opens straight away; an open target stays as it is
+        trips = or_(
+            health.state == 'half_open',
+            and_(
+                health.state == 'closed',
+                health.consecutive_failures + stmt.excluded.consecutive_failures >= self.breaker_threshold
+            )
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[health.target_url],
+            set_={
+                "consecutive_failures": health.consecutive_failures + stmt.excluded.consecutive_failures,
+                "state": case((trips, 'open'), else_=health.state),
+                "retry_at": case((trips, reopen_at), else_=health.retry_at),
+                "opened_at": case((trips, now), else_=health.opened_at),
+                "last_error": stmt.excluded.last_error,
+                "last_failure_at": stmt.excluded.last_failure_at,
+            }
+        ).returning(health.target_url, health.consecutive_failures, health.opened_at)
+        result = await session.execute(stmt)
+        for url, failures, opened_at in result.all():
+            if opened_at == now:
+                self.breaker_trips += 1
+                logger.warning(f"Webhook target {url} tripped after {failures} consecutive failures")
+
+    def _record_latency(self, elapsed: float) -> None:
+        self.requests += 1
+        self.total_latency += elapsed
+        if elapsed > self.max_latency:
+            self.max_latency = elapsed
+
+    def _backoff(self, attempts: int) -> float:
+        delay = min(self.backoff_base * 2 ** (attempts - 1), self.backoff_max)
+        return delay * random.uniform(0.5, 1.0)
+
+    async def _purge(self) -> None:
+        """Drop delivered rows past the retention window; dead rows are kept."""
+        self._last_purge = time.monotonic()
+        async with AsyncSessionLocal() as session:
+            await session.execute(
+                delete(WebhookOutbox).where(
+                    WebhookOutbox.status == 'delivered',
+                    WebhookOutbox.delivered_at < datetime.now(timezone.utc) - self.retention
+                )
+            )
+            await session.commit()
+
+    def stats(self) -> dict:
+        return {
+            "running": self._task.running,
+            "delivered": self.delivered,
+            "failed_attempts": self.failed_attempts,
+            "dead": self.dead,
+            "deferred": self.deferred,
+            "lease_skips": self.lease_skips,
+            "breaker_trips": self.breaker_trips,
+            "in_flight": self.in_flight,
+            "requests": self.requests,
+            "avg_latency_ms": round(self.total_latency / self.requests * 1000, 3) if self.requests else 0.0,
+            "max_latency_ms": round(self.max_latency * 1000, 3),
+        }
+
+
+webhook_dispatcher = WebhookDispatcher(
+    poll_interval=settings.WEBHOOK_DISPATCH_POLL_SECONDS,
+    batch_size=settings.WEBHOOK_DISPATCH_BATCH_SIZE,
+    concurrency=settings.WEBHOOK_DISPATCH_CONCURRENCY,
+    per_host_concurrency=settings.WEBHOOK_PER_HOST_CONCURRENCY,
+    lease_seconds=settings.WEBHOOK_DISPATCH_LEASE_SECONDS,
+    request_timeout=settings.HTTP_CLIENT_TIMEOUT_SECONDS,
+    breaker_threshold=settings.WEBHOOK_BREAKER_FAILURE_THRESHOLD,
+    breaker_open_seconds=settings.WEBHOOK_BREAKER_OPEN_SECONDS,
+    max_attempts=settings.WEBHOOK_MAX_ATTEMPTS,
+    backoff_base=settings.WEBHOOK_BACKOFF_BASE_SECONDS,
+    backoff_max=settings.WEBHOOK_BACKOFF_MAX_SECONDS,
+    retention_hours=settings.WEBHOOK_OUTBOX_RETENTION_HOURS,
+)
+register_metrics("webhook_dispatcher", webhook_dispatcher.stats)
+
+
+async def run() -> None:
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+
+    await start_http_client()
+    webhook_dispatcher.start()
+    logger.info("Webhook dispatcher started")
+    await stop.wait()
+    await webhook_dispatcher.stop()
+    await close_http_client()
+    await engine.dispose()
+    logger.info("Webhook dispatcher stopped")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    asyncio.run(run())
@@ -0,0 +1,125 @@
+"""
+Benchmark contact search against a large tenant.
+
+Seeds a throwaway tenant with synthetic contacts (1M by default), then times
+the legacy ILIKE filter and both indexed search modes of ContactRepository.
+
+    cd backend
+    python -m scripts.benchmark_contact_search --contacts 1000000 --runs 20
+
+Run it against a scratch database that has been migrated to head; the seeded
+tenant and its contacts are removed at the end unless --keep is given.
+"""
+import argparse
+import asyncio
+import statistics
+import time
+import uuid
+
+from sqlalchemy import delete, or_, select, text
+
+from app.core.database import AsyncSessionLocal, engine
+from app.models.contact import Contact
+from app.models.tenant import Tenant
+from app.repositories.contact_repository import ContactRepository
+
+SEARCH_TERMS = ["john", "smith", "acme", "jo smi", "user12345", "user12345@example.com", "smiht", "555-01"]
+
+
+async def seed(tenant_id: uuid.UUID, count: int) -> None:
+    async with AsyncSessionLocal() as session:
+        session.add(Tenant(id=tenant_id, name="Search benchmark", slug=f"search-benchmark-{tenant_id}"))
+        await session.flush()
+        await session.execute(
+            text(
+                """
+                INSERT INTO contacts (
+                    id, tenant_id, first_name, last_name, email, phone, company, tags, created_at, updated_at
+                )
+                SELECT
+                    gen_random_uuid(),
+                    :tenant_id,
+                    (ARRAY['John', 'Jane', 'Joseph', 'Maria', 'Wei', 'Amit'])[1 + n % 6],
+                    (ARRAY['Smith', 'Johnson', 'Garcia', 'Chen', 'Patel', 'Brown'])[1 + (n / 6) % 6] || (n % 997),
+                    'user' || n || '@example.com',
+                    '555-' || lpad((n % 10000)::text, 4, '0'),
+                    (ARRAY['Acme', 'Globex', 'Initech', 'Umbrella', 'Hooli'])[1 + n % 5] || ' ' || (n % 211),
+                    '[]'::jsonb,
+                    now() - n * interval '1 second',
+                    now() - n * interval '1 second'
+                FROM generate_series(1, :count) AS n
+                """
+            ),
+            {"tenant_id": tenant_id, "count": count},
+        )
+        await session.commit()
+        # ANALYZE is transactional; without the commit its statistics are rolled back
+        await session.execute(text("ANALYZE contacts"))
+        await session.commit()
+
+
+async def legacy_search(session, tenant_id: uuid.UUID, term: str) -> None:
+    """The pre-index filter: ILIKEs over first and last name, email and phone."""
+    pattern = f"%{term}%"
+    stmt = (
+        select(Contact)
+        .where(Contact.tenant_id == tenant_id)
+        .where(or_(
+            Contact.first_name.ilike(pattern),
+            Contact.last_name.ilike(pattern),
+            Contact.email.ilike(pattern),
+            Contact.phone.ilike(pattern),
+        ))
+        .order_by(Contact.created_at.desc())
+        .limit(20)
+    )
+    await session.execute(stmt)
+
+
+async def time_runs(label: str, runs: int, func) -> None:
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        await func()
+        timings.append((time.perf_counter() - started) * 1000)
+    timings.sort()
+    p95 = timings[min(len(timings) - 1, int(len(timings) * 0.95))]
+    print(f"{label:<36} p50 {statistics.median(timings):8.1f} ms   p95 {p95:8.1f} ms")
+
+
+async def main(count: int, runs: int, keep: bool) -> None:
+    tenant_id = uuid.uuid4()
+    print(f"Seeding {count} contacts for tenant {tenant_id}...")
+    await seed(tenant_id, count)
+
+    try:
+        async with AsyncSessionLocal() as session:
+            repository = ContactRepository(session, tenant_id)
+            for term in SEARCH_TERMS:
+                print(f"\nsearch={term!r}")
+                await time_runs("legacy ILIKE", runs, lambda: legacy_search(session, tenant_id, term))
+                await time_runs("contains", runs, lambda: repository.list(
+                    search=term, count_mode="none"
+                ))
+                await time_runs("contains + exact count", runs, lambda: repository.list(
+                    search=term, count_mode="exact"
+                ))
+                await time_runs("ranked", runs, lambda: repository.list(
+                    search=term, search_mode="ranked", count_mode="none"
+                ))
+    finally:
+        if not keep:
+            async with AsyncSessionLocal() as session:
+                await session.execute(delete(Contact).where(Contact.tenant_id == tenant_id))
+                await session.execute(delete(Tenant).where(Tenant.id == tenant_id))
+                await session.commit()
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--contacts", type=int, default=1_000_000)
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--keep", action="store_true", help="keep the seeded tenant")
+    args = parser.parse_args()
+    asyncio.run(main(args.contacts, args.runs, args.keep))
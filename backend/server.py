@@ -1,13 +1,23 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Header, HTTPException, status
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
+from typing import Optional
+import hmac
 import logging
 
 from app.core.config import settings
 from app.core.middleware import RequestContextMiddleware
 from app.core.database import engine
+from app.core.firebase_auth import get_token_verifier
+from app.core.http_client import start_http_client, close_http_client
+from app.core.metrics import collect_metrics
+from app.services.login_tracker import login_tracker
+from app.services.inbound_event_buffer import inbound_event_buffer
+from app.services.audit_sink import audit_sink
+from app.workers.integration_events import integration_event_processor
+from app.workers.webhook_dispatcher import webhook_dispatcher
 
-from app.routers import auth, contacts, webhooks, audit
+from app.routers import auth, contacts, webhooks, audit, roles
 
 logging.basicConfig(
     level=logging.INFO,
@@ -18,8 +28,26 @@ logger = logging.getLogger(__name__)
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     logger.info("Application startup")
+    await get_token_verifier().start()
+    login_tracker.start()
+    inbound_event_buffer.start()
+    audit_sink.start()
+    await start_http_client()
+    if settings.WEBHOOK_DISPATCHER_ENABLED:
+        webhook_dispatcher.start()
+    if settings.INTEGRATION_WORKER_ENABLED:
+        integration_event_processor.load_handlers(settings.INTEGRATION_HANDLER_MODULES)
+        integration_event_processor.start()
     yield
     logger.info("Application shutdown")
+    await get_token_verifier().stop()
+    await login_tracker.stop()
+    await inbound_event_buffer.stop()
+    await integration_event_processor.stop()
+    # After everything that can still write audit records
+    await audit_sink.stop()
+    await webhook_dispatcher.stop()
+    await close_http_client()
     await engine.dispose()
 
 app = FastAPI(
@@ -43,11 +71,21 @@ app.include_router(auth.router, prefix="/api")
 app.include_router(contacts.router, prefix="/api")
 app.include_router(webhooks.router, prefix="/api")
 app.include_router(audit.router, prefix="/api")
+app.include_router(roles.router, prefix="/api")
 
 @app.get("/api/health")
 async def health_check():
     return {"status": "healthy", "service": "crm-platform"}
 
+@app.get("/api/health/metrics")
+async def health_metrics(x_metrics_key: Optional[str] = Header(None)):
+    """Process-wide internals, for monitoring only: off unless METRICS_API_KEY is set."""
+    if not settings.METRICS_API_KEY:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+    if not x_metrics_key or not hmac.compare_digest(x_metrics_key, settings.METRICS_API_KEY):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid metrics key")
+    return collect_metrics()
+
 @app.get("/api/")
 async def root():
     return {"message": "CRM Platform API - Production Ready"}
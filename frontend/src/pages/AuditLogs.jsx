@@ -27,7 +27,7 @@ const AuditLogs = () => {
 
   const fetchLogs = async () => {
     try {
-      const response = await fetch(`${API_URL}/api/audit/logs`, {
+      const response = await fetch(`${API_URL}/api/audit/logs?count=none`, {
         credentials: 'include'
       });
       if (response.ok) {
@@ -97,12 +97,14 @@ const ContactsList = () => {
       const headers = { 'Content-Type': 'application/json' };
       if (token) headers['Authorization'] = `Bearer ${token}`;
       
-      const response = await fetch(`${API_URL}/api/contacts?page=${page + 1}&page_size=${pageSize}${globalSearch ? '&search=' + globalSearch : ''}`, { headers, credentials: 'include' });
+      // Only the first page pays for an exact count; later pages keep the known total
+      const countMode = page === 0 ? 'exact' : 'none';
+      const response = await fetch(`${API_URL}/api/contacts?page=${page + 1}&page_size=${pageSize}&count=${countMode}${globalSearch ? '&search=' + globalSearch : ''}`, { headers, credentials: 'include' });
       
       if (response.ok) {
         const data = await response.json();
         setContacts(data.contacts || []);
-        setTotal(data.total || 0);
+        if (data.total !== null && data.total !== undefined) setTotal(data.total);
         setIsDemoMode(false);
       } else if (response.status === 401) {
         setIsDemoMode(true);
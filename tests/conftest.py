@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# The application package lives in backend/
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "backend"))
@@ -0,0 +1,73 @@
+"""
+Offline checks of Firebase ID token verification, with tokens signed by a
+locally generated key served through StaticKeySource.
+"""
+import asyncio
+import time
+
+import jwt
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+from app.core.token_verifier import FirebaseTokenVerifier, StaticKeySource
+
+PROJECT_ID = "test-project"
+KID = "test-key"
+
+
+@pytest.fixture(scope="module")
+def private_key():
+    return rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+
+@pytest.fixture
+def verifier(private_key):
+    public_pem = private_key.public_key().public_bytes(
+        serialization.Encoding.PEM,
+        serialization.PublicFormat.SubjectPublicKeyInfo
+    ).decode()
+    return FirebaseTokenVerifier(PROJECT_ID, key_source=StaticKeySource({KID: public_pem}))
+
+
+def _sign(private_key, kid=KID, **overrides):
+    now = int(time.time())
+    claims = {
+        "iss": f"https://securetoken.google.com/{PROJECT_ID}",
+        "aud": PROJECT_ID,
+        "sub": "firebase-uid-1",
+        "iat": now,
+        "exp": now + 3600,
+        "auth_time": now,
+        **overrides
+    }
+    return jwt.encode(claims, private_key, algorithm="RS256", headers={"kid": kid})
+
+
+def test_verify_returns_claims_with_uid(verifier, private_key):
+    claims = asyncio.run(verifier.verify(_sign(private_key)))
+    assert claims["uid"] == "firebase-uid-1"
+    assert claims["aud"] == PROJECT_ID
+
+
+def test_expired_token_is_rejected(verifier, private_key):
+    now = int(time.time())
+    token = _sign(private_key, iat=now - 7200, exp=now - 3600, auth_time=now - 7200)
+    with pytest.raises(ValueError, match="expired"):
+        asyncio.run(verifier.verify(token))
+
+
+def test_other_audience_is_rejected(verifier, private_key):
+    with pytest.raises(ValueError, match="Invalid token"):
+        asyncio.run(verifier.verify(_sign(private_key, aud="another-project")))
+
+
+def test_unknown_kid_is_rejected(verifier, private_key):
+    with pytest.raises(ValueError, match="unknown signing key"):
+        asyncio.run(verifier.verify(_sign(private_key, kid="rotated-away")))
+
+
+def test_token_signed_by_another_key_is_rejected(verifier):
+    other_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    with pytest.raises(ValueError, match="Invalid token"):
+        asyncio.run(verifier.verify(_sign(other_key)))